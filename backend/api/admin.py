@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Interview, InterviewQuestion, InterviewResponse, Job, PersonalityProfile
+from .models import Interview, InterviewQuestion, InterviewResponse, Job, PersonalityProfile, UserInterviewStats
 
 
 @admin.register(Job)
@@ -38,3 +38,8 @@ class InterviewQuestionAdmin(admin.ModelAdmin):
 class InterviewResponseAdmin(admin.ModelAdmin):
     list_display = ("id", "question", "created_at")
 
+
+@admin.register(UserInterviewStats)
+class UserInterviewStatsAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "interview_count", "duration_count", "updated_at")
+    search_fields = ("user__username", "user__email")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.job_ingest import HTML_PARSER, _extract_text, extract_job_text
+
+
+class Command(BaseCommand):
+    help = (
+        "Time job-description extraction over a directory of saved job pages (*.html): the old "
+        "html.parser DOM walk versus the JSON-LD fast path with the faster parser fallback."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("corpus", help="Directory containing saved job posting pages (*.html, *.htm).")
+        parser.add_argument("--repeat", type=int, default=5, help="Passes over the corpus per strategy.")
+        parser.add_argument("--max-chars", type=int, default=20000)
+
+    def handle(self, *args, corpus: str, repeat: int, max_chars: int, **options):
+        files = sorted(p for p in Path(corpus).glob("**/*") if p.suffix.lower() in {".html", ".htm"})
+        if not files:
+            raise CommandError(f"No .html files found under {corpus}.")
+        pages = [p.read_text(encoding="utf-8", errors="replace") for p in files]
+
+        strategies = {
+            "baseline (html.parser DOM)": lambda html: _extract_text(html, max_chars=max_chars, parser="html.parser"),
+            f"current (JSON-LD, else {HTML_PARSER})": lambda html: extract_job_text(html, max_chars=max_chars),
+        }
+        timings = {}
+        for name, extract in strategies.items():
+            started = time.perf_counter()
+            for _ in range(max(repeat, 1)):
+                for html in pages:
+                    extract(html)
+            timings[name] = (time.perf_counter() - started) / (max(repeat, 1) * len(pages))
+
+        total_bytes = sum(len(html.encode("utf-8")) for html in pages)
+        self.stdout.write(f"{len(pages)} pages, {total_bytes / 1024:.0f} KiB, {repeat} passes each")
+        baseline = next(iter(timings.values()))
+        for name, per_page in timings.items():
+            self.stdout.write(f"  {name:<40} {per_page * 1000:8.2f} ms/page  x{baseline / per_page:5.1f}")
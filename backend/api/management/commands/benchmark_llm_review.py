@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections import Counter
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from api.models import Interview
+from api.services import ai
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare latency and LLM token usage of the split feedback + archetype calls against the "
+        "single combined review call, over recently analysed interviews. Bypasses the LLM cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interviews", type=int, default=5, help="Most recent analysed interviews to use.")
+        parser.add_argument("--repeat", type=int, default=1, help="Runs per interview and mode.")
+
+    def handle(self, *args, interviews: int, repeat: int, **options):
+        if not ai._configured_providers():
+            raise CommandError("Configure an LLM provider (LLM_PROVIDERS plus its API key) to benchmark.")
+        samples = list(
+            Interview.objects.exclude(transcript_text="")
+            .order_by("-updated_at")
+            .values_list("transcript_text", "analysis_text")[: max(interviews, 1)]
+        )
+        if not samples:
+            raise CommandError("No interviews with a transcript to benchmark against.")
+
+        modes = {
+            # Same fan-out as interview_finalize: both calls in flight at once.
+            "split": (
+                ("feedback", "archetype"),
+                lambda transcript, analysis: ai.gather_llm_calls(
+                    {
+                        "feedback": lambda: ai.generate_interview_feedback(transcript=transcript, analysis=analysis),
+                        "archetype": lambda: ai.classify_archetype(transcript=transcript, analysis=analysis),
+                    },
+                    fallbacks={},
+                ),
+            ),
+            "combined": (
+                ("review",),
+                lambda transcript, analysis: ai.gather_llm_calls(
+                    {"review": lambda: ai.review_interview(transcript=transcript, analysis=analysis)},
+                    fallbacks={},
+                ),
+            ),
+        }
+
+        runs = len(samples) * max(repeat, 1)
+        self.stdout.write(f"{len(samples)} interview(s) x {max(repeat, 1)} run(s) per mode")
+        with override_settings(LLM_CACHE_FUNCTIONS=set()):
+            for name, (sites, run) in modes.items():
+                before = Counter(ai.TOKEN_USAGE)
+                failures_before = sum(ai.STRUCTURED_OUTCOMES[(site, "failed")] for site in sites)
+                latencies = []
+                for _ in range(max(repeat, 1)):
+                    for transcript, analysis in samples:
+                        started = time.perf_counter()
+                        run(transcript, analysis)
+                        latencies.append(time.perf_counter() - started)
+
+                used = Counter(ai.TOKEN_USAGE)
+                used.subtract(before)
+                per_run = {
+                    metric: sum(used[(site, metric)] for site in sites) / runs
+                    for metric in ("calls", "prompt_tokens", "output_tokens")
+                }
+                failures = sum(ai.STRUCTURED_OUTCOMES[(site, "failed")] for site in sites) - failures_before
+                self.stdout.write(
+                    f"  {name:<9} p50 {statistics.median(latencies) * 1000:7.0f} ms  "
+                    f"max {max(latencies) * 1000:7.0f} ms  "
+                    f"{per_run['calls']:.1f} call(s)  "
+                    f"{per_run['prompt_tokens']:7.0f} in / {per_run['output_tokens']:5.0f} out tokens per interview  "
+                    f"{failures} unusable repl(ies)"
+                )
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from api.services.stats import rebuild_user_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-user interview statistics rollups from the interview tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", action="append", default=[], help="Username to rebuild (repeatable). Default: all users.")
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.all()
+        if options["user"]:
+            users = users.filter(username__in=options["user"])
+
+        rebuilt = 0
+        for user_id in users.values_list("id", flat=True).iterator():
+            rebuild_user_stats(user_id=user_id)
+            rebuilt += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt interview stats for {rebuilt} user(s)."))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections import Counter
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.models import Interview
+from api.services import question_bank
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the question-bank similarity index, optionally backfilling the bank from questions "
+        "already generated by the LLM for past interviews."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Bank LLM-generated questions stored on existing interviews before rebuilding.",
+        )
+        parser.add_argument("--title", help="Probe: show what the bank would serve for this job title.")
+        parser.add_argument("--company", default="")
+        parser.add_argument("--description", default="")
+
+    def handle(self, *args, **options):
+        if options["backfill"]:
+            added = 0
+            interviews = Interview.objects.select_related("job", "job__page").exclude(generated_questions=[])
+            for interview in interviews.iterator():
+                # Only the LLM path fills in why_this_matters; stub and general lists are skipped.
+                questions = [
+                    q
+                    for q in interview.generated_questions or []
+                    if isinstance(q, dict) and str(q.get("why_this_matters", "")).strip()
+                ]
+                if not questions:
+                    continue
+                job = interview.job
+                added += question_bank.add_questions(
+                    questions,
+                    title=job.title if job else None,
+                    company=job.company if job else None,
+                    description=job.description_text if job else None,
+                )
+            self.stdout.write(f"Backfilled {added} question(s).")
+
+        started = time.perf_counter()
+        index = question_bank.get_index(force=True)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        competencies = Counter(doc.competency for doc in index.documents)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {len(index.documents)} question(s), {len(index.idf)} term(s), "
+                f"{len(competencies)} competenc(ies) in {elapsed_ms:.1f} ms."
+            )
+        )
+
+        if options["title"]:
+            started = time.perf_counter()
+            questions = question_bank.retrieve(
+                title=options["title"], company=options["company"], description=options["description"]
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if questions is None:
+                self.stdout.write(f"No confident match ({elapsed_ms:.1f} ms); the LLM would be called.")
+                return
+            self.stdout.write(f"Served from the bank in {elapsed_ms:.1f} ms:")
+            for q in questions:
+                self.stdout.write(f"  [{q['competency']}] {q['prompt']}")
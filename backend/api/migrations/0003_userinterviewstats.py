@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("api", "0002_interview_generated_questions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserInterviewStats",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("interview_count", models.PositiveIntegerField(default=0)),
+                ("duration_ms_sum", models.BigIntegerField(default=0)),
+                ("duration_count", models.PositiveIntegerField(default=0)),
+                ("competency_counts", models.JSONField(blank=True, default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="interview_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
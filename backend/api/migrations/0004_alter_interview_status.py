@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0003_userinterviewstats"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="interview",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("created", "Created"),
+                    ("generating", "Generating Questions"),
+                    ("questions_ready", "Questions Ready"),
+                    ("uploaded", "Uploaded"),
+                    ("processing", "Processing"),
+                    ("complete", "Complete"),
+                    ("failed", "Failed"),
+                ],
+                default="created",
+                max_length=32,
+            ),
+        ),
+    ]
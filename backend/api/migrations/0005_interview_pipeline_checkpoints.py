@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_alter_interview_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="interview",
+            name="pipeline_object_key",
+            field=models.CharField(blank=True, max_length=1024),
+        ),
+        migrations.AddField(
+            model_name="interview",
+            name="twelvelabs_asset_id",
+            field=models.CharField(blank=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name="interview",
+            name="twelvelabs_indexed_asset_id",
+            field=models.CharField(blank=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name="interview",
+            name="twelvelabs_video_id",
+            field=models.CharField(blank=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name="interview",
+            name="analysis_text",
+            field=models.TextField(blank=True),
+        ),
+    ]
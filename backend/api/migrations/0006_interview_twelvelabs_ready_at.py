@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0005_interview_pipeline_checkpoints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="interview",
+            name="twelvelabs_asset_ready_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="interview",
+            name="twelvelabs_indexed_ready_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
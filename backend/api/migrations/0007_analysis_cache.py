@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0006_interview_twelvelabs_ready_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="interview",
+            name="video_sha256",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.CreateModel(
+            name="AnalysisCacheEntry",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("content_sha256", models.CharField(max_length=64)),
+                ("prompt_sha256", models.CharField(max_length=64)),
+                ("video_id", models.CharField(max_length=128)),
+                ("transcript_text", models.TextField(blank=True)),
+                ("analysis_text", models.TextField(blank=True)),
+                ("hits", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("last_used_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [models.Index(fields=["last_used_at"], name="api_analysi_last_us_3e83c0_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("content_sha256", "prompt_sha256"), name="uniq_analysis_cache_key")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0007_analysis_cache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("open", "Open"), ("complete", "Complete")], default="open", max_length=16
+                    ),
+                ),
+                ("content_type", models.CharField(blank=True, max_length=128)),
+                ("total_size", models.BigIntegerField()),
+                ("chunk_size", models.PositiveIntegerField()),
+                ("received_chunks", models.JSONField(blank=True, default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "interview",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to="api.interview",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0008_uploadsession"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecordingStream",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("open", "Open"), ("complete", "Complete")], default="open", max_length=16
+                    ),
+                ),
+                ("object_key", models.CharField(max_length=512)),
+                ("mime_type", models.CharField(blank=True, max_length=128)),
+                ("next_segment", models.PositiveIntegerField(default=0)),
+                ("pending_segments", models.JSONField(blank=True, default=list)),
+                ("final_segment", models.PositiveIntegerField(blank=True, null=True)),
+                ("size_bytes", models.BigIntegerField(default=0)),
+                ("sha256", models.CharField(blank=True, max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "interview",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recording_streams",
+                        to="api.interview",
+                    ),
+                ),
+            ],
+        ),
+    ]
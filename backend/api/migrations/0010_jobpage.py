@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0009_recordingstream"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobPage",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("url_sha256", models.CharField(max_length=64, unique=True)),
+                ("url", models.TextField()),
+                ("description", models.TextField(blank=True)),
+                ("etag", models.CharField(blank=True, max_length=255)),
+                ("last_modified", models.CharField(blank=True, max_length=64)),
+                ("fetched_at", models.DateTimeField()),
+                ("validated_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="page",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="jobs",
+                to="api.jobpage",
+            ),
+        ),
+    ]
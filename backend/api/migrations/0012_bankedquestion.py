@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0011_jobimport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BankedQuestion",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("prompt_sha256", models.CharField(max_length=64, unique=True)),
+                ("prompt", models.TextField()),
+                ("competency", models.CharField(db_index=True, max_length=128)),
+                ("why_this_matters", models.TextField(blank=True)),
+                ("good_signals", models.JSONField(blank=True, default=list)),
+                ("red_flags", models.JSONField(blank=True, default=list)),
+                ("source_title", models.CharField(blank=True, max_length=255)),
+                ("source_company", models.CharField(blank=True, max_length=255)),
+                ("source_excerpt", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from django.db import migrations
+from django.db.models import Count, FloatField, Q, Sum
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+
+_HAS_DURATION = Q(duration_ms__regex=r"^-?[0-9]+(\.[0-9]+)?$")
+
+
+def backfill(apps, schema_editor):
+    """
+    Recompute every user's rollup from the interview tables. Rows created by the incremental
+    hooks for users with older interviews started from zero and missed those interviews.
+    Mirrors api.services.stats.rebuild_user_stats using the historical models, grouped by user
+    so the database does the counting in two queries.
+    """
+    Interview = apps.get_model("api", "Interview")
+    InterviewQuestion = apps.get_model("api", "InterviewQuestion")
+    UserInterviewStats = apps.get_model("api", "UserInterviewStats")
+
+    totals = {
+        row["user_id"]: row
+        for row in Interview.objects.annotate(duration_ms=KT("ai_feedback__duration_ms"))
+        .values("user_id")
+        .annotate(
+            interviews=Count("id"),
+            durations=Count("id", filter=_HAS_DURATION),
+            duration_sum=Sum(Cast("duration_ms", FloatField()), filter=_HAS_DURATION),
+        )
+        .order_by()
+    }
+    competencies: dict = {}
+    for row in (
+        InterviewQuestion.objects.exclude(competency="")
+        .values("interview__user_id", "competency")
+        .annotate(n=Count("id"))
+        .order_by()
+    ):
+        competencies.setdefault(row["interview__user_id"], {})[row["competency"]] = row["n"]
+
+    user_ids = set(totals) | set(UserInterviewStats.objects.values_list("user_id", flat=True))
+    for user_id in user_ids:
+        row = totals.get(user_id, {})
+        UserInterviewStats.objects.update_or_create(
+            user_id=user_id,
+            defaults={
+                "interview_count": row.get("interviews", 0),
+                "duration_ms_sum": int(row.get("duration_sum") or 0),
+                "duration_count": row.get("durations", 0),
+                "competency_counts": competencies.get(user_id, {}),
+            },
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0012_bankedquestion"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
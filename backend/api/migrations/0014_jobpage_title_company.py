@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0013_backfill_userinterviewstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobpage",
+            name="title",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="jobpage",
+            name="company",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
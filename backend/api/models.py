@@ -4,6 +4,29 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+
+class JobPage(models.Model):
+    """
+    Scraped job posting text shared by every Job pointing at the same (normalized) URL.
+    ETag/Last-Modified are kept so stale entries are revalidated with a conditional GET.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    url_sha256 = models.CharField(max_length=64, unique=True)
+    url = models.TextField()
+    # Posting title and hiring company from the page's JSON-LD, when it has any.
+    title = models.CharField(max_length=255, blank=True)
+    company = models.CharField(max_length=255, blank=True)
+    description = models.TextField(blank=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    fetched_at = models.DateTimeField()
+    validated_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return self.url
 
 
 class Job(models.Model):
@@ -14,15 +37,45 @@ class Job(models.Model):
     company = models.CharField(max_length=255, blank=True)
     location = models.CharField(max_length=255, blank=True)
     description = models.TextField(blank=True)
+    # Scraped text lives on the shared JobPage; `description` is only set when the user supplies one.
+    page = models.ForeignKey(JobPage, on_delete=models.SET_NULL, null=True, blank=True, related_name="jobs")
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         indexes = [models.Index(fields=["user", "created_at"])]
 
+    @property
+    def description_text(self) -> str:
+        if self.description:
+            return self.description
+        return self.page.description if self.page_id else ""
+
     def __str__(self) -> str:
         return f"{self.company} — {self.title}".strip(" —")
 
 
+class JobImport(models.Model):
+    """A bulk import of job posting URLs, scraped in the background (see tasks.import_jobs)."""
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        COMPLETE = "complete", "Complete"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="job_imports")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.QUEUED)
+    urls = models.JSONField(default=list, blank=True)
+    # One entry per URL: {"url", "status": created|duplicate|failed, "job_id", "error"}
+    results = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"JobImport({self.id})"
+
+
 class PersonalityProfile(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="personality_profile")
@@ -36,6 +89,7 @@ class PersonalityProfile(models.Model):
 class Interview(models.Model):
     class Status(models.TextChoices):
         CREATED = "created", "Created"
+        GENERATING = "generating", "Generating Questions"
         QUESTIONS_READY = "questions_ready", "Questions Ready"
         UPLOADED = "uploaded", "Uploaded"
         PROCESSING = "processing", "Processing"
@@ -50,6 +104,17 @@ class Interview(models.Model):
     video_object_key = models.CharField(max_length=1024, blank=True)
     video_mime_type = models.CharField(max_length=128, blank=True)
     video_size_bytes = models.BigIntegerField(null=True, blank=True)
+    video_sha256 = models.CharField(max_length=64, blank=True)  # content hash, keys AnalysisCacheEntry
+
+    # Processing checkpoints: each pipeline stage persists its output so a retry resumes
+    # from the last completed stage. Cleared when `video_object_key` changes.
+    pipeline_object_key = models.CharField(max_length=1024, blank=True)
+    twelvelabs_asset_id = models.CharField(max_length=128, blank=True)
+    twelvelabs_asset_ready_at = models.DateTimeField(null=True, blank=True)
+    twelvelabs_indexed_asset_id = models.CharField(max_length=128, blank=True)
+    twelvelabs_indexed_ready_at = models.DateTimeField(null=True, blank=True)
+    twelvelabs_video_id = models.CharField(max_length=128, blank=True)
+    analysis_text = models.TextField(blank=True)
 
     transcript_text = models.TextField(blank=True)
     ai_feedback = models.JSONField(default=dict, blank=True)  # JSONB on Postgres
@@ -69,6 +134,125 @@ class Interview(models.Model):
         return f"Interview({self.id})"
 
 
+class AnalysisCacheEntry(models.Model):
+    """
+    TwelveLabs result for identical recording bytes + analysis prompt, so resubmissions
+    (double clicks, retries after FAILED) skip transcode/upload/index/analyze entirely.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    content_sha256 = models.CharField(max_length=64)
+    prompt_sha256 = models.CharField(max_length=64)
+    video_id = models.CharField(max_length=128)
+    transcript_text = models.TextField(blank=True)
+    analysis_text = models.TextField(blank=True)
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["content_sha256", "prompt_sha256"], name="uniq_analysis_cache_key"),
+        ]
+        indexes = [models.Index(fields=["last_used_at"])]
+
+    def __str__(self) -> str:
+        return f"AnalysisCacheEntry({self.content_sha256[:12]})"
+
+
+class BankedQuestion(models.Model):
+    """
+    A validated LLM-generated interview question, kept with the job context it was written for
+    so later interviews for similar roles can reuse it instead of calling the model.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    prompt_sha256 = models.CharField(max_length=64, unique=True)
+    prompt = models.TextField()
+    competency = models.CharField(max_length=128, db_index=True)
+    why_this_matters = models.TextField(blank=True)
+    good_signals = models.JSONField(default=list, blank=True)
+    red_flags = models.JSONField(default=list, blank=True)
+    source_title = models.CharField(max_length=255, blank=True)
+    source_company = models.CharField(max_length=255, blank=True)
+    source_excerpt = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.competency}: {self.prompt[:60]}"
+
+
+class UploadSession(models.Model):
+    """
+    Resumable chunked upload of an interview recording. Chunks are stored as separate parts
+    under `part_prefix` until finalize assembles them into the interview's video object.
+    """
+
+    class Status(models.TextChoices):
+        OPEN = "open", "Open"
+        COMPLETE = "complete", "Complete"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name="upload_sessions")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.OPEN)
+    content_type = models.CharField(max_length=128, blank=True)
+    total_size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    received_chunks = models.JSONField(default=list, blank=True)  # sorted chunk indices
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def total_chunks(self) -> int:
+        return max(1, -(-self.total_size // self.chunk_size))
+
+    @property
+    def part_prefix(self) -> str:
+        return f"local/uploads/{self.interview_id}/{self.id}"
+
+    def part_key(self, index: int) -> str:
+        return f"{self.part_prefix}/{index:06d}.part"
+
+    def expected_chunk_size(self, index: int) -> int:
+        if index == self.total_chunks - 1:
+            return self.total_size - self.chunk_size * index
+        return self.chunk_size
+
+    def __str__(self) -> str:
+        return f"UploadSession({self.id})"
+
+
+class RecordingStream(models.Model):
+    """
+    A recording uploaded progressively while it is being made: MediaRecorder segments are
+    appended in order to `object_key`, so the file is complete as soon as recording stops.
+    """
+
+    class Status(models.TextChoices):
+        OPEN = "open", "Open"
+        COMPLETE = "complete", "Complete"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name="recording_streams")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.OPEN)
+    object_key = models.CharField(max_length=512)
+    mime_type = models.CharField(max_length=128, blank=True)
+    next_segment = models.PositiveIntegerField(default=0)
+    pending_segments = models.JSONField(default=list, blank=True)  # out-of-order segments not yet appended
+    final_segment = models.PositiveIntegerField(null=True, blank=True)
+    size_bytes = models.BigIntegerField(default=0)
+    sha256 = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def segment_key(self, index: int) -> str:
+        return f"local/live/{self.interview_id}/{self.id}/{index:06d}.seg"
+
+    def __str__(self) -> str:
+        return f"RecordingStream({self.id})"
+
+
 class InterviewQuestion(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name="questions")
@@ -97,3 +281,20 @@ class InterviewResponse(models.Model):
     def __str__(self) -> str:
         return f"Response({self.id})"
 
+
+class UserInterviewStats(models.Model):
+    """
+    Per-user rollup backing `/interviews/statistics/`.
+    Maintained incrementally by `api.services.stats`; rebuild with `manage.py rebuild_interview_stats`.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="interview_stats")
+    interview_count = models.PositiveIntegerField(default=0)
+    duration_ms_sum = models.BigIntegerField(default=0)
+    duration_count = models.PositiveIntegerField(default=0)
+    competency_counts = models.JSONField(default=dict, blank=True)  # {competency: question count}
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"UserInterviewStats({self.user_id})"
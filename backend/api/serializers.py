@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from .models import Interview, InterviewQuestion, InterviewResponse, Job, PersonalityProfile
+from .models import Interview, InterviewQuestion, InterviewResponse, Job, JobImport, PersonalityProfile
 
 User = get_user_model()
 
@@ -20,6 +21,27 @@ class JobSerializer(serializers.ModelSerializer):
         fields = ("id", "url", "title", "company", "location", "description", "created_at")
         read_only_fields = ("id", "created_at")
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["description"] = instance.description_text
+        return data
+
+
+class BulkJobImportSerializer(serializers.Serializer):
+    urls = serializers.ListField(child=serializers.URLField(), allow_empty=False)
+
+    def validate_urls(self, value):
+        if len(value) > settings.JOB_IMPORT_MAX_URLS:
+            raise serializers.ValidationError(f"At most {settings.JOB_IMPORT_MAX_URLS} URLs per import.")
+        return value
+
+
+class JobImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobImport
+        fields = ("id", "status", "urls", "results", "created_at", "updated_at")
+        read_only_fields = fields
+
 
 class PersonalityProfileSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,57 +1,62 @@
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable
 
-import requests
 from django.conf import settings
 
+from api.services import llm_cache, llm_router, question_bank
+from api.services.clients import http_session
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class GeneratedQuestions:
     questions: list[dict]
 
-def _extract_json_from_text(text: str) -> str:
-    """
-    Gemini often returns fenced code blocks like ```json ... ```.
-    This extracts the JSON payload (array/object) as a string.
-    """
-    t = (text or "").strip()
-    if not t:
-        return ""
 
-    # Strip ```json fences if present
-    if "```" in t:
-        # Take the largest fenced block if possible
-        parts = t.split("```")
-        best = ""
-        for i in range(1, len(parts), 2):
-            block = parts[i].strip()
-            # If it starts with "json", drop the first line
-            if block.lower().startswith("json"):
-                block = "\n".join(block.splitlines()[1:]).strip()
-            if len(block) > len(best):
-                best = block
-        if best:
-            t = best
-
-    # Heuristic: slice from first { or [ to last } or ]
-    start_candidates = [t.find("["), t.find("{")]
-    start_candidates = [i for i in start_candidates if i != -1]
-    if not start_candidates:
-        return ""
-    start = min(start_candidates)
-    end_candidates = [t.rfind("]"), t.rfind("}")]
-    end_candidates = [i for i in end_candidates if i != -1]
-    if not end_candidates:
-        return ""
-    end = max(end_candidates)
-    if end <= start:
-        return ""
-    return t[start : end + 1].strip()
+def _gemini_generation_config(*, response_schema: dict | None = None) -> dict:
+    # Keep output stable-ish for structured tasks
+    config: dict = {"temperature": 0.4}
+    if response_schema is not None:
+        # Constrained decoding: the reply is JSON matching the schema, no fences or prose.
+        config["responseMimeType"] = "application/json"
+        config["responseSchema"] = response_schema
+    return config
 
 
-def _gemini_generate_text(*, prompt: str) -> str:
+# (call site, "calls" | "prompt_tokens" | "output_tokens") -> count, from each provider's usage report.
+TOKEN_USAGE: Counter[tuple[str, str]] = Counter()
+_usage_lock = threading.Lock()
+
+
+def _record_usage(site: str, *, prompt_tokens, output_tokens) -> None:
+    with _usage_lock:
+        TOKEN_USAGE[(site, "calls")] += 1
+        TOKEN_USAGE[(site, "prompt_tokens")] += int(prompt_tokens or 0)
+        TOKEN_USAGE[(site, "output_tokens")] += int(output_tokens or 0)
+
+
+def token_usage_stats() -> dict[str, dict[str, int]]:
+    """LLM call and token counters for this process, grouped by call site."""
+    grouped: dict[str, dict[str, int]] = {}
+    with _usage_lock:
+        for (site, metric), count in TOKEN_USAGE.items():
+            grouped.setdefault(site, {})[metric] = count
+    return grouped
+
+
+def _gemini_generate_text(
+    *, prompt: str, generation_config: dict | None = None, site: str = "", timeout: float = 60
+) -> str:
     """
     Minimal Gemini API call via REST (no extra SDK).
     Docs: https://ai.google.dev/
@@ -61,7 +66,9 @@ def _gemini_generate_text(*, prompt: str) -> str:
 
     model = getattr(settings, "GEMINI_MODEL", "gemini-2.5-flash")
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
-    resp = requests.post(
+    # No transport retries: a 429/503 goes back to llm_router, which fails over or hedges within
+    # the call site's deadline instead of sleeping through urllib3 backoff.
+    resp = http_session("gemini", retries=False).post(
         url,
         headers={
             "Content-Type": "application/json",
@@ -69,13 +76,16 @@ def _gemini_generate_text(*, prompt: str) -> str:
         },
         json={
             "contents": [{"parts": [{"text": prompt}]}],
-            # Keep output stable-ish for structured tasks
-            "generationConfig": {"temperature": 0.4},
+            "generationConfig": generation_config or _gemini_generation_config(),
         },
-        timeout=60,
+        timeout=timeout,
     )
     resp.raise_for_status()
     data = resp.json()
+    usage = data.get("usageMetadata") or {}
+    _record_usage(
+        site or "other", prompt_tokens=usage.get("promptTokenCount"), output_tokens=usage.get("candidatesTokenCount")
+    )
     # Best-effort extraction of the first candidate text
     return (
         data.get("candidates", [{}])[0]
@@ -86,20 +96,402 @@ def _gemini_generate_text(*, prompt: str) -> str:
     )
 
 
-def _llm_generate_text(*, prompt: str) -> str:
-    provider = getattr(settings, "AI_PROVIDER", "openai")
-    if provider == "gemini":
-        return _gemini_generate_text(prompt=prompt)
-    # Default: keep OpenAI as stubbed boilerplate (safe without keys)
-    return ""
+def _gemini_provider(*, prompt: str, response_schema: dict | None = None, site: str = "", timeout: float = 60) -> str:
+    return _gemini_generate_text(
+        prompt=prompt,
+        generation_config=_gemini_generation_config(response_schema=response_schema),
+        site=site,
+        timeout=timeout,
+    )
+
+
+def _openai_json_schema(schema: dict) -> dict:
+    """Translate a Gemini (OpenAPI-subset) schema into the strict JSON Schema OpenAI expects."""
+    converted: dict = {"type": schema["type"].lower()}
+    if "enum" in schema:
+        converted["enum"] = list(schema["enum"])
+    if schema["type"] == "OBJECT":
+        converted["properties"] = {name: _openai_json_schema(sub) for name, sub in schema["properties"].items()}
+        converted["required"] = list(schema["properties"])
+        converted["additionalProperties"] = False
+    elif schema["type"] == "ARRAY":
+        converted["items"] = _openai_json_schema(schema["items"])
+    return converted
+
+
+def _openai_generate_text(
+    *, prompt: str, response_schema: dict | None = None, site: str = "", timeout: float = 60
+) -> str:
+    """
+    OpenAI Chat Completions via REST. Structured output needs an object at the root, so array
+    schemas are wrapped as {"items": [...]} on the way out and unwrapped on the way back.
+    """
+    if not settings.OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY is not configured")
+
+    body: dict = {
+        "model": settings.OPENAI_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.4,
+    }
+    wrapped = response_schema is not None and response_schema["type"] == "ARRAY"
+    if response_schema is not None:
+        schema = {"type": "OBJECT", "properties": {"items": response_schema}} if wrapped else response_schema
+        body["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "response", "schema": _openai_json_schema(schema), "strict": True},
+        }
+    resp = http_session("openai", retries=False).post(
+        "https://api.openai.com/v1/chat/completions",
+        headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+        json=body,
+        timeout=timeout,
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    usage = data.get("usage") or {}
+    _record_usage(
+        site or "other", prompt_tokens=usage.get("prompt_tokens"), output_tokens=usage.get("completion_tokens")
+    )
+    text = ((data.get("choices") or [{}])[0].get("message") or {}).get("content") or ""
+    if wrapped:
+        try:
+            text = json.dumps(json.loads(text)["items"])
+        except (ValueError, KeyError, TypeError):
+            pass  # leave it to schema validation / repair
+    return text.strip()
+
+
+def _fake_value(schema: dict, label: str = "value", index: int = 0) -> Any:
+    if "enum" in schema:
+        return schema["enum"][index % len(schema["enum"])]
+    kind = schema["type"]
+    if kind == "OBJECT":
+        return {name: _fake_value(sub, name, index) for name, sub in schema["properties"].items()}
+    if kind == "ARRAY":
+        return [_fake_value(schema["items"], label, i) for i in range(max(schema.get("minItems", 0), 3))]
+    if kind == "STRING":
+        return f"Fake {label.replace('_', ' ')} {index + 1}."
+    if kind == "BOOLEAN":
+        return False
+    return 0
+
+
+def _fake_generate_text(*, prompt: str, response_schema: dict | None = None, site: str = "", timeout: float = 60) -> str:
+    """
+    Offline provider (LLM_PROVIDERS=fake, or as a fallback after a real one): schema-shaped canned
+    output after LLM_FAKE_LATENCY_SECONDS, failing at LLM_FAKE_FAILURE_RATE. Lets the pipeline and
+    the router's hedging / circuit breaking run without network access or keys.
+    """
+    latency = settings.LLM_FAKE_LATENCY_SECONDS
+    if latency > timeout:
+        time.sleep(timeout)
+        raise TimeoutError("fake provider timed out")
+    time.sleep(latency)
+    if random.random() < settings.LLM_FAKE_FAILURE_RATE:
+        raise RuntimeError("fake provider failure")
+    text = json.dumps(_fake_value(response_schema)) if response_schema else "Fake response for offline development."
+    _record_usage(site or "other", prompt_tokens=len(prompt) // 4, output_tokens=len(text) // 4)
+    return text
+
+
+_PROVIDERS: dict[str, Callable[..., str]] = {
+    "gemini": _gemini_provider,
+    "openai": _openai_generate_text,
+    "fake": _fake_generate_text,
+}
+
+
+def _configured_providers() -> dict[str, Callable[..., str]]:
+    """LLM_PROVIDERS in preference order, minus any without credentials."""
+    credentials = {"gemini": settings.GEMINI_API_KEY, "openai": settings.OPENAI_API_KEY, "fake": "offline"}
+    return {name: _PROVIDERS[name] for name in settings.LLM_PROVIDERS if name in _PROVIDERS and credentials[name]}
+
+
+def gather_llm_calls(
+    calls: dict[str, Callable[[], Any]],
+    *,
+    fallbacks: dict[str, Any],
+    timeout_seconds: float | None = None,
+    max_workers: int | None = None,
+) -> tuple[dict[str, Any], list[str]]:
+    """
+    Run independent LLM-backed calls concurrently on a bounded thread pool.
+    Every call shares one deadline; a call that errors or misses it gets its fallback.
+    Returns (results, degraded_names).
+    """
+    timeout_seconds = timeout_seconds or getattr(settings, "LLM_FANOUT_TIMEOUT_SECONDS", 75)
+    max_workers = max_workers or getattr(settings, "LLM_FANOUT_MAX_WORKERS", 3)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls) or 1)), thread_name_prefix="llm")
+    try:
+        futures = {name: executor.submit(fn) for name, fn in calls.items()}
+        deadline = time.monotonic() + timeout_seconds
+        results: dict[str, Any] = {}
+        degraded: list[str] = []
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except (FutureTimeoutError, Exception):  # noqa: BLE001 - partial results beat none
+                results[name] = fallbacks.get(name)
+                degraded.append(name)
+        return results, degraded
+    finally:
+        # Don't block the task on a straggler; its result is discarded.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _llm_cache_key(*, prompt: str, response_schema: dict | None = None) -> str:
+    provider = ",".join(settings.LLM_PROVIDERS)
+    model = getattr(settings, "GEMINI_MODEL", "gemini-2.5-flash")
+    config = _gemini_generation_config(response_schema=response_schema)
+    return llm_cache.cache_key(provider=provider, model=model, prompt=prompt, config=config)
+
+
+def _llm_generate_text(
+    *, prompt: str, cache: str | None = None, response_schema: dict | None = None, site: str | None = None
+) -> str:
+    """
+    `cache` names the call site; when that name is listed in LLM_CACHE_FUNCTIONS, responses
+    are served from / stored in the LLM cache keyed on (provider, model, prompt, config).
+    `response_schema` switches to JSON mode constrained to that schema.
+    `site` picks the deadline budget and labels token usage (defaults to the cache name).
+    Calls go through the provider router (LLM_PROVIDERS, with failover, hedging and circuit breaking).
+    """
+    providers = _configured_providers()
+    if not providers:
+        # Nothing configured (e.g. the default "openai" without a key): callers use their stubs.
+        return ""
+    key = None
+    if cache and llm_cache.enabled(cache):
+        key = _llm_cache_key(prompt=prompt, response_schema=response_schema)
+        cached = llm_cache.get(cache, key)
+        if cached is not None:
+            return cached
+    text = llm_router.generate(
+        site=site or cache or "other", prompt=prompt, providers=providers, response_schema=response_schema
+    )
+    if key:
+        llm_cache.put(cache, key, text)
+    return text
+
+
+class StructuredOutputError(ValueError):
+    """An LLM reply that isn't JSON, or doesn't match the schema it was asked for."""
+
+
+# (call site, outcome) -> count, where outcome is "ok", "repaired" or "failed". Logged as one
+# "llm.structured_stats" line at most every LLM_STATS_LOG_SECONDS.
+STRUCTURED_OUTCOMES: Counter[tuple[str, str]] = Counter()
+_outcomes_lock = threading.Lock()
+_next_outcomes_report = 0.0
+
+QUESTIONS_SCHEMA = {
+    "type": "ARRAY",
+    "minItems": 1,
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "prompt": {"type": "STRING"},
+            "competency": {"type": "STRING"},
+            "why_this_matters": {"type": "STRING"},
+            "good_signals": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "red_flags": {"type": "ARRAY", "items": {"type": "STRING"}},
+        },
+        "required": ["prompt", "competency", "why_this_matters", "good_signals", "red_flags"],
+        "propertyOrdering": ["prompt", "competency", "why_this_matters", "good_signals", "red_flags"],
+    },
+}
+
+ARCHETYPES = ("Bunny", "Penguin", "Turtle", "Cat")
+
+# What the feedback / archetype call sites return when the model is unavailable or unusable.
+FEEDBACK_FALLBACK = {"strengths": [], "weaknesses": []}
+ARCHETYPE_FALLBACK = {"archetype": "Unknown", "rationale": "No archetype classification available."}
+
+ARCHETYPE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "archetype": {"type": "STRING", "enum": list(ARCHETYPES)},
+        "rationale": {"type": "STRING"},
+    },
+    "required": ["archetype", "rationale"],
+    "propertyOrdering": ["archetype", "rationale"],
+}
+
+REVIEW_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "weaknesses": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "archetype": {"type": "STRING", "enum": list(ARCHETYPES)},
+        "rationale": {"type": "STRING"},
+    },
+    "required": ["strengths", "weaknesses", "archetype", "rationale"],
+    "propertyOrdering": ["strengths", "weaknesses", "archetype", "rationale"],
+}
+
+FEEDBACK_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "weaknesses": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["strengths", "weaknesses"],
+    "propertyOrdering": ["strengths", "weaknesses"],
+}
+
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "OBJECT": (dict,),
+    "ARRAY": (list,),
+    "STRING": (str,),
+    "NUMBER": (int, float),
+    "INTEGER": (int,),
+    "BOOLEAN": (bool,),
+}
+
+
+def _check_schema(value: Any, schema: dict, path: str = "$") -> None:
+    """Validate parsed JSON against the (OpenAPI-subset) schema sent to Gemini."""
+    expected = schema["type"]
+    if not isinstance(value, _JSON_TYPES[expected]) or (expected in ("NUMBER", "INTEGER") and isinstance(value, bool)):
+        raise StructuredOutputError(f"{path}: expected {expected.lower()}, got {type(value).__name__}")
+    if expected == "OBJECT":
+        for name in schema.get("required", ()):
+            if name not in value:
+                raise StructuredOutputError(f"{path}: missing {name!r}")
+        for name, subschema in schema.get("properties", {}).items():
+            if name in value:
+                _check_schema(value[name], subschema, f"{path}.{name}")
+    elif expected == "ARRAY":
+        if len(value) < schema.get("minItems", 0):
+            raise StructuredOutputError(f"{path}: expected at least {schema['minItems']} item(s)")
+        for i, item in enumerate(value):
+            _check_schema(item, schema["items"], f"{path}[{i}]")
+    elif expected == "STRING" and "enum" in schema and value not in schema["enum"]:
+        raise StructuredOutputError(f"{path}: {value!r} is not one of {schema['enum']}")
+
+
+def _parse_structured(text: str, schema: dict, convert: Callable[[Any], Any]) -> Any:
+    try:
+        value = json.loads(text)
+    except ValueError as exc:
+        raise StructuredOutputError(f"not valid JSON ({exc})") from exc
+    _check_schema(value, schema)
+    return convert(value)
+
+
+def _repair_prompt(prompt: str, reply: str, error: StructuredOutputError) -> str:
+    return (
+        f"{prompt}\n\n"
+        "Your previous reply could not be used because it did not match the required JSON schema:\n"
+        f"{error}\n\n"
+        f"Previous reply:\n{reply[:4000]}\n\n"
+        "Reply again with ONLY the corrected JSON."
+    )
+
+
+def _llm_generate_structured(
+    *, prompt: str, site: str, schema: dict, convert: Callable[[Any], Any], cache: str | None = None
+) -> Any | None:
+    """
+    Generate JSON constrained to `schema`, validate it and `convert` it to the call site's shape.
+    `convert` may raise StructuredOutputError for semantic problems (e.g. every prompt empty).
+    An invalid reply gets exactly one repair attempt that quotes the validation error back to
+    the model; if that fails too, StructuredOutputError is raised. Returns None when the
+    provider produced nothing at all (no key / stub provider). Only validated replies are cached.
+    """
+    key = _llm_cache_key(prompt=prompt, response_schema=schema) if cache and llm_cache.enabled(cache) else None
+    if key:
+        cached = llm_cache.get(cache, key)
+        if cached is not None:
+            try:
+                return _parse_structured(cached, schema, convert)
+            except StructuredOutputError:
+                pass  # written before validation existed or under another schema; regenerate
+
+    text = _llm_generate_text(prompt=prompt, response_schema=schema, site=site)
+    if not text:
+        return None
+    try:
+        result = _parse_structured(text, schema, convert)
+        outcome = "ok"
+    except StructuredOutputError as exc:
+        logger.warning("llm.structured_invalid site=%s error=%s", site, exc)
+        text = _llm_generate_text(prompt=_repair_prompt(prompt, text, exc), response_schema=schema, site=site)
+        try:
+            result = _parse_structured(text, schema, convert)
+        except StructuredOutputError as repair_exc:
+            _count_outcome(site, "failed")
+            logger.warning("llm.structured_failed site=%s error=%s", site, repair_exc)
+            raise
+        outcome = "repaired"
+
+    _count_outcome(site, outcome)
+    if key:
+        llm_cache.put(cache, key, text)
+    return result
+
+
+def _count_outcome(site: str, outcome: str) -> None:
+    global _next_outcomes_report
+    now = time.monotonic()
+    with _outcomes_lock:
+        STRUCTURED_OUTCOMES[(site, outcome)] += 1
+        report = settings.LLM_STATS_LOG_SECONDS > 0 and now >= _next_outcomes_report
+        if report:
+            _next_outcomes_report = now + settings.LLM_STATS_LOG_SECONDS
+    if report:
+        logger.info("llm.structured_stats %s", json.dumps(structured_output_stats(), sort_keys=True))
+
+
+def structured_output_stats() -> dict[str, dict[str, int]]:
+    """Structured-output outcome counters for this process, grouped by call site."""
+    grouped: dict[str, dict[str, int]] = {}
+    with _outcomes_lock:
+        for (site, outcome), count in STRUCTURED_OUTCOMES.items():
+            grouped.setdefault(site, {})[outcome] = count
+    return grouped
+
+
+def _strings(items: list) -> list[str]:
+    return [s.strip() for s in items if s.strip()]
+
+
+def _convert_questions(items: list) -> list[dict]:
+    cleaned = [
+        {
+            "prompt": item["prompt"].strip(),
+            "competency": item["competency"].strip(),
+            "why_this_matters": item["why_this_matters"].strip(),
+            "good_signals": _strings(item["good_signals"]),
+            "red_flags": _strings(item["red_flags"]),
+        }
+        for item in items
+        if item["prompt"].strip()
+    ]
+    if not cleaned:
+        raise StructuredOutputError("$: every question prompt is empty")
+    return cleaned
+
+
+def _convert_archetype(value: dict) -> dict:
+    return {"archetype": value["archetype"], "rationale": value["rationale"].strip()}
+
+
+def _convert_feedback(value: dict) -> dict:
+    return {"strengths": _strings(value["strengths"]), "weaknesses": _strings(value["weaknesses"])}
+
+
+def _convert_review(value: dict) -> dict:
+    return {"feedback": _convert_feedback(value), "archetype": _convert_archetype(value)}
 
 
 def generate_behavioral_questions(
     *, job_url: str | None, company: str | None, title: str | None, job_description: str | None = None
 ) -> GeneratedQuestions:
     """
-    Generates behavioral questions. If AI_PROVIDER=gemini and GEMINI_API_KEY is set,
-    it will use Gemini; otherwise it falls back to a deterministic stub list.
+    Generates behavioral questions: banked questions for similar roles, else the LLM providers in
+    LLM_PROVIDERS (via llm_router), else a deterministic stub list.
     """
     has_context = any(
         [
@@ -122,9 +514,17 @@ def generate_behavioral_questions(
         ]
         return GeneratedQuestions(questions=questions)
 
+    # Similar roles were already generated for: serve the banked questions (no LLM call).
+    try:
+        banked = question_bank.retrieve(title=title, company=company, description=job_description)
+    except Exception:
+        banked = None
+    if banked:
+        return GeneratedQuestions(questions=banked)
+
     # Try LLM path first (optional)
     try:
-        llm_out = _llm_generate_text(
+        cleaned = _llm_generate_structured(
             prompt=(
                 "You are an interview coach. Generate exactly 6 behavioral interview questions tailored to the job.\n"
                 "Return ONLY valid JSON (no markdown), as an array of objects.\n"
@@ -133,45 +533,18 @@ def generate_behavioral_questions(
                 "Make prompts concise and role-specific; vary competencies.\n\n"
                 f"Job URL: {job_url or ''}\nCompany: {company or ''}\nTitle: {title or ''}\n\n"
                 f"Job description text:\n{job_description or ''}\n"
-            )
+            ),
+            site="questions",
+            schema=QUESTIONS_SCHEMA,
+            convert=_convert_questions,
+            cache="questions",
         )
-        if llm_out:
-            import json
-
-            payload = _extract_json_from_text(llm_out)
-            if payload:
-                parsed = json.loads(payload)
-
-                # Gemini sometimes returns an object wrapper like {"questions": [...]}.
-                if isinstance(parsed, dict):
-                    for key in ("questions", "items", "data"):
-                        if isinstance(parsed.get(key), list):
-                            parsed = parsed[key]
-                            break
-
-                if isinstance(parsed, list):
-                    cleaned: list[dict] = []
-                    for item in parsed:
-                        # Allow either full objects or simple prompt strings.
-                        if isinstance(item, str):
-                            item = {"prompt": item}
-                        if not isinstance(item, dict):
-                            continue
-                        prompt = str(item.get("prompt", "")).strip()
-                        competency = str(item.get("competency", "")).strip()
-                        if not prompt:
-                            continue
-                        cleaned.append(
-                            {
-                                "prompt": prompt,
-                                "competency": competency,
-                                "why_this_matters": str(item.get("why_this_matters", "")).strip(),
-                                "good_signals": item.get("good_signals") if isinstance(item.get("good_signals"), list) else [],
-                                "red_flags": item.get("red_flags") if isinstance(item.get("red_flags"), list) else [],
-                            }
-                        )
-                    if cleaned:
-                        return GeneratedQuestions(questions=cleaned)
+        if cleaned:
+            try:
+                question_bank.add_questions(cleaned, title=title, company=company, description=job_description)
+            except Exception:
+                pass
+            return GeneratedQuestions(questions=cleaned)
     except Exception:
         pass
 
@@ -194,20 +567,19 @@ def generate_behavioral_questions(
 
 def score_job_fit(*, traits: dict, job: dict) -> dict:
     """
-    If AI_PROVIDER=gemini and GEMINI_API_KEY is set, uses Gemini; otherwise returns stub scoring.
+    Fit rationale from the LLM providers in LLM_PROVIDERS (via llm_router); stub scoring when none
+    is configured. LLM errors propagate so callers can tell a failed call from the stub.
     """
-    try:
-        llm_out = _llm_generate_text(
-            prompt=(
-                "Given personality traits JSON and a job JSON, produce a short rationale for fit. "
-                "Return plain text (1-3 sentences).\n"
-                f"Traits: {traits}\nJob: {job}\n"
-            )
-        )
-        if llm_out:
-            return {"score": 0.72, "rationale": llm_out, "traits_used": traits, "job_used": job}
-    except Exception:
-        pass
+    llm_out = _llm_generate_text(
+        prompt=(
+            "Given personality traits JSON and a job JSON, produce a short rationale for fit. "
+            "Return plain text (1-3 sentences).\n"
+            f"Traits: {traits}\nJob: {job}\n"
+        ),
+        cache="job_fit",
+    )
+    if llm_out:
+        return {"score": 0.72, "rationale": llm_out, "traits_used": traits, "job_used": job}
 
     return {
         "score": 0.72,
@@ -217,63 +589,90 @@ def score_job_fit(*, traits: dict, job: dict) -> dict:
     }
 
 
+_ARCHETYPE_GUIDE = (
+    "Archetypes:\n"
+    "- Bunny: The Self-Starter. Stories start with action: “I noticed… so I decided to…”, Emphasis on getting started, stepping up without being asked, Less time on planning, more on doing, Often first to volunteer or experiment.\n"
+    "- Penguin: The Team Player. Frequent use of “we”, Describes collaboration, communication, and support, Talks about resolving conflict or aligning people, Credits teammates naturally.\n"
+    "- Turtle: The Thoughtful Decision-Maker. Clearly explains why decisions were made, Mentions tradeoffs, risks, or constraints, Reflects on outcomes and lessons learned.\n"
+    "- Cat: The Ownership-Driven Contributor. Strong “I” ownership of outcomes, Focus on quality, responsibility, and follow-through, Goes deep into what they did and why it mattered, Often discusses accountability or standards.\n\n"
+)
+
+
 def classify_archetype(*, transcript: str, analysis: str) -> dict:
     """
-    If AI_PROVIDER=gemini and GEMINI_API_KEY is set, returns an archetype classification.
+    Archetype classification from the LLM providers in LLM_PROVIDERS (via llm_router);
+    ARCHETYPE_FALLBACK when none is configured. LLM errors propagate (see gather_llm_calls).
     """
-    try:
-        llm_out = _llm_generate_text(
-            prompt=(
-                "You are an interview analysis assistant. Classify the speaker into ONE archetype.\n"
-                "Archetypes:\n"
-                "- Bunny: The Self-Starter. Stories start with action: “I noticed… so I decided to…”, Emphasis on getting started, stepping up without being asked, Less time on planning, more on doing, Often first to volunteer or experiment.\n"
-                "- Penguin: The Team Player. Frequent use of “we”, Describes collaboration, communication, and support, Talks about resolving conflict or aligning people, Credits teammates naturally.\n"
-                "- Turtle: The Thoughtful Decision-Maker. Clearly explains why decisions were made, Mentions tradeoffs, risks, or constraints, Reflects on outcomes and lessons learned.\n"
-                "- Cat: The Ownership-Driven Contributor. Strong “I” ownership of outcomes, Focus on quality, responsibility, and follow-through, Goes deep into what they did and why it mattered, Often discusses accountability or standards.\n\n"
-                "Return ONLY valid JSON (no markdown) with this schema:\n"
-                '{ "archetype": string, "rationale": string }\n\n'
-                "Use the transcript and analysis below. Do not infer protected attributes.\n\n"
-                f"Analysis:\n{analysis}\n\n"
-                f"Transcript:\n{transcript}\n"
-            )
-        )
-        if llm_out:
-            payload = _extract_json_from_text(llm_out)
-            if payload:
-                parsed = json.loads(payload)
-                archetype = str(parsed.get("archetype", "")).strip()
-                rationale = str(parsed.get("rationale", "")).strip()
-                if archetype:
-                    return {"archetype": archetype, "rationale": rationale}
-    except Exception:
-        pass
+    result = _llm_generate_structured(
+        prompt=(
+            "You are an interview analysis assistant. Classify the speaker into ONE archetype.\n"
+            f"{_ARCHETYPE_GUIDE}"
+            "Return ONLY valid JSON (no markdown) with this schema:\n"
+            '{ "archetype": string, "rationale": string }\n\n'
+            "Use the transcript and analysis below. Do not infer protected attributes.\n\n"
+            f"Analysis:\n{analysis}\n\n"
+            f"Transcript:\n{transcript}\n"
+        ),
+        site="archetype",
+        schema=ARCHETYPE_SCHEMA,
+        convert=_convert_archetype,
+        cache="archetype",
+    )
+    if result:
+        return result
 
-    return {"archetype": "Unknown", "rationale": "No archetype classification available."}
+    return dict(ARCHETYPE_FALLBACK)
 
 
 def generate_interview_feedback(*, transcript: str, analysis: str) -> dict:
     """
-    Uses Gemini to generate strengths and improvements from transcript + analysis.
+    Strengths and improvements from transcript + analysis via the LLM providers (llm_router);
+    FEEDBACK_FALLBACK when no provider is configured. LLM errors propagate (see gather_llm_calls).
     """
-    try:
-        llm_out = _llm_generate_text(
-            prompt=(
-                "You are an interview coach. Provide feedback for the candidate.\n"
-                "Return ONLY valid JSON (no markdown) with this schema:\n"
-                '{ "strengths": [string], "weaknesses": [string] }\n\n'
-                "Use the transcript and analysis below. Do not infer protected attributes.\n\n"
-                f"Analysis:\n{analysis}\n\n"
-                f"Transcript:\n{transcript}\n"
-            )
-        )
-        if llm_out:
-            payload = _extract_json_from_text(llm_out)
-            if payload:
-                parsed = json.loads(payload)
-                strengths = parsed.get("strengths") if isinstance(parsed.get("strengths"), list) else []
-                weaknesses = parsed.get("weaknesses") if isinstance(parsed.get("weaknesses"), list) else []
-                return {"strengths": strengths, "weaknesses": weaknesses}
-    except Exception:
-        pass
+    result = _llm_generate_structured(
+        prompt=(
+            "You are an interview coach. Provide feedback for the candidate.\n"
+            "Return ONLY valid JSON (no markdown) with this schema:\n"
+            '{ "strengths": [string], "weaknesses": [string] }\n\n'
+            "Use the transcript and analysis below. Do not infer protected attributes.\n\n"
+            f"Analysis:\n{analysis}\n\n"
+            f"Transcript:\n{transcript}\n"
+        ),
+        site="feedback",
+        schema=FEEDBACK_SCHEMA,
+        convert=_convert_feedback,
+        cache="feedback",
+    )
+    if result:
+        return result
+
+    return dict(FEEDBACK_FALLBACK)
+
+
+def review_interview(*, transcript: str, analysis: str) -> dict:
+    """
+    One structured call that returns both `generate_interview_feedback` and `classify_archetype`
+    results ({"feedback": {...}, "archetype": {...}}, same shapes as those functions), so the
+    transcript and analysis are sent to the model once instead of twice. LLM errors propagate.
+    """
+    result = _llm_generate_structured(
+        prompt=(
+            "You are an interview coach. Review the candidate's interview and do two things:\n"
+            "1. Provide feedback for the candidate as strengths and weaknesses.\n"
+            "2. Classify the speaker into ONE archetype and explain why in the rationale.\n"
+            f"{_ARCHETYPE_GUIDE}"
+            "Return ONLY valid JSON (no markdown) with this schema:\n"
+            '{ "strengths": [string], "weaknesses": [string], "archetype": string, "rationale": string }\n\n'
+            "Use the transcript and analysis below. Do not infer protected attributes.\n\n"
+            f"Analysis:\n{analysis}\n\n"
+            f"Transcript:\n{transcript}\n"
+        ),
+        site="review",
+        schema=REVIEW_SCHEMA,
+        convert=_convert_review,
+        cache="review",
+    )
+    if result:
+        return result
 
-    return {"strengths": [], "weaknesses": []}
+    return {"feedback": dict(FEEDBACK_FALLBACK), "archetype": dict(ARCHETYPE_FALLBACK)}
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import timedelta
+import hashlib
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from api.models import AnalysisCacheEntry
+from api.services.twelvelabs import TwelveLabsResult
+
+logger = logging.getLogger(__name__)
+
+
+def _prompt_sha256(prompt: str) -> str:
+    return hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()
+
+
+def _expiry_cutoff():
+    return timezone.now() - timedelta(days=settings.ANALYSIS_CACHE_TTL_DAYS)
+
+
+def lookup(*, content_sha256: str, prompt: str) -> TwelveLabsResult | None:
+    """Return the cached TwelveLabs result for (recording bytes, prompt), counting the hit."""
+    if not content_sha256:
+        return None
+    entry = (
+        AnalysisCacheEntry.objects.filter(
+            content_sha256=content_sha256,
+            prompt_sha256=_prompt_sha256(prompt),
+            last_used_at__gte=_expiry_cutoff(),
+        )
+        .only("id", "video_id", "transcript_text", "analysis_text")
+        .first()
+    )
+    if entry is None:
+        return None
+
+    AnalysisCacheEntry.objects.filter(id=entry.id).update(hits=F("hits") + 1, last_used_at=timezone.now())
+    logger.info("analysis_cache.hit content=%s video_id=%s", content_sha256[:12], entry.video_id)
+    return TwelveLabsResult(transcript=entry.transcript_text, analysis=entry.analysis_text, video_id=entry.video_id)
+
+
+def store(*, content_sha256: str, prompt: str, result: TwelveLabsResult) -> None:
+    if not content_sha256 or not result.video_id:
+        return
+    try:
+        with transaction.atomic():
+            AnalysisCacheEntry.objects.update_or_create(
+                content_sha256=content_sha256,
+                prompt_sha256=_prompt_sha256(prompt),
+                defaults={
+                    "video_id": result.video_id,
+                    "transcript_text": result.transcript,
+                    "analysis_text": result.analysis,
+                    "last_used_at": timezone.now(),
+                },
+            )
+    except IntegrityError:
+        # A concurrent worker stored the same key first; either copy is valid.
+        return
+    evict()
+
+
+def evict() -> int:
+    """
+    Drop entries unused for ANALYSIS_CACHE_TTL_DAYS, then trim the least recently used
+    beyond ANALYSIS_CACHE_MAX_ENTRIES. Returns the number of rows removed.
+    """
+    removed, _ = AnalysisCacheEntry.objects.filter(last_used_at__lt=_expiry_cutoff()).delete()
+    overflow_ids = list(
+        AnalysisCacheEntry.objects.order_by("-last_used_at").values_list("id", flat=True)[
+            settings.ANALYSIS_CACHE_MAX_ENTRIES :
+        ]
+    )
+    if overflow_ids:
+        trimmed, _ = AnalysisCacheEntry.objects.filter(id__in=overflow_ids).delete()
+        removed += trimmed
+    return removed
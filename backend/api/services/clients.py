@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, TypeVar
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+T = TypeVar("T")
+
+# Per-process registry of long-lived clients (HTTP sessions, boto3, TwelveLabs). Reusing them
+# keeps TCP/TLS connections alive across calls instead of handshaking on every request.
+_registry: dict[Any, Any] = {}
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def _reset_after_fork() -> None:
+    # Celery prefork children must not share the parent's sockets: start with an empty registry.
+    global _lock, _pid
+    _registry.clear()
+    _lock = threading.Lock()
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def shared_client(key: Any, factory: Callable[[], T]) -> T:
+    """Return the process-wide client registered under `key`, building it once with `factory`."""
+    if _pid != os.getpid():
+        _reset_after_fork()
+    client = _registry.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _registry.get(key)
+        if client is None:
+            client = _registry[key] = factory()
+    return client
+
+
+def _build_session(*, retry_methods: frozenset[str], retries: int) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,  # a timed-out read may have reached the server; let the caller decide
+        backoff_factor=settings.HTTP_RETRY_BACKOFF_SECONDS,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=retry_methods,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def http_session(name: str, *, retry_post: bool = False, retries: bool = True) -> requests.Session:
+    """
+    Keep-alive `requests.Session` for one upstream (e.g. "gemini", "job_ingest"). Transient
+    connection errors and 429/502/503/504 are retried with backoff; POSTs only when the
+    caller says the request is safe to repeat. retries=False turns transport retries off for
+    callers that fail over themselves (the LLM router).
+    """
+    methods = Retry.DEFAULT_ALLOWED_METHODS | ({"POST"} if retry_post else set())
+    total = settings.HTTP_RETRY_TOTAL if retries else 0
+    return shared_client(
+        ("http", name, retry_post, total),
+        lambda: _build_session(retry_methods=frozenset(methods), retries=total),
+    )
+
+
+def redis_client():
+    """
+    Shared Redis connection for caches, or None when Redis isn't usable (e.g. the no-Docker
+    quickstart runs Celery eagerly without a broker); callers then skip the Redis tier.
+    """
+    url = getattr(settings, "REDIS_URL", "")
+    if not url or settings.CELERY_TASK_ALWAYS_EAGER:
+        return None
+    try:
+        import redis  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    return shared_client(
+        ("redis", url),
+        lambda: redis.Redis.from_url(url, socket_connect_timeout=2, socket_timeout=2, health_check_interval=30),
+    )
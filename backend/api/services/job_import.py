@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+import threading
+from typing import Callable, TypeVar
+from urllib.parse import urlsplit
+
+from django.db import connection
+
+T = TypeVar("T")
+
+
+def interleave_by_host(urls: list[str]) -> list[str]:
+    """
+    Round-robin URLs across hosts (a1, b1, c1, a2, b2, ...) so workers waiting on a busy host's
+    cap are the exception rather than the rule.
+    """
+    by_host: OrderedDict[str, list[str]] = OrderedDict()
+    for url in urls:
+        by_host.setdefault((urlsplit(url).hostname or "").lower(), []).append(url)
+    return [url for group in zip_longest(*by_host.values()) for url in group if url is not None]
+
+
+def scrape_concurrently(
+    urls: list[str], fetch: Callable[[str], T], *, max_workers: int, per_host: int
+) -> dict[str, tuple[T | None, str]]:
+    """
+    Run `fetch(url)` for every URL on a bounded pool, allowing at most `per_host` requests to
+    the same host at once. Returns {url: (result, "")} or {url: (None, error message)}.
+    """
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+    guard = threading.Lock()
+
+    def run(url: str) -> tuple[T | None, str]:
+        host = (urlsplit(url).hostname or "").lower()
+        with guard:
+            slot = host_slots.setdefault(host, threading.BoundedSemaphore(max(per_host, 1)))
+        try:
+            with slot:
+                return fetch(url), ""
+        except Exception as exc:  # noqa: BLE001 - reported per URL
+            return None, str(exc) or exc.__class__.__name__
+        finally:
+            # Worker threads open their own DB connections; don't leak them.
+            connection.close()
+
+    ordered = interleave_by_host(urls)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ordered) or 1)), thread_name_prefix="scrape") as pool:
+        results = dict(zip(ordered, pool.map(run, ordered)))
+    return results
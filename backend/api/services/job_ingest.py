@@ -1,9 +1,82 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+import html as html_lib
+import json
 import re
 
-import requests
 from bs4 import BeautifulSoup
+from django.conf import settings
+
+from api.services.clients import http_session
+
+try:  # lxml builds the tree several times faster than html.parser; optional.
+    import lxml  # type: ignore  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ModuleNotFoundError:
+    HTML_PARSER = "html.parser"
+
+_HEADERS = {
+    # Some sites block default python UA
+    "User-Agent": "Mozilla/5.0 (compatible; UofTHacks2026Bot/0.1; +https://example.com)",
+    "Accept": "text/html,application/xhtml+xml",
+}
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+_JSON_LD_RE = re.compile(
+    r"<script[^>]+type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL
+)
+_BLOCK_TAG_RE = re.compile(r"<\s*(?:br|/p|/li|/h[1-6]|/div|/ul|/ol)\b[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Shorter JSON-LD descriptions are usually teaser snippets; parse the page instead.
+_MIN_JSON_LD_CHARS = 200
+
+
+@dataclass(frozen=True)
+class FetchedJobPage:
+    text: str
+    etag: str
+    last_modified: str
+    not_modified: bool = False
+    # From the page's JSON-LD JobPosting, when it has one.
+    title: str = ""
+    company: str = ""
+
+
+def fetch_job_page(
+    *,
+    url: str,
+    etag: str = "",
+    last_modified: str = "",
+    timeout_seconds: int = 20,
+    max_chars: int = 20000,
+) -> FetchedJobPage:
+    """
+    Fetch a job posting and extract its text. Pass the validators from a previous fetch to
+    make the request conditional; a 304 comes back as `not_modified` with no text.
+    The body is streamed and cut off at JOB_PAGE_MAX_BYTES, so huge ATS pages cost bounded
+    memory and time.
+    """
+    headers = dict(_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    with http_session("job_ingest").get(url, headers=headers, timeout=timeout_seconds, stream=True) as resp:
+        if resp.status_code == 304:
+            return FetchedJobPage(text="", etag=etag, last_modified=last_modified, not_modified=True)
+        resp.raise_for_status()
+        body = _read_capped(resp, max_bytes=settings.JOB_PAGE_MAX_BYTES)
+        page_html = body.decode(resp.encoding or "utf-8", errors="replace")
+        title, company = extract_job_header(page_html)
+        return FetchedJobPage(
+            text=extract_job_text(page_html, max_chars=max_chars),
+            etag=resp.headers.get("ETag", ""),
+            last_modified=resp.headers.get("Last-Modified", ""),
+            title=title,
+            company=company,
+        )
 
 
 def fetch_job_description_text(*, url: str, timeout_seconds: int = 20, max_chars: int = 20000) -> str:
@@ -11,18 +84,90 @@ def fetch_job_description_text(*, url: str, timeout_seconds: int = 20, max_chars
     Fetch a job posting page and extract a best-effort plain-text description.
     Keep it dependency-light and resilient: this is a heuristic, not a perfect scraper.
     """
-    resp = requests.get(
-        url,
-        headers={
-            # Some sites block default python UA
-            "User-Agent": "Mozilla/5.0 (compatible; UofTHacks2026Bot/0.1; +https://example.com)",
-            "Accept": "text/html,application/xhtml+xml",
-        },
-        timeout=timeout_seconds,
-    )
-    resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, "html.parser")
+    return fetch_job_page(url=url, timeout_seconds=timeout_seconds, max_chars=max_chars).text
+
+
+def _read_capped(resp, *, max_bytes: int) -> bytes:
+    chunks: list[bytes] = []
+    received = 0
+    for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= max_bytes:
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+def extract_job_text(page_html: str, *, max_chars: int = 20000) -> str:
+    """Prefer the schema.org JobPosting JSON-LD most ATSs embed; fall back to parsing the page."""
+    return _extract_json_ld_text(page_html, max_chars=max_chars) or _extract_text(page_html, max_chars=max_chars)
+
+
+def extract_job_header(page_html: str) -> tuple[str, str]:
+    """(title, company) of the first schema.org JobPosting on the page, or blanks."""
+    for node in _json_ld_postings(page_html):
+        title, company = _posting_header(node)
+        if title or company:
+            return title, company
+    return "", ""
+
+
+def _iter_json_ld(node):
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_json_ld(item)
+    elif isinstance(node, dict):
+        yield node
+        if "@graph" in node:
+            yield from _iter_json_ld(node["@graph"])
+
+
+def _is_job_posting(node: dict) -> bool:
+    kind = node.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return "JobPosting" in kinds
+
+
+def _html_fragment_text(fragment: str) -> str:
+    # Descriptions are HTML, sometimes entity-escaped a second time inside the JSON.
+    text = _BLOCK_TAG_RE.sub("\n", html_lib.unescape(fragment or ""))
+    text = html_lib.unescape(_TAG_RE.sub("", text))
+    lines = (re.sub(r"[ \t\xa0]+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _json_ld_postings(page_html: str):
+    """Regex out <script type="application/ld+json"> blocks: no DOM is built on this path."""
+    for match in _JSON_LD_RE.finditer(page_html):
+        try:
+            data = json.loads(match.group(1).strip())
+        except ValueError:
+            continue
+        for node in _iter_json_ld(data):
+            if _is_job_posting(node):
+                yield node
+
+
+def _posting_header(node: dict) -> tuple[str, str]:
+    org = node.get("hiringOrganization")
+    title = _html_fragment_text(str(node.get("title") or ""))
+    company = _html_fragment_text(str(org.get("name") or "")) if isinstance(org, dict) else ""
+    return title, company
+
+
+def _extract_json_ld_text(page_html: str, *, max_chars: int) -> str:
+    for node in _json_ld_postings(page_html):
+        description = _html_fragment_text(str(node.get("description") or ""))
+        if len(description) < _MIN_JSON_LD_CHARS:
+            continue
+        header = _posting_header(node)
+        text = "\n".join([*(h for h in header if h), "", description]).strip()
+        return text[:max_chars].strip()
+    return ""
+
+
+def _extract_text(page_html: str, *, max_chars: int, parser: str | None = None) -> str:
+    soup = BeautifulSoup(page_html, parser or HTML_PARSER)
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
 
@@ -38,4 +183,3 @@ def fetch_job_description_text(*, url: str, timeout_seconds: int = 20, max_chars
         text = text[:max_chars]
 
     return text.strip()
-
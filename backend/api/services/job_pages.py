@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import timedelta
+import hashlib
+import logging
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from weakref import WeakValueDictionary
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+
+from api.models import JobPage
+from api.services.clients import redis_client
+from api.services.job_ingest import fetch_job_page
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track where a click came from; they never change the posting.
+_TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi", "ref", "trk"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _KeyLock:
+    """threading.Lock can't be weakly referenced; this wrapper can."""
+
+    __slots__ = ("_lock", "__weakref__")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> _KeyLock:
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._lock.release()
+
+
+# One in-process lock per URL key, dropped once no caller holds or waits on it, so unrelated
+# URLs never queue behind each other and the map doesn't grow with every URL seen.
+_local_locks: WeakValueDictionary[str, _KeyLock] = WeakValueDictionary()
+_local_locks_guard = threading.Lock()
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form used as the cache key: lowercase scheme/host, no default port, no
+    fragment, tracking parameters dropped, remaining query parameters sorted.
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def _url_sha256(normalized_url: str) -> str:
+    return hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+
+
+def _is_fresh(page: JobPage) -> bool:
+    return page.validated_at >= timezone.now() - timedelta(seconds=settings.JOB_PAGE_FRESH_SECONDS)
+
+
+def _local_lock(key: str) -> _KeyLock:
+    with _local_locks_guard:
+        lock = _local_locks.get(key)
+        if lock is None:
+            lock = _local_locks[key] = _KeyLock()
+        return lock
+
+
+@contextmanager
+def _single_flight(key: str):
+    """
+    Let one caller at a time refresh `key`: a thread lock within this process plus a Redis
+    lock across workers (skipped when Redis isn't available). Waiters re-read the row after.
+    """
+    with _local_lock(key):
+        client = redis_client()
+        lock = None
+        if client is not None:
+            try:
+                lock = client.lock(f"job-page-lock:{key}", timeout=60, blocking_timeout=30)
+                if not lock.acquire():
+                    lock = None  # holder is slow; fetch ourselves rather than fail
+            except Exception:  # noqa: BLE001 - coalescing is best-effort
+                lock = None
+        try:
+            yield
+        finally:
+            if lock is not None:
+                try:
+                    lock.release()
+                except Exception:  # noqa: BLE001 - lock expired; nothing to release
+                    pass
+
+
+def get_job_page(url: str) -> JobPage:
+    """
+    Return the cached page for `url`, fetching it if unknown and revalidating it (conditional
+    GET) once older than JOB_PAGE_FRESH_SECONDS. Concurrent callers for the same URL share one
+    request. If a refresh fails but an older copy exists, the older copy is returned.
+    The normalized URL is only the cache and lock key; the URL as given is what gets fetched,
+    since some sites need the exact path or query string the user pasted.
+    """
+    normalized = normalize_url(url)
+    key = _url_sha256(normalized)
+    page = JobPage.objects.filter(url_sha256=key).first()
+    if page is not None and _is_fresh(page):
+        return page
+
+    with _single_flight(key):
+        page = JobPage.objects.filter(url_sha256=key).first()
+        if page is not None and _is_fresh(page):
+            return page  # another caller refreshed it while we waited
+
+        try:
+            fetched = fetch_job_page(
+                url=url.strip(),
+                etag=page.etag if page else "",
+                last_modified=page.last_modified if page else "",
+            )
+        except Exception:
+            if page is not None:
+                logger.warning("job_pages.refresh_failed url=%s; serving cached copy", url)
+                return page
+            raise
+
+        now = timezone.now()
+        if page is not None and fetched.not_modified:
+            page.validated_at = now
+            page.save(update_fields=["validated_at"])
+            return page
+        if page is None:
+            try:
+                return JobPage.objects.create(
+                    url_sha256=key,
+                    url=normalized,
+                    title=fetched.title[:255],
+                    company=fetched.company[:255],
+                    description=fetched.text,
+                    etag=fetched.etag,
+                    last_modified=fetched.last_modified,
+                    fetched_at=now,
+                    validated_at=now,
+                )
+            except IntegrityError:
+                page = JobPage.objects.get(url_sha256=key)
+        page.title = fetched.title[:255]
+        page.company = fetched.company[:255]
+        page.description = fetched.text
+        page.etag = fetched.etag
+        page.last_modified = fetched.last_modified
+        page.fetched_at = now
+        page.validated_at = now
+        page.save(
+            update_fields=["title", "company", "description", "etag", "last_modified", "fetched_at", "validated_at"]
+        )
+        return page
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from api.services.clients import redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm-cache:v1:"
+
+# Process-local LRU in front of Redis: key -> (expires_at, text).
+_memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_lock = threading.Lock()
+
+# (cache name, outcome) -> count, where outcome is "memory_hit", "redis_hit" or "miss". Logged as
+# one "llm_cache.stats" line at most every LLM_STATS_LOG_SECONDS.
+STATS: Counter[tuple[str, str]] = Counter()
+_stats_lock = threading.Lock()
+_next_report = 0.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Line endings and trailing whitespace don't change what the model sees; don't let them split the cache."""
+    return "\n".join(line.rstrip() for line in (prompt or "").replace("\r\n", "\n").strip().split("\n"))
+
+
+def cache_key(*, provider: str, model: str, prompt: str, config: dict) -> str:
+    prompt_sha256 = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+    material = json.dumps([provider, model, prompt_sha256, config], sort_keys=True, separators=(",", ":"))
+    return KEY_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def enabled(name: str) -> bool:
+    return name in settings.LLM_CACHE_FUNCTIONS and settings.LLM_CACHE_TTL_SECONDS > 0
+
+
+def _count(name: str, outcome: str) -> None:
+    global _next_report
+    now = time.monotonic()
+    with _stats_lock:
+        STATS[(name, outcome)] += 1
+        report = settings.LLM_STATS_LOG_SECONDS > 0 and now >= _next_report
+        if report:
+            _next_report = now + settings.LLM_STATS_LOG_SECONDS
+    logger.debug("llm_cache.%s name=%s", outcome, name)
+    if report:
+        logger.info("llm_cache.stats %s", json.dumps(stats(), sort_keys=True))
+
+
+def _remember(key: str, text: str, *, ttl_seconds: float) -> None:
+    with _lock:
+        _memory[key] = (time.monotonic() + ttl_seconds, text)
+        _memory.move_to_end(key)
+        while len(_memory) > settings.LLM_CACHE_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def get(name: str, key: str) -> str | None:
+    """Cached response text for `key`, checking the in-process LRU first and then Redis."""
+    with _lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _memory.move_to_end(key)
+                _count(name, "memory_hit")
+                return entry[1]
+            del _memory[key]
+
+    client = redis_client()
+    if client is not None:
+        try:
+            raw = client.get(key)
+            ttl = client.ttl(key) if raw is not None else -2
+        except Exception:  # noqa: BLE001 - a cache outage just means calling the model
+            raw = None
+        if raw is not None:
+            text = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+            _remember(key, text, ttl_seconds=ttl if ttl > 0 else settings.LLM_CACHE_TTL_SECONDS)
+            _count(name, "redis_hit")
+            return text
+
+    _count(name, "miss")
+    return None
+
+
+def put(name: str, key: str, text: str) -> None:
+    if not text:
+        return
+    ttl = settings.LLM_CACHE_TTL_SECONDS
+    _remember(key, text, ttl_seconds=ttl)
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        client.set(key, text.encode("utf-8"), ex=int(ttl))
+    except Exception:  # noqa: BLE001
+        logger.warning("llm_cache.store_failed name=%s", name)
+
+
+def stats() -> dict[str, dict[str, int]]:
+    """Hit/miss counters for this process, grouped by cache name."""
+    grouped: dict[str, dict[str, int]] = {}
+    with _stats_lock:
+        for (name, outcome), count in STATS.items():
+            grouped.setdefault(name, {})[outcome] = count
+    return grouped
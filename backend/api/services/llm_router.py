@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import json
+import logging
+import threading
+import time
+from typing import Callable
+
+from django.conf import settings
+
+from api.services.clients import shared_client
+
+logger = logging.getLogger(__name__)
+
+# A provider is called as fn(prompt=..., response_schema=..., timeout=..., site=...) -> text.
+ProviderFn = Callable[..., str]
+
+# (call site, event) -> count. Events: "hedged", "failover", "deadline", "unavailable", "won:<provider>".
+# Logged with provider_health() as one "llm_router.stats" line at most every LLM_STATS_LOG_SECONDS.
+ROUTER_EVENTS: Counter[tuple[str, str]] = Counter()
+_events_lock = threading.Lock()
+_next_report = 0.0
+
+
+class LLMUnavailable(RuntimeError):
+    """Every provider failed, had its circuit open, or the call site's deadline ran out."""
+
+
+@dataclass
+class _Health:
+    """Rolling latency window and circuit breaker for one provider (per process)."""
+
+    latencies: deque = field(default_factory=lambda: deque(maxlen=200))
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+    def allow(self) -> bool:
+        """Closed: always. Open: nothing until the cooldown passes, then a single half-open probe."""
+        if self.opened_at is None:
+            return True
+        if self.probing or time.monotonic() - self.opened_at < settings.LLM_BREAKER_COOLDOWN_SECONDS:
+            return False
+        self.probing = True
+        return True
+
+    def record(self, *, ok: bool, latency: float) -> None:
+        self.calls += 1
+        self.probing = False
+        if ok:
+            self.latencies.append(latency)
+            self.consecutive_failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.opened_at is not None or self.consecutive_failures >= settings.LLM_BREAKER_FAILURES:
+            # Trip (or re-trip after a failed probe) and start a fresh cooldown.
+            self.opened_at = time.monotonic()
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def hedge_delay(self) -> float:
+        """Wait this long for the provider before hedging: its LLM_HEDGE_PERCENTILE latency once known."""
+        if len(self.latencies) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DEFAULT_DELAY_SECONDS
+        return max(self.percentile(settings.LLM_HEDGE_PERCENTILE), settings.LLM_HEDGE_MIN_DELAY_SECONDS)
+
+
+_health: dict[str, _Health] = {}
+_lock = threading.Lock()
+
+
+def _health_for(name: str) -> _Health:
+    with _lock:
+        return _health.setdefault(name, _Health())
+
+
+def _executor() -> ThreadPoolExecutor:
+    # Hedged losers keep running until their own timeout; a shared pool bounds how many can pile up.
+    return shared_client(
+        ("llm-router",),
+        lambda: ThreadPoolExecutor(max_workers=settings.LLM_ROUTER_MAX_WORKERS, thread_name_prefix="llm-provider"),
+    )
+
+
+def _event(site: str, name: str) -> None:
+    global _next_report
+    now = time.monotonic()
+    with _events_lock:
+        ROUTER_EVENTS[(site, name)] += 1
+        report = settings.LLM_STATS_LOG_SECONDS > 0 and now >= _next_report
+        if report:
+            _next_report = now + settings.LLM_STATS_LOG_SECONDS
+    if report:
+        logger.info("llm_router.stats %s", json.dumps({"events": event_counts(), "providers": provider_health()}))
+
+
+def deadline_for(site: str) -> float:
+    return settings.LLM_DEADLINES.get(site, settings.LLM_DEADLINE_SECONDS)
+
+
+def _call(name: str, fn: ProviderFn, *, timeout: float, **kwargs) -> str:
+    health = _health_for(name)
+    started = time.monotonic()
+    try:
+        text = fn(timeout=timeout, **kwargs)
+    except Exception:
+        with _lock:
+            health.record(ok=False, latency=time.monotonic() - started)
+        raise
+    with _lock:
+        health.record(ok=True, latency=time.monotonic() - started)
+    return text
+
+
+def generate(
+    *, site: str, prompt: str, providers: dict[str, ProviderFn], response_schema: dict | None = None
+) -> str:
+    """
+    Call `providers` in preference order within the call site's deadline budget (LLM_DEADLINES).
+
+    The first provider whose circuit allows it is called. If it fails, the next one is tried at
+    once (failover); if it is merely slow, the next one is started alongside it once the first
+    has taken longer than its recent LLM_HEDGE_PERCENTILE latency (hedging). The first success
+    wins. Raises LLMUnavailable when nothing succeeds before the deadline.
+    """
+    deadline = time.monotonic() + deadline_for(site)
+    queue = list(providers)
+    pending: dict[Future, str] = {}
+    errors: list[str] = []
+    hedge_at = deadline
+
+    def launch() -> bool:
+        nonlocal hedge_at
+        while queue:
+            name = queue.pop(0)
+            health = _health_for(name)
+            with _lock:
+                allowed = health.allow()
+                delay = health.hedge_delay()
+            if not allowed:
+                errors.append(f"{name}: circuit open")
+                continue
+            now = time.monotonic()
+            future = _executor().submit(
+                _call,
+                name,
+                providers[name],
+                timeout=max(deadline - now, 0.1),
+                prompt=prompt,
+                response_schema=response_schema,
+                site=site,
+            )
+            pending[future] = name
+            hedge_at = now + delay
+            return True
+        return False
+
+    if not launch():
+        _event(site, "unavailable")
+    while pending:
+        now = time.monotonic()
+        if now >= deadline:
+            _event(site, "deadline")
+            errors.append(f"deadline of {deadline_for(site):g}s exceeded")
+            break
+        wait_until = min(hedge_at, deadline) if queue else deadline
+        done, _ = wait(list(pending), timeout=max(wait_until - now, 0), return_when=FIRST_COMPLETED)
+        for future in done:
+            name = pending.pop(future)
+            try:
+                text = future.result()
+            except Exception as exc:  # noqa: BLE001 - try the next provider
+                errors.append(f"{name}: {exc}")
+                logger.warning("llm_router.provider_failed site=%s provider=%s error=%s", site, name, exc)
+                continue
+            _event(site, f"won:{name}")
+            return text
+        if not done and queue and time.monotonic() >= hedge_at:
+            if launch():
+                _event(site, "hedged")
+        elif not pending and queue:
+            if launch():
+                _event(site, "failover")
+
+    raise LLMUnavailable(f"No LLM provider answered for {site!r}: " + "; ".join(errors or ["none configured"]))
+
+
+def event_counts() -> dict[str, dict[str, int]]:
+    """Router event counters for this process, grouped by call site."""
+    grouped: dict[str, dict[str, int]] = {}
+    with _events_lock:
+        for (site, name), count in ROUTER_EVENTS.items():
+            grouped.setdefault(site, {})[name] = count
+    return grouped
+
+
+def provider_health() -> dict[str, dict]:
+    """Per-provider circuit state and latency percentiles for this process."""
+    snapshot: dict[str, dict] = {}
+    with _lock:
+        for name, health in _health.items():
+            p50, p95 = health.percentile(0.5), health.percentile(0.95)
+            snapshot[name] = {
+                "state": "closed" if health.opened_at is None else ("half_open" if health.probing else "open"),
+                "calls": health.calls,
+                "failures": health.failures,
+                "consecutive_failures": health.consecutive_failures,
+                "p50_ms": None if p50 is None else round(p50 * 1000),
+                "p95_ms": None if p95 is None else round(p95 * 1000),
+                "hedge_delay_ms": round(health.hedge_delay() * 1000),
+            }
+    return snapshot
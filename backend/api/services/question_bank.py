@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+import hashlib
+import logging
+import math
+import re
+import threading
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from api.models import BankedQuestion
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]+")
+_STOPWORDS = frozenset(
+    """
+    about above after again all also an and any are as at be been being both but by can could did do does
+    doing during each few for from further had has have having he her here hers him his how if in into is it
+    its itself just me more most my no nor not now of off on once only or other our ours out over own same
+    she should so some such than that the their theirs them then there these they this those through to too
+    under until up very was we were what when where which while who whom why will with would you your yours
+    job role team work working experience years year looking join us including ability strong new
+    """.split()
+)
+
+# Title terms say more about the role than any single description term; count them this many times.
+_TITLE_WEIGHT = 3
+
+
+@dataclass(frozen=True)
+class _Document:
+    question: dict
+    competency: str
+    source_company: str
+
+
+@dataclass
+class _Index:
+    signature: tuple
+    documents: list[_Document]
+    idf: dict[str, float]
+    postings: dict[str, list[tuple[int, float]]]
+
+
+_index: _Index | None = None
+_lock = threading.Lock()
+
+
+def _tokens(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+def _context_terms(*, title: str, company: str, description: str) -> Counter:
+    terms = Counter(_tokens(description))
+    terms.update(_tokens(company))
+    for _ in range(_TITLE_WEIGHT):
+        terms.update(_tokens(title))
+    return terms
+
+
+def _weights(terms: Counter, idf: dict[str, float]) -> dict[str, float]:
+    """Sublinear tf * idf, L2-normalised. Terms unknown to the index are dropped."""
+    vector = {t: (1 + math.log(n)) * idf[t] for t, n in terms.items() if t in idf}
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {t: w / norm for t, w in vector.items()} if norm else {}
+
+
+def _signature() -> tuple:
+    row = BankedQuestion.objects.aggregate(n=Count("id"), latest=Max("updated_at"))
+    return (row["n"], row["latest"])
+
+
+def _build(signature: tuple) -> _Index:
+    rows = list(
+        BankedQuestion.objects.values(
+            "prompt",
+            "competency",
+            "why_this_matters",
+            "good_signals",
+            "red_flags",
+            "source_title",
+            "source_company",
+            "source_excerpt",
+        )
+    )
+    documents: list[_Document] = []
+    term_counts: list[Counter] = []
+    df: Counter = Counter()
+    for row in rows:
+        terms = _context_terms(
+            title=row["source_title"],
+            company=row["source_company"],
+            description=f"{row['source_excerpt']}\n{row['competency']}\n{row['prompt']}",
+        )
+        documents.append(
+            _Document(
+                question={
+                    "prompt": row["prompt"],
+                    "competency": row["competency"],
+                    "why_this_matters": row["why_this_matters"],
+                    "good_signals": list(row["good_signals"] or []),
+                    "red_flags": list(row["red_flags"] or []),
+                },
+                competency=row["competency"].strip().lower(),
+                source_company=row["source_company"].strip().lower(),
+            )
+        )
+        term_counts.append(terms)
+        df.update(terms.keys())
+
+    n = len(documents)
+    idf = {t: math.log((1 + n) / (1 + d)) + 1 for t, d in df.items()}
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for doc_id, terms in enumerate(term_counts):
+        for term, weight in _weights(terms, idf).items():
+            postings.setdefault(term, []).append((doc_id, weight))
+    return _Index(signature=signature, documents=documents, idf=idf, postings=postings)
+
+
+def get_index(*, force: bool = False) -> _Index:
+    """
+    The process-wide TF-IDF index over the bank. Rebuilt when the bank's row count or latest
+    update changes, so questions banked (or edited) elsewhere are picked up on the next lookup.
+    """
+    global _index
+    signature = _signature()
+    current = _index
+    if current is not None and current.signature == signature and not force:
+        return current
+    with _lock:
+        if _index is None or _index.signature != signature or force:
+            _index = _build(signature)
+            logger.info("question_bank.index_built documents=%s terms=%s", len(_index.documents), len(_index.idf))
+        return _index
+
+
+def retrieve(*, title: str | None, company: str | None, description: str | None) -> list[dict] | None:
+    """
+    Questions from the bank for a job, or None when the bank isn't confident enough.
+
+    Scores every banked question by cosine similarity between its source job and this one,
+    then takes the best question per competency. The weakest of the chosen questions must
+    still clear QUESTION_BANK_MIN_SCORE, otherwise the caller should ask the LLM.
+    """
+    wanted = settings.QUESTION_BANK_QUESTIONS
+    if not settings.QUESTION_BANK_ENABLED or wanted <= 0:
+        return None
+    index = get_index()
+    if len(index.documents) < wanted:
+        return None
+
+    query = _weights(
+        _context_terms(title=title or "", company=company or "", description=description or ""), index.idf
+    )
+    scores: Counter = Counter()
+    for term, weight in query.items():
+        for doc_id, doc_weight in index.postings.get(term, ()):
+            scores[doc_id] += weight * doc_weight
+
+    company_key = (company or "").strip().lower()
+    chosen: list[tuple[float, _Document]] = []
+    seen_competencies: set[str] = set()
+    for doc_id, score in scores.most_common():
+        doc = index.documents[doc_id]
+        if doc.competency in seen_competencies:
+            continue
+        # A question written for another employer may name it; don't serve that to this one.
+        if doc.source_company and doc.source_company != company_key:
+            if doc.source_company in doc.question["prompt"].lower():
+                continue
+        seen_competencies.add(doc.competency)
+        chosen.append((score, doc))
+        if len(chosen) == wanted:
+            break
+
+    confidence = chosen[-1][0] if len(chosen) == wanted else 0.0
+    if confidence < settings.QUESTION_BANK_MIN_SCORE:
+        logger.info("question_bank.miss confidence=%.3f", confidence)
+        return None
+    logger.info("question_bank.hit confidence=%.3f", confidence)
+    return [dict(doc.question) for _, doc in chosen]
+
+
+def _prompt_sha256(prompt: str) -> str:
+    return hashlib.sha256(" ".join(prompt.lower().split()).encode("utf-8")).hexdigest()
+
+
+def add_questions(
+    questions: list[dict], *, title: str | None, company: str | None, description: str | None
+) -> int:
+    """
+    Bank validated questions together with the job context they were generated for.
+    Questions without a competency, or already banked (same normalised prompt), are skipped.
+    Returns the number of rows written.
+    """
+    excerpt = (description or "")[: settings.QUESTION_BANK_EXCERPT_CHARS]
+    rows = [
+        BankedQuestion(
+            prompt_sha256=_prompt_sha256(q["prompt"]),
+            prompt=q["prompt"],
+            competency=q["competency"][:128],
+            why_this_matters=q.get("why_this_matters", ""),
+            good_signals=[str(s) for s in q.get("good_signals") or []],
+            red_flags=[str(s) for s in q.get("red_flags") or []],
+            source_title=(title or "")[:255],
+            source_company=(company or "")[:255],
+            source_excerpt=excerpt,
+        )
+        for q in questions
+        if (q.get("prompt") or "").strip() and (q.get("competency") or "").strip()
+    ]
+    if not rows:
+        return 0
+    before = BankedQuestion.objects.count()
+    BankedQuestion.objects.bulk_create(rows, ignore_conflicts=True)
+    return BankedQuestion.objects.count() - before
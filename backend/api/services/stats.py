@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Count, FloatField, Q, Sum
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+
+from api.models import Interview, InterviewQuestion, UserInterviewStats
+
+
+# ai_feedback["duration_ms"] as text, counted only when it is a plain number (mirrors _duration_ms).
+_DURATION_MS = KT("ai_feedback__duration_ms")
+_HAS_DURATION = Q(duration_ms__regex=r"^-?[0-9]+(\.[0-9]+)?$")
+
+
+def _locked_stats(user_id) -> UserInterviewStats:
+    """
+    Fetch (or create) the user's rollup row under SELECT ... FOR UPDATE.
+    Must be called inside transaction.atomic().
+    """
+    UserInterviewStats.objects.get_or_create(user_id=user_id)
+    return UserInterviewStats.objects.select_for_update().get(user_id=user_id)
+
+
+def _duration_ms(feedback) -> int | None:
+    if not isinstance(feedback, dict):
+        return None
+    value = feedback.get("duration_ms")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value)
+
+
+def record_interview_created(*, user_id) -> None:
+    """Count a new interview in the user's rollup."""
+    with transaction.atomic():
+        stats = _locked_stats(user_id)
+        stats.interview_count += 1
+        stats.save(update_fields=["interview_count", "updated_at"])
+
+
+def record_questions_added(*, user_id, competencies: Iterable[str]) -> None:
+    """Add the competencies of newly created interview questions to the user's histogram."""
+    counts = Counter(c for c in competencies if c)
+    if not counts:
+        return
+    with transaction.atomic():
+        stats = _locked_stats(user_id)
+        histogram = dict(stats.competency_counts or {})
+        for competency, n in counts.items():
+            histogram[competency] = histogram.get(competency, 0) + n
+        stats.competency_counts = histogram
+        stats.save(update_fields=["competency_counts", "updated_at"])
+
+
+def record_interview_deleted(*, interview: Interview) -> None:
+    """Remove an interview's contribution from the rollup (call before deleting the row)."""
+    competencies = Counter(
+        c for c in InterviewQuestion.objects.filter(interview=interview).values_list("competency", flat=True) if c
+    )
+    duration = _duration_ms(interview.ai_feedback)
+    with transaction.atomic():
+        stats = _locked_stats(interview.user_id)
+        stats.interview_count = max(stats.interview_count - 1, 0)
+        if duration is not None:
+            stats.duration_ms_sum = max(stats.duration_ms_sum - duration, 0)
+            stats.duration_count = max(stats.duration_count - 1, 0)
+        histogram = dict(stats.competency_counts or {})
+        for competency, n in competencies.items():
+            remaining = histogram.get(competency, 0) - n
+            if remaining > 0:
+                histogram[competency] = remaining
+            else:
+                histogram.pop(competency, None)
+        stats.competency_counts = histogram
+        stats.save(
+            update_fields=["interview_count", "duration_ms_sum", "duration_count", "competency_counts", "updated_at"]
+        )
+
+
+def record_feedback_change(*, user_id, old_feedback, new_feedback) -> None:
+    """
+    Apply the duration delta when an interview's ai_feedback is replaced.
+    Re-processing the same interview swaps its duration instead of counting it twice.
+    """
+    old = _duration_ms(old_feedback)
+    new = _duration_ms(new_feedback)
+    if old == new:
+        return
+    with transaction.atomic():
+        stats = _locked_stats(user_id)
+        stats.duration_ms_sum = max(stats.duration_ms_sum + (new or 0) - (old or 0), 0)
+        stats.duration_count = max(stats.duration_count + (new is not None) - (old is not None), 0)
+        stats.save(update_fields=["duration_ms_sum", "duration_count", "updated_at"])
+
+
+def rebuild_user_stats(*, user_id) -> UserInterviewStats:
+    """Recompute a user's rollup from the Interview/InterviewQuestion tables."""
+    with transaction.atomic():
+        stats = _locked_stats(user_id)
+        totals = (
+            Interview.objects.filter(user_id=user_id)
+            .annotate(duration_ms=_DURATION_MS)
+            .aggregate(
+                interviews=Count("id"),
+                durations=Count("id", filter=_HAS_DURATION),
+                duration_sum=Sum(Cast("duration_ms", FloatField()), filter=_HAS_DURATION),
+            )
+        )
+        competencies = (
+            InterviewQuestion.objects.filter(interview__user_id=user_id)
+            .exclude(competency="")
+            .values("competency")
+            .annotate(n=Count("id"))
+        )
+        stats.interview_count = totals["interviews"]
+        stats.duration_ms_sum = int(totals["duration_sum"] or 0)
+        stats.duration_count = totals["durations"]
+        stats.competency_counts = {row["competency"]: row["n"] for row in competencies}
+        stats.save()
+    return stats
+
+
+def summarize(stats: UserInterviewStats | None) -> dict:
+    """Shape a rollup row into the `/interviews/statistics/` response payload."""
+    if stats is None:
+        return {
+            "total_interviews": 0,
+            "average_duration_seconds": 0,
+            "most_practiced_competency": None,
+            "total_questions_answered": 0,
+        }
+
+    average_duration_ms = stats.duration_ms_sum / stats.duration_count if stats.duration_count else 0
+    histogram = Counter(stats.competency_counts or {})
+    most_practiced = histogram.most_common(1)[0][0] if histogram else None
+    return {
+        "total_interviews": stats.interview_count,
+        "average_duration_seconds": int(average_duration_ms / 1000),
+        "most_practiced_competency": most_practiced,
+        "total_questions_answered": sum(histogram.values()),
+    }
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from api.models import Interview
+from api.services.clients import redis_client
+
+CHANNEL_PREFIX = "interview-status:"
+
+
+@dataclass(frozen=True)
+class InterviewStatus:
+    id: str
+    status: str
+    updated_at: str
+
+    def as_dict(self) -> dict:
+        return {"id": self.id, "status": self.status, "updated_at": self.updated_at}
+
+
+def _channel(interview_id) -> str:
+    return f"{CHANNEL_PREFIX}{interview_id}"
+
+
+def read_status(interview_id) -> InterviewStatus | None:
+    row = Interview.objects.filter(id=interview_id).values("status", "updated_at").first()
+    if row is None:
+        return None
+    return InterviewStatus(id=str(interview_id), status=row["status"], updated_at=row["updated_at"].isoformat())
+
+
+def publish_status(interview: Interview) -> None:
+    """
+    Announce an interview status transition to long-poll subscribers.
+    Published after commit so woken readers see the new row; best-effort by design.
+    """
+    message = json.dumps(
+        {"id": str(interview.id), "status": interview.status, "updated_at": interview.updated_at.isoformat()}
+    )
+
+    def _send():
+        client = redis_client()
+        if client is None:
+            return
+        try:
+            client.publish(_channel(interview.id), message)
+        except Exception:  # noqa: BLE001 - pollers still converge via the DB read
+            pass
+
+    transaction.on_commit(_send)
+
+
+def _parse_since(since: str | None) -> datetime | None:
+    try:
+        return parse_datetime(since or "")
+    except ValueError:  # well formatted but not a real date
+        return None
+
+
+def wait_for_status_change(interview_id, *, since: str | None, timeout_seconds: float) -> InterviewStatus | None:
+    """
+    Block until the interview's `updated_at` differs from `since` or the timeout elapses,
+    then return the current status row. `since` may use any ISO 8601 offset spelling (DRF
+    renders UTC as "Z", this module as "+00:00"); it is compared as a datetime. Subscribes before the first DB read so a
+    transition published in between is never missed. Without Redis (see redis_client),
+    waits fall back to polling the DB.
+    """
+    deadline = time.monotonic() + max(timeout_seconds, 0)
+    since_at = _parse_since(since)
+    client = redis_client()
+    pubsub = None
+    if client is not None:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_channel(interview_id))
+        except Exception:  # noqa: BLE001 - degrade to DB polling
+            pubsub = None
+
+    try:
+        current = read_status(interview_id)
+        while current is not None and since_at is not None and datetime.fromisoformat(current.updated_at) == since_at:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if pubsub is not None:
+                try:
+                    pubsub.get_message(timeout=remaining)
+                except Exception:  # noqa: BLE001
+                    pubsub = None
+            else:
+                time.sleep(min(remaining, getattr(settings, "INTERVIEW_STATUS_DB_POLL_SECONDS", 1.0)))
+            current = read_status(interview_id)
+        return current
+    finally:
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:  # noqa: BLE001
+                pass
@@ -3,9 +3,21 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 
+import hashlib
+
 import boto3
 from botocore.client import Config
+from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.files.storage import default_storage
+
+from api.services.clients import shared_client
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# S3 multipart limits: every part but the last must be at least 5 MiB, and at most 10,000 parts.
+MULTIPART_MIN_PART_BYTES = 5 * 1024 * 1024
+MULTIPART_MAX_PARTS = 10_000
 
 
 @dataclass(frozen=True)
@@ -21,13 +33,22 @@ def _s3_client():
     if not settings.S3_ACCESS_KEY_ID or not settings.S3_SECRET_ACCESS_KEY:
         raise ValueError("S3 credentials are not configured")
 
-    return boto3.client(
-        "s3",
-        endpoint_url=settings.S3_ENDPOINT_URL or None,
-        region_name=settings.S3_REGION_NAME or None,
-        aws_access_key_id=settings.S3_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
-        config=Config(signature_version="s3v4"),
+    # boto3 clients are thread-safe; build one per process (and per credential set) and reuse it.
+    key = ("s3", settings.S3_ENDPOINT_URL, settings.S3_REGION_NAME, settings.S3_ACCESS_KEY_ID)
+    return shared_client(
+        key,
+        lambda: boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+            region_name=settings.S3_REGION_NAME or None,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            config=Config(
+                signature_version="s3v4",
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": settings.HTTP_RETRY_TOTAL + 1, "mode": "standard"},
+            ),
+        ),
     )
 
 
@@ -47,3 +68,167 @@ def presign_put_object(*, object_key: str, content_type: str, expires_in_seconds
     )
     return PresignedPutUrl(object_key=object_key, url=url, headers={"Content-Type": content_type})
 
+
+@dataclass(frozen=True)
+class PresignedMultipartUpload:
+    object_key: str
+    upload_id: str
+    part_size: int
+    parts: list[dict]  # [{"part_number": 1, "url": "..."}, ...]
+
+
+class MultipartMismatch(ValueError):
+    pass
+
+
+def multipart_part_size(total_size: int) -> int:
+    """Part size for a `total_size` upload: the configured size, grown so it fits in 10,000 parts."""
+    part_size = max(settings.S3_MULTIPART_PART_BYTES, MULTIPART_MIN_PART_BYTES)
+    return max(part_size, -(-total_size // MULTIPART_MAX_PARTS))
+
+
+def create_multipart_upload(
+    *, object_key: str, content_type: str, total_size: int, expires_in_seconds: int = 3600
+) -> PresignedMultipartUpload:
+    """
+    Starts an S3 multipart upload and presigns one PUT URL per part so the browser can
+    upload parts in parallel. Finish with complete_multipart_upload / abort_multipart_upload.
+    """
+    if total_size <= 0:
+        raise MultipartMismatch("total_size must be a positive byte count.")
+    client = _s3_client()
+    upload_id = client.create_multipart_upload(
+        Bucket=settings.S3_BUCKET_NAME, Key=object_key, ContentType=content_type
+    )["UploadId"]
+    part_size = multipart_part_size(total_size)
+    part_count = -(-total_size // part_size)
+    parts = [
+        {
+            "part_number": n,
+            "url": client.generate_presigned_url(
+                ClientMethod="upload_part",
+                Params={"Bucket": settings.S3_BUCKET_NAME, "Key": object_key, "UploadId": upload_id, "PartNumber": n},
+                ExpiresIn=expires_in_seconds,
+            ),
+        }
+        for n in range(1, part_count + 1)
+    ]
+    return PresignedMultipartUpload(object_key=object_key, upload_id=upload_id, part_size=part_size, parts=parts)
+
+
+def _uploaded_parts(client, *, object_key: str, upload_id: str) -> dict[int, dict]:
+    parts: dict[int, dict] = {}
+    kwargs = {"Bucket": settings.S3_BUCKET_NAME, "Key": object_key, "UploadId": upload_id}
+    while True:
+        try:
+            page = client.list_parts(**kwargs)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                raise MultipartMismatch("Unknown or already finished multipart upload.") from exc
+            raise
+        for part in page.get("Parts", []):
+            parts[int(part["PartNumber"])] = part
+        if not page.get("IsTruncated"):
+            return parts
+        kwargs["PartNumberMarker"] = page["NextPartNumberMarker"]
+
+
+def complete_multipart_upload(
+    *, object_key: str, upload_id: str, parts: list[dict], total_size: int | None = None
+) -> tuple[str, int]:
+    """
+    Validates the client's (part_number, etag) list against what S3 actually received, then
+    completes the upload. Parts must be numbered 1..N, every ETag must match, and every part
+    but the last must meet the 5 MiB minimum. Returns (object ETag, object size).
+    """
+    claimed = {}
+    for part in parts or []:
+        try:
+            claimed[int(part["part_number"])] = str(part["etag"]).strip('"')
+        except (KeyError, TypeError, ValueError):
+            raise MultipartMismatch("Each part needs a part_number and an etag.") from None
+    if not claimed or sorted(claimed) != list(range(1, len(claimed) + 1)):
+        raise MultipartMismatch("Parts must be numbered consecutively from 1.")
+
+    client = _s3_client()
+    uploaded = _uploaded_parts(client, object_key=object_key, upload_id=upload_id)
+    size = 0
+    for number, etag in claimed.items():
+        actual = uploaded.get(number)
+        if actual is None:
+            raise MultipartMismatch(f"Part {number} was never uploaded.")
+        if str(actual["ETag"]).strip('"') != etag:
+            raise MultipartMismatch(f"Part {number} ETag does not match the uploaded data.")
+        if number < len(claimed) and int(actual["Size"]) < MULTIPART_MIN_PART_BYTES:
+            raise MultipartMismatch(f"Part {number} is smaller than the 5 MiB multipart minimum.")
+        size += int(actual["Size"])
+    if total_size is not None and size != total_size:
+        raise MultipartMismatch(f"Uploaded parts total {size} bytes but {total_size} were declared.")
+
+    result = client.complete_multipart_upload(
+        Bucket=settings.S3_BUCKET_NAME,
+        Key=object_key,
+        UploadId=upload_id,
+        MultipartUpload={"Parts": [{"PartNumber": n, "ETag": f'"{claimed[n]}"'} for n in sorted(claimed)]},
+    )
+    return str(result.get("ETag", "")).strip('"'), size
+
+
+def abort_multipart_upload(*, object_key: str, upload_id: str) -> None:
+    """Discards an unfinished multipart upload so S3 stops storing (and billing for) its parts."""
+    try:
+        _s3_client().abort_multipart_upload(Bucket=settings.S3_BUCKET_NAME, Key=object_key, UploadId=upload_id)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") != "NoSuchUpload":  # already aborted/completed
+            raise
+
+
+def s3_configured() -> bool:
+    return bool(settings.S3_BUCKET_NAME and settings.S3_ACCESS_KEY_ID and settings.S3_SECRET_ACCESS_KEY)
+
+
+def _is_local(object_key: str) -> bool:
+    # Keys written by `upload_local` live in Django's default storage; presigned uploads live in S3.
+    return default_storage.exists(object_key) or not s3_configured()
+
+
+def open_object(object_key: str):
+    """Open a stored recording for streaming reads."""
+    if _is_local(object_key):
+        return default_storage.open(object_key, "rb")
+    return _s3_client().get_object(Bucket=settings.S3_BUCKET_NAME, Key=object_key)["Body"]
+
+
+def presign_get_object(*, object_key: str, expires_in_seconds: int = 3600) -> str:
+    """Returns a presigned GET URL so third parties can fetch the object directly from the bucket."""
+    return _s3_client().generate_presigned_url(
+        ClientMethod="get_object",
+        Params={"Bucket": settings.S3_BUCKET_NAME, "Key": object_key},
+        ExpiresIn=expires_in_seconds,
+    )
+
+
+def remote_url(object_key: str, *, expires_in_seconds: int = 3600) -> str | None:
+    """
+    A URL an external service can download the object from, or None when the object
+    only exists in local storage (dev MEDIA_ROOT isn't reachable from outside).
+    """
+    if _is_local(object_key):
+        return None
+    return presign_get_object(object_key=object_key, expires_in_seconds=expires_in_seconds)
+
+
+def sha256_chunks(chunks) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_object(object_key: str) -> str:
+    """Streaming SHA-256 of a stored object (never holds more than one chunk in memory)."""
+    handle = open_object(object_key)
+    try:
+        return sha256_chunks(iter(lambda: handle.read(HASH_CHUNK_BYTES), b""))
+    finally:
+        handle.close()
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
+import hashlib
+import hmac
+import json
+import logging
 import mimetypes
 import os
+import random
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 
 from django.conf import settings
-from django.core.files.storage import default_storage
 from typing import TYPE_CHECKING
 
+from api.services.clients import shared_client
+from api.services.storage import open_object, remote_url
+
 if TYPE_CHECKING:  # pragma: no cover
     from twelvelabs import TwelveLabs
 
+logger = logging.getLogger(__name__)
+
 
 DEFAULT_ANALYSIS_PROMPT = (
     "You are an interview analysis assistant. Analyze a recorded mock interview using the transcript "
@@ -45,9 +56,7 @@ class TwelveLabsResult:
     video_id: str
 
 
-def analyze_video_from_storage(
-    *, object_key: str, filename: str | None = None, prompt: str | None = None
-) -> TwelveLabsResult:
+def get_client() -> TwelveLabs:
     try:
         from twelvelabs import TwelveLabs  # type: ignore
     except ModuleNotFoundError as exc:
@@ -56,24 +65,42 @@ def analyze_video_from_storage(
             "or configure the app to use a different transcription/analysis backend."
         ) from exc
 
-    api_key = settings.TWELVELABS_API_KEY
-    index_id = settings.TWELVELABS_INDEX_ID
-    if not api_key:
+    if not settings.TWELVELABS_API_KEY:
         raise ValueError("TWELVELABS_API_KEY is not configured")
-    if not index_id:
+    # The SDK client owns a keep-alive HTTP pool; share one per process instead of one per call.
+    api_key = settings.TWELVELABS_API_KEY
+    return shared_client(("twelvelabs", api_key), lambda: TwelveLabs(api_key=api_key))
+
+
+def get_index_id() -> str:
+    if not settings.TWELVELABS_INDEX_ID:
         raise ValueError("TWELVELABS_INDEX_ID is not configured")
+    return settings.TWELVELABS_INDEX_ID
 
-    client = TwelveLabs(api_key=api_key)
 
+def upload_asset(client: TwelveLabs, *, object_key: str, filename: str | None = None) -> str:
+    """
+    Create the TwelveLabs asset for a stored recording; returns the asset id.
+    Objects TwelveLabs can reach (S3) that need no transcode are handed over as a presigned
+    URL, so the worker moves no video bytes; otherwise the file is transcoded and uploaded.
+    """
     safe_filename = filename or os.path.basename(object_key) or "recording.webm"
     mime_type, _ = mimetypes.guess_type(safe_filename)
     if not mime_type:
         mime_type = "application/octet-stream"
 
+    if not _looks_like_webm(safe_filename, mime_type):
+        url = remote_url(object_key, expires_in_seconds=settings.TWELVELABS_ASSET_URL_EXPIRES_SECONDS)
+        if url:
+            asset = client.assets.create(method="url", url=url, filename=safe_filename)
+            if not asset.id:
+                raise RuntimeError("Asset creation from URL failed: missing asset ID.")
+            return asset.id
+
     cleanup_paths: list[str] = []
     upload_handle = None
     try:
-        with default_storage.open(object_key, "rb") as handle:
+        with open_object(object_key) as handle:
             upload_handle, upload_name, upload_mime, cleanup_paths = _prepare_upload_file(
                 handle=handle, filename=safe_filename, mime_type=mime_type
             )
@@ -93,52 +120,191 @@ def analyze_video_from_storage(
 
     if not asset.id:
         raise RuntimeError("Asset upload failed: missing asset ID.")
-    _wait_for_asset_ready(client, asset.id)
+    return asset.id
+
 
-    indexed_asset = client.indexes.indexed_assets.create(index_id, asset_id=asset.id)
+def index_asset(client: TwelveLabs, *, index_id: str, asset_id: str) -> str:
+    """Add a ready asset to the index; returns the indexed asset id."""
+    indexed_asset = client.indexes.indexed_assets.create(index_id, asset_id=asset_id)
     if not indexed_asset.id:
         raise RuntimeError("Indexing request failed: missing indexed asset ID.")
-    _wait_for_indexed_asset_ready(client, index_id, indexed_asset.id)
+    return indexed_asset.id
 
-    indexed_asset_details = client.indexes.indexed_assets.retrieve(
-        index_id, indexed_asset.id, transcription=True
-    )
+
+def fetch_indexed_video(client: TwelveLabs, *, index_id: str, indexed_asset_id: str, filename: str) -> tuple[str, str]:
+    """Returns (transcript, video_id) for a ready indexed asset."""
+    indexed_asset_details = client.indexes.indexed_assets.retrieve(index_id, indexed_asset_id, transcription=True)
     transcript_text = _format_transcription(getattr(indexed_asset_details, "transcription", None))
+    video_id = _resolve_video_id(client, index_id, indexed_asset_id, filename, indexed_asset_details)
+    return transcript_text, video_id
+
 
-    video_id = _resolve_video_id(client, index_id, safe_filename, indexed_asset_details)
+def analyze_video(client: TwelveLabs, *, video_id: str, prompt: str | None = None) -> str:
+    analysis = client.analyze(video_id=video_id, prompt=prompt or DEFAULT_ANALYSIS_PROMPT)
+    return getattr(analysis, "data", str(analysis))
+
+
+def analyze_video_from_storage(
+    *, object_key: str, filename: str | None = None, prompt: str | None = None, content_sha256: str | None = None
+) -> TwelveLabsResult:
+    """
+    One-shot pipeline (upload -> index -> analyze). Celery uses the stages above with checkpoints.
+    With `content_sha256`, identical recordings analyzed with the same prompt are served from cache.
+    """
+    from api.services import analysis_cache
 
     analysis_prompt = prompt or DEFAULT_ANALYSIS_PROMPT
-    analysis = client.analyze(video_id=video_id, prompt=analysis_prompt)
-    analysis_text = getattr(analysis, "data", str(analysis))
+    if content_sha256:
+        cached = analysis_cache.lookup(content_sha256=content_sha256, prompt=analysis_prompt)
+        if cached is not None:
+            return cached
+
+    client = get_client()
+    index_id = get_index_id()
+    safe_filename = filename or os.path.basename(object_key) or "recording.webm"
 
-    return TwelveLabsResult(transcript=transcript_text, analysis=analysis_text, video_id=video_id)
+    asset_id = upload_asset(client, object_key=object_key, filename=safe_filename)
+    wait_for_asset_ready(client, asset_id)
 
+    indexed_asset_id = index_asset(client, index_id=index_id, asset_id=asset_id)
+    wait_for_indexed_asset_ready(client, index_id, indexed_asset_id)
+
+    transcript_text, video_id = fetch_indexed_video(
+        client, index_id=index_id, indexed_asset_id=indexed_asset_id, filename=safe_filename
+    )
+    analysis_text = analyze_video(client, video_id=video_id, prompt=analysis_prompt)
+    result = TwelveLabsResult(transcript=transcript_text, analysis=analysis_text, video_id=video_id)
+    if content_sha256:
+        analysis_cache.store(content_sha256=content_sha256, prompt=analysis_prompt, result=result)
+    return result
+
+
+class ProcessingFailed(RuntimeError):
+    """TwelveLabs reported a terminal failure for an asset or indexed asset (not retryable)."""
+
+
+def poll_delay(attempt: int, *, base: float = 5.0, factor: float = 1.5, cap: float = 60.0, jitter: float = 0.2) -> float:
+    """Exponential backoff with +/- `jitter` proportional randomization for readiness polls."""
+    delay = min(base * (factor ** max(attempt, 0)), cap)
+    return max(delay * random.uniform(1 - jitter, 1 + jitter), 0.0)
+
+
+def check_asset_ready(client: TwelveLabs, asset_id: str) -> bool:
+    """Single, non-blocking status check. True when ready; raises ProcessingFailed on failure."""
+    asset = client.assets.retrieve(asset_id)
+    status = getattr(asset, "status", None)
+    if status == "failed":
+        raise ProcessingFailed(f"Asset processing failed (status={status}).")
+    return status == "ready"
+
+
+def check_indexed_asset_ready(client: TwelveLabs, index_id: str, indexed_asset_id: str) -> bool:
+    indexed_asset = client.indexes.indexed_assets.retrieve(index_id, indexed_asset_id)
+    status = getattr(indexed_asset, "status", None)
+    if status == "failed":
+        raise ProcessingFailed(f"Indexing failed (status={status}).")
+    return status == "ready"
 
-def _wait_for_asset_ready(client: TwelveLabs, asset_id: str, sleep_interval: float = 5.0) -> None:
-    while True:
-        asset = client.assets.retrieve(asset_id)
-        status = getattr(asset, "status", None)
-        if status in ("ready", "failed"):
-            if status != "ready":
-                raise RuntimeError(f"Asset processing failed (status={status}).")
-            return
-        time.sleep(sleep_interval)
 
+def _block_until(check, *, deadline_seconds: float | None) -> None:
+    deadline_seconds = deadline_seconds or settings.TWELVELABS_WAIT_DEADLINE_SECONDS
+    started = time.monotonic()
+    attempt = 0
+    while not check():
+        if time.monotonic() - started > deadline_seconds:
+            raise TimeoutError(f"TwelveLabs processing did not finish within {deadline_seconds:.0f}s.")
+        time.sleep(poll_delay(attempt))
+        attempt += 1
 
-def _wait_for_indexed_asset_ready(
-    client: TwelveLabs, index_id: str, indexed_asset_id: str, sleep_interval: float = 5.0
+
+def wait_for_asset_ready(client: TwelveLabs, asset_id: str, deadline_seconds: float | None = None) -> None:
+    """
+    Blocking wait (inline/eager mode and one-shot callers only). The Celery pipeline
+    re-enqueues `check_asset_ready` instead so no worker slot is held while TwelveLabs works.
+    """
+    _block_until(lambda: check_asset_ready(client, asset_id), deadline_seconds=deadline_seconds)
+
+
+def wait_for_indexed_asset_ready(
+    client: TwelveLabs, index_id: str, indexed_asset_id: str, deadline_seconds: float | None = None
 ) -> None:
-    while True:
-        indexed_asset = client.indexes.indexed_assets.retrieve(index_id, indexed_asset_id)
-        status = getattr(indexed_asset, "status", None)
-        if status in ("ready", "failed"):
-            if status != "ready":
-                raise RuntimeError(f"Indexing failed (status={status}).")
-            return
-        time.sleep(sleep_interval)
+    _block_until(
+        lambda: check_indexed_asset_ready(client, index_id, indexed_asset_id), deadline_seconds=deadline_seconds
+    )
+
 
+def verify_webhook_signature(*, body: bytes, header: str, secret: str, tolerance_seconds: int = 300) -> bool:
+    """
+    Verify a `TL-Signature: t=<unix ts>,v1=<hex hmac>` header, where the HMAC-SHA256 is
+    computed over "<t>.<raw body>" with the webhook secret.
+    """
+    parts = dict(item.split("=", 1) for item in (header or "").split(",") if "=" in item)
+    timestamp, signature = parts.get("t", ""), parts.get("v1", "")
+    if not timestamp.isdigit() or not signature:
+        return False
+    if abs(time.time() - int(timestamp)) > tolerance_seconds:
+        return False
+    expected = hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+# indexed asset id -> video id, per worker process; the mapping never changes once indexed.
+_VIDEO_ID_CACHE: OrderedDict[str, str] = OrderedDict()
+_VIDEO_ID_CACHE_MAX = 1024
+# How each video id was resolved: "cache", "details", "indexed_asset_id" or "filename_scan".
+VIDEO_ID_RESOLUTIONS: Counter[str] = Counter()
+# Guards both of the above; threaded workers resolve concurrently and OrderedDict reordering isn't atomic.
+_video_id_lock = threading.Lock()
+
+
+def _video_id_from_details(indexed_asset_details) -> str:
+    video_id = getattr(indexed_asset_details, "video_id", None)
+    if not video_id:
+        video_id = getattr(getattr(indexed_asset_details, "video", None), "id", None)
+    return str(video_id) if video_id else ""
+
+
+def _record_video_id(indexed_asset_id: str, video_id: str, path: str) -> str:
+    logger.info("twelvelabs.video_id_resolved path=%s indexed_asset=%s video_id=%s", path, indexed_asset_id, video_id)
+    with _video_id_lock:
+        VIDEO_ID_RESOLUTIONS[path] += 1
+        _VIDEO_ID_CACHE[indexed_asset_id] = video_id
+        _VIDEO_ID_CACHE.move_to_end(indexed_asset_id)
+        while len(_VIDEO_ID_CACHE) > _VIDEO_ID_CACHE_MAX:
+            _VIDEO_ID_CACHE.popitem(last=False)
+    return video_id
+
+
+def _resolve_video_id(
+    client: TwelveLabs, index_id: str, indexed_asset_id: str, filename: str, indexed_asset_details
+) -> str:
+    """
+    Map an indexed asset to the video id `analyze` expects, deterministically. In order:
+    this process's cache (no call), the id carried on the indexed asset details (no call),
+    then the indexed asset id itself, which the index exposes as a video (one retrieve).
+    A filename listing is kept only as a last resort and is logged as a warning; the old
+    "most recent video in the index" guess is gone because concurrent workers race on it.
+    """
+    with _video_id_lock:
+        cached = _VIDEO_ID_CACHE.get(indexed_asset_id)
+        if cached:
+            _VIDEO_ID_CACHE.move_to_end(indexed_asset_id)
+            VIDEO_ID_RESOLUTIONS["cache"] += 1
+    if cached:
+        return cached
+
+    video_id = _video_id_from_details(indexed_asset_details)
+    if video_id:
+        return _record_video_id(indexed_asset_id, video_id, "details")
 
-def _resolve_video_id(client: TwelveLabs, index_id: str, filename: str, indexed_asset_details) -> str:
+    try:
+        video = client.indexes.videos.retrieve(index_id, indexed_asset_id)
+    except Exception:  # noqa: BLE001 - not addressable as a video; fall through
+        video = None
+    if getattr(video, "id", None):
+        return _record_video_id(indexed_asset_id, str(video.id), "indexed_asset_id")
+
+    logger.warning("twelvelabs.video_id_fallback indexed_asset=%s filename=%s", indexed_asset_id, filename)
     response = client.indexes.videos.list(
         index_id=index_id,
         page=1,
@@ -149,36 +315,7 @@ def _resolve_video_id(client: TwelveLabs, index_id: str, filename: str, indexed_
     )
     for item in response:
         if item.id:
-            return item.id
-
-    system_metadata = getattr(indexed_asset_details, "system_metadata", None)
-    if system_metadata:
-        response = client.indexes.videos.list(
-            index_id=index_id,
-            page=1,
-            page_limit=5,
-            sort_by="created_at",
-            sort_option="desc",
-            duration=getattr(system_metadata, "duration", None),
-            fps=getattr(system_metadata, "fps", None),
-            width=getattr(system_metadata, "width", None),
-            height=getattr(system_metadata, "height", None),
-            size=getattr(system_metadata, "size", None),
-        )
-        for item in response:
-            if item.id:
-                return item.id
-
-    response = client.indexes.videos.list(
-        index_id=index_id,
-        page=1,
-        page_limit=1,
-        sort_by="created_at",
-        sort_option="desc",
-    )
-    for item in response:
-        if item.id:
-            return item.id
+            return _record_video_id(indexed_asset_id, str(item.id), "filename_scan")
 
     raise RuntimeError("Unable to resolve video_id after indexing.")
 
@@ -212,34 +349,292 @@ def _looks_like_webm(filename: str, mime_type: str) -> bool:
     return mime_type == "video/webm" or filename.lower().endswith(".webm")
 
 
+@dataclass(frozen=True)
+class MediaProbe:
+    video_codec: str | None
+    audio_codec: str | None
+    width: int | None
+    height: int | None
+    fps: float | None
+    bit_rate: int | None
+
+
+# Codecs that can be stream-copied into an MP4 container TwelveLabs accepts.
+_MP4_VIDEO_COPY_CODECS = {"h264", "hevc"}
+_MP4_AUDIO_COPY_CODECS = {"aac", "mp3"}
+
+
+def _probe_media(path: str | None = None, *, head: bytes | None = None) -> MediaProbe | None:
+    """
+    ffprobe the input (a local path, or the leading bytes of a piped stream — WebM/MP4
+    headers carry the codec info up front). None when ffprobe is unavailable or fails.
+    """
+    if not shutil.which("ffprobe") or (path is None and not head):
+        return None
+    cmd = ["ffprobe", "-v", "error", "-print_format", "json", "-show_streams", "-show_format", path or "pipe:0"]
+    try:
+        out = subprocess.run(
+            cmd,
+            input=head if path is None else None,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=30,
+        ).stdout
+        data = json.loads(out or b"{}")
+    except (subprocess.SubprocessError, ValueError):
+        return None
+
+    streams = data.get("streams") or []
+    video = next((st for st in streams if st.get("codec_type") == "video"), {})
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), {})
+
+    fps = None
+    rate = str(video.get("avg_frame_rate") or video.get("r_frame_rate") or "")
+    if "/" in rate:
+        num, den = rate.split("/", 1)
+        try:
+            fps = float(num) / float(den) if float(den) else None
+        except ValueError:
+            fps = None
+
+    def _int(value) -> int | None:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    return MediaProbe(
+        video_codec=video.get("codec_name"),
+        audio_codec=audio.get("codec_name"),
+        width=_int(video.get("width")),
+        height=_int(video.get("height")),
+        fps=fps,
+        bit_rate=_int((data.get("format") or {}).get("bit_rate")),
+    )
+
+
+def _transcode_args(probe: MediaProbe | None, *, profile: str | None = None) -> tuple[str, list[str]]:
+    """
+    Pick the cheapest ffmpeg strategy for the probed input:
+    - "remux": copy the video stream (and audio when MP4-compatible), no re-encode
+    - "fast": veryfast x264 with resolution/fps/bitrate caps
+    - "full": the original default-preset libx264/aac encode (unknown input)
+    TWELVELABS_TRANSCODE_PROFILE (or `profile`) forces a strategy; "auto" chooses.
+    """
+    profile = profile or settings.TWELVELABS_TRANSCODE_PROFILE
+    if profile not in ("remux", "fast", "full"):
+        if probe is None or not probe.video_codec:
+            profile = "full"
+        elif probe.video_codec in _MP4_VIDEO_COPY_CODECS:
+            profile = "remux"
+        else:
+            profile = "fast"
+
+    audio_args = ["-c:a", "aac"]
+    if probe is not None and probe.audio_codec in _MP4_AUDIO_COPY_CODECS:
+        audio_args = ["-c:a", "copy"]
+
+    if profile == "remux":
+        return profile, ["-c:v", "copy", *audio_args]
+    if profile == "fast":
+        max_height = settings.TWELVELABS_TRANSCODE_MAX_HEIGHT
+        max_fps = settings.TWELVELABS_TRANSCODE_MAX_FPS
+        args = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "28"]
+        max_bitrate = settings.TWELVELABS_TRANSCODE_MAX_BITRATE
+        args += ["-maxrate", max_bitrate, "-bufsize", max_bitrate]
+        if probe is None or probe.height is None or probe.height > max_height:
+            args += ["-vf", f"scale=-2:'min({max_height},ih)'"]
+        if probe is None or probe.fps is None or probe.fps > max_fps:
+            args += ["-r", str(max_fps)]
+        return profile, [*args, *audio_args]
+    return "full", ["-c:v", "libx264", "-c:a", "aac"]
+
+
+def _run_ffmpeg(src_path: str, dst_path: str, codec_args: list[str]) -> None:
+    cmd = ["ffmpeg", "-y", "-i", src_path, *codec_args, "-movflags", "+faststart", dst_path]
+    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _log_transcode(profile: str, src_bytes: int, dst_bytes: int) -> None:
+    logger.info(
+        "transcode profile=%s src_bytes=%d dst_bytes=%d bytes_saved=%d",
+        profile,
+        src_bytes,
+        dst_bytes,
+        src_bytes - dst_bytes,
+    )
+
+
+def _ffmpeg_error(exc: subprocess.CalledProcessError) -> RuntimeError:
+    return RuntimeError(f"ffmpeg failed to transcode recording: {(exc.stderr or b'').decode('utf-8', 'ignore')}")
+
+
 def _transcode_webm_to_mp4(*, handle, filename: str) -> tuple[object, str, str, list[str]]:
     if not shutil.which("ffmpeg"):
         raise RuntimeError("ffmpeg is required to transcode webm recordings for TwelveLabs.")
 
+    upload_name = os.path.splitext(filename)[0] + ".mp4"
+    if not settings.TWELVELABS_TRANSCODE_STREAMING:
+        upload_handle, cleanup_paths = _transcode_via_tempfiles(handle=handle, filename=filename)
+        return upload_handle, upload_name, "video/mp4", cleanup_paths
+    return _transcode_streaming(handle=handle), upload_name, "video/mp4", []
+
+
+def _transcode_via_tempfiles(*, handle, filename: str) -> tuple[object, list[str]]:
+    """Copy source to disk, encode to a faststart MP4 on disk, then upload that file."""
     src_suffix = os.path.splitext(filename)[1] or ".webm"
     with tempfile.NamedTemporaryFile(suffix=src_suffix, delete=False) as src:
         shutil.copyfileobj(handle, src)
         src_path = src.name
 
     dst_path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
+    probe = _probe_media(src_path)
+    profile, codec_args = _transcode_args(probe)
+    try:
+        _run_ffmpeg(src_path, dst_path, codec_args)
+    except subprocess.CalledProcessError as exc:
+        if profile != "remux":
+            raise _ffmpeg_error(exc) from exc
+        # Stream copy can trip over odd MediaRecorder timestamps; fall back to a capped encode.
+        profile, codec_args = _transcode_args(probe, profile="fast")
+        try:
+            _run_ffmpeg(src_path, dst_path, codec_args)
+        except subprocess.CalledProcessError as retry_exc:
+            raise _ffmpeg_error(retry_exc) from retry_exc
+
+    _log_transcode(profile, os.path.getsize(src_path), os.path.getsize(dst_path))
+    return open(dst_path, "rb"), [src_path, dst_path]
+
+
+_PROBE_HEAD_BYTES = 2 * 1024 * 1024
+_PIPE_CHUNK_BYTES = 1024 * 1024
+
+
+def _local_path(handle) -> str | None:
+    """Filesystem path behind a storage handle, so ffmpeg can read it directly (no copy)."""
+    name = getattr(handle, "name", None)
+    if isinstance(name, str) and os.path.isabs(name) and os.path.isfile(name):
+        return name
+    return None
+
+
+def _transcode_streaming(*, handle):
+    """
+    Pipe the stored recording through ffmpeg without copying the source to disk: local files
+    are read by ffmpeg directly, remote handles are fed to stdin by a writer thread while it
+    encodes. Fragmented MP4 on stdout is spooled (memory up to TL_TRANSCODE_SPOOL_BYTES, disk
+    beyond, never more than TL_TRANSCODE_MAX_OUTPUT_BYTES) and the upload only starts once
+    ffmpeg has finished: the SDK's direct upload needs a complete file, and a failed remux has
+    to be retryable before anything is sent.
+    """
+    src_path = _local_path(handle)
+    head = b""
+    if src_path:
+        probe = _probe_media(src_path)
+    else:
+        head = handle.read(_PROBE_HEAD_BYTES)
+        probe = _probe_media(head=head)
+
+    profile, codec_args = _transcode_args(probe)
+    try:
+        out, src_bytes = _ffmpeg_pipe(handle=handle, head=head, src_path=src_path, codec_args=codec_args)
+    except subprocess.CalledProcessError as exc:
+        can_rewind = src_path is not None or _rewind(handle)
+        if profile != "remux" or not can_rewind:
+            raise _ffmpeg_error(exc) from exc
+        profile, codec_args = _transcode_args(probe, profile="fast")
+        try:
+            out, src_bytes = _ffmpeg_pipe(handle=handle, head=b"", src_path=src_path, codec_args=codec_args)
+        except subprocess.CalledProcessError as retry_exc:
+            raise _ffmpeg_error(retry_exc) from retry_exc
+
+    _log_transcode(profile, src_bytes, out.tell())
+    out.seek(0)
+    return out
+
+
+def _rewind(handle) -> bool:
+    try:
+        handle.seek(0)
+        return True
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _ffmpeg_pipe(*, handle, head: bytes, src_path: str | None, codec_args: list[str]):
+    """Run one ffmpeg pass; returns (spooled fragmented-MP4 output, source bytes read)."""
     cmd = [
         "ffmpeg",
         "-y",
         "-i",
-        src_path,
-        "-c:v",
-        "libx264",
-        "-c:a",
-        "aac",
+        src_path or "pipe:0",
+        *codec_args,
+        "-f",
+        "mp4",
         "-movflags",
-        "+faststart",
-        dst_path,
+        "frag_keyframe+empty_moov+default_base_moof",
+        "pipe:1",
     ]
-    try:
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"ffmpeg failed to transcode recording: {exc.stderr.decode('utf-8', 'ignore')}") from exc
+    out = tempfile.SpooledTemporaryFile(max_size=settings.TWELVELABS_TRANSCODE_SPOOL_BYTES)
+    fed = {"bytes": os.path.getsize(src_path) if src_path else 0, "error": None}
+    max_output = settings.TWELVELABS_TRANSCODE_MAX_OUTPUT_BYTES
+
+    with tempfile.TemporaryFile() as errlog:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL if src_path else subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=errlog,
+        )
 
-    upload_handle = open(dst_path, "rb")
-    upload_name = os.path.splitext(filename)[0] + ".mp4"
-    return upload_handle, upload_name, "video/mp4", [src_path, dst_path]
+        def _feed():
+            try:
+                # The remux -> encode retry rewinds the handle and passes no head: start reading there.
+                chunk = head or handle.read(_PIPE_CHUNK_BYTES)
+                while chunk:
+                    proc.stdin.write(chunk)
+                    fed["bytes"] += len(chunk)
+                    chunk = handle.read(_PIPE_CHUNK_BYTES)
+            except (BrokenPipeError, ValueError):
+                pass  # ffmpeg exited early; its return code reports why
+            except Exception as exc:  # noqa: BLE001 - re-raised after join
+                # A failed storage read would otherwise look like a normal end of input to ffmpeg.
+                fed["error"] = exc
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        feeder = None
+        if not src_path:
+            feeder = threading.Thread(target=_feed, name="ffmpeg-stdin", daemon=True)
+            feeder.start()
+        written = 0
+        try:
+            for chunk in iter(lambda: proc.stdout.read(_PIPE_CHUNK_BYTES), b""):
+                written += len(chunk)
+                if written > max_output:
+                    proc.kill()
+                    break
+                out.write(chunk)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+            if feeder is not None:
+                feeder.join()
+
+        if fed["error"] is not None:
+            out.close()
+            raise RuntimeError(
+                f"Reading the recording failed after {fed['bytes']} bytes: {fed['error']}"
+            ) from fed["error"]
+        if written > max_output:
+            out.close()
+            raise RuntimeError(f"Transcoded recording exceeds the {max_output} byte upload limit.")
+        if returncode != 0:
+            out.close()
+            errlog.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=errlog.read())
+    return out, fed["bytes"]
@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import os
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+from django.db import transaction
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+from api.models import Interview, RecordingStream, UploadSession
+from api.services.storage import HASH_CHUNK_BYTES
+
+# Magic bytes for the containers MediaRecorder / phones produce.
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"  # WebM / Matroska
+
+
+def sniff_video_type(head: bytes) -> str | None:
+    """Best-effort container sniff from the first bytes of a recording."""
+    if head.startswith(_EBML_MAGIC):
+        return "video/webm"
+    if len(head) >= 8 and head[4:8] == b"ftyp":
+        return "video/mp4"
+    return None
+
+
+class RecordingUploadHandler(TemporaryFileUploadHandler):
+    """
+    Multipart handler for interview recordings. Chunks go straight to a temp file on disk
+    (never the whole body in memory) and, in the same pass, the size limit is enforced,
+    a SHA-256 is computed and the container is sniffed from the first bytes. The completed
+    file carries `.sha256` and `.sniffed_type`; FileSystemStorage.save() then moves it
+    into place without re-reading it.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(self, request=None, *, max_bytes: int | None = None):
+        super().__init__(request)
+        self.max_bytes = max_bytes or settings.INTERVIEW_UPLOAD_MAX_BYTES
+        self.exceeded = False
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length and content_length > self.max_bytes + 64 * 1024:  # allow multipart framing
+            # Declared body is already too big: skip parsing entirely (nothing is read).
+            self.exceeded = True
+            return QueryDict(), MultiValueDict()
+        return None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self._digest = hashlib.sha256()
+        self._received = 0
+        self._head = b""
+
+    def receive_data_chunk(self, raw_data, start):
+        self._received += len(raw_data)
+        if self._received > self.max_bytes:
+            self.exceeded = True
+            raise StopUpload(connection_reset=True)
+        if len(self._head) < 16:
+            self._head += raw_data[: 16 - len(self._head)]
+        self._digest.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        uploaded.sha256 = self._digest.hexdigest()
+        uploaded.sniffed_type = sniff_video_type(self._head)
+        return uploaded
+
+
+# --- Resumable chunked uploads ---------------------------------------------------------
+
+MIN_CHUNK_BYTES = 256 * 1024
+
+
+class ChunkRejected(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class AssembledRecording:
+    file: TemporaryUploadedFile
+    size: int
+    sha256: str
+    content_type: str | None
+
+
+def start_session(interview: Interview, *, total_size: int, chunk_size: int | None = None) -> UploadSession:
+    """
+    Open a resumable upload for `interview`. Any earlier unfinished session for the same
+    interview is discarded along with its parts.
+    """
+    if total_size <= 0:
+        raise ChunkRejected("total_size must be a positive byte count.")
+    if total_size > settings.INTERVIEW_UPLOAD_MAX_BYTES:
+        raise ChunkRejected(f"Recording exceeds the {settings.INTERVIEW_UPLOAD_MAX_BYTES} byte limit.")
+    chunk_size = min(
+        max(chunk_size or settings.INTERVIEW_UPLOAD_CHUNK_BYTES, MIN_CHUNK_BYTES),
+        settings.INTERVIEW_UPLOAD_CHUNK_BYTES,
+    )
+
+    for stale in UploadSession.objects.filter(interview=interview, status=UploadSession.Status.OPEN):
+        discard_session(stale)
+    return UploadSession.objects.create(interview=interview, total_size=total_size, chunk_size=chunk_size)
+
+
+def write_chunk(session: UploadSession, index: int, stream, *, content_length: int | None) -> UploadSession:
+    """
+    Store chunk `index` from a raw request body stream. The body is copied to disk in
+    bounded reads and must be exactly the chunk's expected length. Re-sending a chunk
+    replaces it, so clients can retry blindly after a dropped connection.
+    """
+    if session.status != UploadSession.Status.OPEN:
+        raise ChunkRejected("Upload session is already finalized.")
+    if not 0 <= index < session.total_chunks:
+        raise ChunkRejected(f"Chunk index must be between 0 and {session.total_chunks - 1}.")
+    expected = session.expected_chunk_size(index)
+    if content_length is not None and content_length != expected:
+        raise ChunkRejected(f"Chunk {index} must be exactly {expected} bytes.")
+
+    part = TemporaryUploadedFile(f"{index:06d}.part", "application/octet-stream", 0, None)
+    try:
+        received = 0
+        while received <= expected:
+            block = stream.read(min(HASH_CHUNK_BYTES, expected + 1 - received))
+            if not block:
+                break
+            part.write(block)
+            received += len(block)
+        if received != expected:
+            raise ChunkRejected(f"Chunk {index} must be exactly {expected} bytes (got {received}).")
+        part.size = received
+        part.flush()
+
+        _store_part(session.part_key(index), part)
+    finally:
+        part.close()
+
+    with transaction.atomic():
+        locked = UploadSession.objects.select_for_update().get(id=session.id)
+        if index not in locked.received_chunks:
+            locked.received_chunks = sorted([*locked.received_chunks, index])
+            locked.save(update_fields=["received_chunks", "updated_at"])
+    return locked
+
+
+def _store_part(key: str, part) -> None:
+    """
+    Save under a unique temp name, then rename over `key`. Two concurrent re-sends of the
+    same chunk each replace it whole; with exists/delete/save one of them could end up under
+    a suffixed name (get_available_name) that assembly never reads.
+    """
+    tmp_key = default_storage.save(f"{key}.{uuid.uuid4().hex}.tmp", part)
+    try:
+        os.replace(default_storage.path(tmp_key), default_storage.path(key))
+    except BaseException:
+        default_storage.delete(tmp_key)
+        raise
+
+
+def received_ranges(session: UploadSession) -> list[list[int]]:
+    """Merge received chunk indices into half-open byte ranges, e.g. [[0, 16777216]]."""
+    ranges: list[list[int]] = []
+    for index in session.received_chunks:
+        start = index * session.chunk_size
+        end = start + session.expected_chunk_size(index)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+    return ranges
+
+
+def missing_chunks(session: UploadSession) -> list[int]:
+    received = set(session.received_chunks)
+    return [i for i in range(session.total_chunks) if i not in received]
+
+
+def describe_session(session: UploadSession) -> dict:
+    return {
+        "upload_id": str(session.id),
+        "status": session.status,
+        "total_size": session.total_size,
+        "chunk_size": session.chunk_size,
+        "total_chunks": session.total_chunks,
+        "received_chunks": list(session.received_chunks),
+        "received_ranges": received_ranges(session),
+        "missing_chunks": missing_chunks(session),
+    }
+
+
+def assemble_session(session: UploadSession) -> AssembledRecording:
+    """
+    Concatenate the stored parts, in order, into a single temp file while hashing and
+    sniffing it. Parts are streamed through in HASH_CHUNK_BYTES reads, so the recording is
+    never held in memory; the returned file can be handed straight to storage.save().
+    """
+    missing = missing_chunks(session)
+    if missing:
+        raise ChunkRejected(f"Upload is incomplete; missing chunks {missing[:20]}.")
+
+    out = TemporaryUploadedFile("recording", "application/octet-stream", 0, None)
+    digest = hashlib.sha256()
+    head = b""
+    size = 0
+    try:
+        for index in range(session.total_chunks):
+            with default_storage.open(session.part_key(index), "rb") as part:
+                for block in iter(lambda: part.read(HASH_CHUNK_BYTES), b""):
+                    if len(head) < 16:
+                        head += block[: 16 - len(head)]
+                    digest.update(block)
+                    out.write(block)
+                    size += len(block)
+        out.flush()
+    except Exception:
+        out.close()
+        raise
+    if size != session.total_size:
+        out.close()
+        raise ChunkRejected(f"Assembled {size} bytes but {session.total_size} were declared.")
+    out.size = size
+    return AssembledRecording(file=out, size=size, sha256=digest.hexdigest(), content_type=sniff_video_type(head))
+
+
+def discard_session(session: UploadSession) -> None:
+    """Delete a session's stored parts and the session row itself."""
+    for index in range(session.total_chunks):
+        key = session.part_key(index)
+        try:
+            if default_storage.exists(key):
+                default_storage.delete(key)
+        except Exception:  # noqa: BLE001 - orphaned parts are harmless
+            pass
+    session.delete()
+
+
+# --- Progressive uploads while recording ------------------------------------------------
+
+
+def start_stream(interview: Interview, *, content_type: str = "video/webm") -> RecordingStream:
+    """
+    Begin a progressive upload. Segments are appended to an (initially empty) object in
+    default storage; any earlier unsubmitted stream for the interview is discarded.
+    """
+    for stale in RecordingStream.objects.filter(interview=interview):
+        discard_stream(stale)
+    stream = RecordingStream(interview=interview)
+    ext = "webm" if "webm" in (content_type or "webm") else "mp4"
+    stream.object_key = default_storage.save(
+        f"local/interviews/{interview.user_id}/{interview.id}/{stream.id}.{ext}", ContentFile(b"")
+    )
+    stream.save()
+    return stream
+
+
+def _copy_limited(source, target, *, limit: int, digest=None) -> int:
+    """Copy `source` into `target` in bounded reads; ChunkRejected once more than `limit` bytes arrive."""
+    copied = 0
+    for block in iter(lambda: source.read(HASH_CHUNK_BYTES), b""):
+        copied += len(block)
+        if copied > limit:
+            raise ChunkRejected(f"Recording exceeds the {settings.INTERVIEW_UPLOAD_MAX_BYTES} byte limit.")
+        target.write(block)
+        if digest is not None:
+            digest.update(block)
+    return copied
+
+
+# Running sha256 of each open stream's recording, per process: stream id -> (size_bytes, hasher).
+# Segments are hashed as they are appended; a worker that didn't append the previous segment
+# rebuilds the hasher from the file once and carries on from there.
+_stream_digests: OrderedDict[str, tuple[int, object]] = OrderedDict()
+_stream_digests_lock = threading.Lock()
+_MAX_STREAM_DIGESTS = 256
+
+
+def _stream_digest(stream: RecordingStream):
+    with _stream_digests_lock:
+        entry = _stream_digests.get(str(stream.id))
+    if entry is not None and entry[0] == stream.size_bytes:
+        return entry[1].copy()
+    digest = hashlib.sha256()
+    remaining = stream.size_bytes
+    if remaining:
+        with default_storage.open(stream.object_key, "rb") as handle:
+            while remaining > 0:
+                block = handle.read(min(HASH_CHUNK_BYTES, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+    return digest
+
+
+def _remember_digest(stream: RecordingStream, digest) -> None:
+    with _stream_digests_lock:
+        key = str(stream.id)
+        _stream_digests[key] = (stream.size_bytes, digest)
+        _stream_digests.move_to_end(key)
+        while len(_stream_digests) > _MAX_STREAM_DIGESTS:
+            _stream_digests.popitem(last=False)
+
+
+def _forget_digest(stream: RecordingStream) -> None:
+    with _stream_digests_lock:
+        _stream_digests.pop(str(stream.id), None)
+
+
+def _truncate(stream: RecordingStream, size: int) -> None:
+    with default_storage.open(stream.object_key, "r+b") as handle:
+        handle.truncate(size)
+
+
+def _append(stream: RecordingStream, source, digest) -> None:
+    with default_storage.open(stream.object_key, "ab") as target:
+        stream.size_bytes += _copy_limited(
+            source, target, limit=settings.INTERVIEW_UPLOAD_MAX_BYTES - stream.size_bytes, digest=digest
+        )
+
+
+def _receive_segment(index: int, body) -> TemporaryUploadedFile:
+    """Read the whole segment off the request into a local temp file (before any lock is taken)."""
+    segment = TemporaryUploadedFile(f"{index:06d}.seg", "application/octet-stream", 0, None)
+    try:
+        segment.size = _copy_limited(body, segment, limit=settings.INTERVIEW_UPLOAD_MAX_BYTES)
+        segment.flush()
+        segment.seek(0)
+    except BaseException:
+        segment.close()
+        raise
+    return segment
+
+
+def append_segment(stream: RecordingStream, index: int, body, *, final: bool = False) -> RecordingStream:
+    """
+    Append MediaRecorder segment `index` to the stream's object. Segments must end up in
+    order, so one that arrives early is parked until the gap fills; duplicates (client
+    retries) are ignored. The body is fully received into a temp file first, so the row lock
+    that serializes appends is only held for local copies. If anything fails once appending
+    has started, the recording is cut back to its committed size, so a retried segment is
+    never written twice. The recording is hashed as segments are appended; when the `final`
+    segment lands it is sniffed and ready for processing.
+    """
+    segment = _receive_segment(index, body)
+    consumed_parked: list[str] = []
+    try:
+        with transaction.atomic():
+            stream = RecordingStream.objects.select_for_update().get(id=stream.id)
+            if stream.status != RecordingStream.Status.OPEN:
+                raise ChunkRejected("Recording is already complete.")
+            if final:
+                if stream.final_segment is not None and stream.final_segment != index:
+                    raise ChunkRejected(f"Segment {stream.final_segment} was already marked final.")
+                stream.final_segment = index
+            if stream.final_segment is not None and index > stream.final_segment:
+                raise ChunkRejected(f"Segment {index} comes after the final segment {stream.final_segment}.")
+
+            committed_size = stream.size_bytes
+            digest = None
+            try:
+                if index == stream.next_segment:
+                    digest = _stream_digest(stream)
+                    _append(stream, segment, digest)
+                    stream.next_segment += 1
+                    while stream.next_segment in stream.pending_segments:
+                        key = stream.segment_key(stream.next_segment)
+                        with default_storage.open(key, "rb") as parked:
+                            _append(stream, parked, digest)
+                        consumed_parked.append(key)
+                        stream.pending_segments = [i for i in stream.pending_segments if i != stream.next_segment]
+                        stream.next_segment += 1
+                elif index > stream.next_segment and index not in stream.pending_segments:
+                    default_storage.save(stream.segment_key(index), segment)
+                    stream.pending_segments = sorted([*stream.pending_segments, index])
+
+                if stream.final_segment is not None and stream.next_segment > stream.final_segment:
+                    _complete_stream(stream, digest)
+                stream.save()
+            except BaseException:
+                # The row update rolls back; make the file agree with it. Always cut back: a copy
+                # that failed partway has written blocks that size_bytes doesn't count yet.
+                _forget_digest(stream)
+                _truncate(stream, committed_size)
+                raise
+    finally:
+        segment.close()
+
+    if stream.status == RecordingStream.Status.COMPLETE:
+        _forget_digest(stream)
+    elif digest is not None:
+        _remember_digest(stream, digest)
+    # Only drop parked segments once the append that consumed them is committed.
+    for key in consumed_parked:
+        default_storage.delete(key)
+    return stream
+
+
+def _complete_stream(stream: RecordingStream, digest) -> None:
+    if digest is None:
+        digest = _stream_digest(stream)
+    with default_storage.open(stream.object_key, "rb") as handle:
+        head = handle.read(16)
+    stream.sha256 = digest.hexdigest()
+    stream.mime_type = sniff_video_type(head) or ""
+    stream.status = RecordingStream.Status.COMPLETE
+
+
+def describe_stream(stream: RecordingStream) -> dict:
+    return {
+        "stream_id": str(stream.id),
+        "status": stream.status,
+        "next_segment": stream.next_segment,
+        "pending_segments": list(stream.pending_segments),
+        "final_segment": stream.final_segment,
+        "size_bytes": stream.size_bytes,
+    }
+
+
+def discard_stream(stream: RecordingStream, *, keep_object: bool = False) -> None:
+    """Delete a stream's parked segments (and its recording unless `keep_object`) and the row."""
+    _forget_digest(stream)
+    keys = [stream.segment_key(i) for i in stream.pending_segments]
+    if not keep_object:
+        keys.append(stream.object_key)
+    for key in keys:
+        try:
+            if default_storage.exists(key):
+                default_storage.delete(key)
+        except Exception:  # noqa: BLE001 - orphaned files are harmless
+            pass
+    stream.delete()
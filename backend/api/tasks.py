@@ -1,69 +1,595 @@
 from __future__ import annotations
 
-from celery import shared_task
+import logging
+import time
+
+from celery import Task, chain, shared_task
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
-from api.models import Interview, InterviewQuestion
-from api.services.ai import classify_archetype, generate_interview_feedback, score_job_fit
-from api.services.twelvelabs import DEFAULT_ANALYSIS_PROMPT, analyze_video_from_storage
+from api.models import Interview, InterviewQuestion, Job, JobImport
+from api.services import analysis_cache
+from api.services.ai import (
+    ARCHETYPE_FALLBACK,
+    FEEDBACK_FALLBACK,
+    classify_archetype,
+    gather_llm_calls,
+    generate_behavioral_questions,
+    generate_interview_feedback,
+    review_interview,
+    score_job_fit,
+)
+from api.services.job_import import scrape_concurrently
+from api.services.job_pages import get_job_page, normalize_url
+from api.services.stats import record_feedback_change, record_questions_added
+from api.services.status_events import publish_status
+from api.services.twelvelabs import (
+    DEFAULT_ANALYSIS_PROMPT,
+    ProcessingFailed,
+    TwelveLabsResult,
+    analyze_video,
+    check_asset_ready,
+    check_indexed_asset_ready,
+    fetch_indexed_video,
+    get_client,
+    get_index_id,
+    index_asset,
+    poll_delay,
+    upload_asset,
+    wait_for_asset_ready,
+    wait_for_indexed_asset_ready,
+)
 
+logger = logging.getLogger(__name__)
 
-@shared_task(bind=True, max_retries=2, default_retry_delay=10)
-def process_interview(self, interview_id: str) -> None:
+
+class InterviewStageTask(Task):
+    """
+    Base for process_interview pipeline stages. Stages auto-retry with backoff; only once
+    a stage has exhausted its retries is the interview marked FAILED (and the chain stops).
+    """
+
+    autoretry_for = (Exception,)
+    retry_backoff = True
+    retry_backoff_max = 300
+    retry_jitter = True
+
+    def retry(self, *args, exc=None, **kwargs):
+        # Inline (eager) runs have no broker to back off on; fail fast instead of re-running in-process.
+        if self.request.is_eager and exc is not None:
+            raise exc
+        return super().retry(*args, exc=exc, **kwargs)
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        interview_id = args[0] if args else kwargs.get("interview_id")
+        _mark_failed(interview_id, exc)
+
+
+def _mark_failed(interview_id: str, exc: BaseException) -> None:
+    interview = Interview.objects.filter(id=interview_id).first()
+    if interview is None:
+        return
+    failure = {"error": str(exc)}
+    with transaction.atomic():
+        record_feedback_change(user_id=interview.user_id, old_feedback=interview.ai_feedback, new_feedback=failure)
+        interview.status = Interview.Status.FAILED
+        interview.ai_feedback = failure
+        interview.save(update_fields=["status", "ai_feedback", "updated_at"])
+        publish_status(interview)
+
+
+class QuestionGenerationTask(InterviewStageTask):
+    """
+    Question generation retries like a pipeline stage. Once out of retries the interview is
+    marked FAILED, unless it already moved past GENERATING (e.g. a duplicate delivery won).
+    """
+
+    retry_backoff_max = 60
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        interview_id = args[0] if args else kwargs.get("interview_id")
+        failed = Interview.objects.filter(id=interview_id, status=Interview.Status.GENERATING).update(
+            status=Interview.Status.FAILED, ai_feedback={"error": str(exc)}, updated_at=timezone.now()
+        )
+        if failed:
+            interview = Interview.objects.filter(id=interview_id).first()
+            if interview is not None:
+                publish_status(interview)
+
+
+@shared_task(bind=True, base=QuestionGenerationTask, max_retries=2)
+def generate_interview_questions(self, interview_id: str) -> None:
+    """
+    Scrape the job description (if any) and generate the interview's questions.
+    Runs outside the create request; flips GENERATING -> QUESTIONS_READY when done.
+    """
     try:
-        interview = Interview.objects.select_related("job", "user").get(id=interview_id)
+        interview = Interview.objects.select_related("job").get(id=interview_id)
     except Interview.DoesNotExist:
         return
+    if interview.status != Interview.Status.GENERATING:
+        return
 
-    if not interview.video_object_key:
-        interview.status = Interview.Status.FAILED
-        interview.ai_feedback = {"error": "No video_object_key on interview; cannot process."}
-        interview.save(update_fields=["status", "ai_feedback", "updated_at"])
+    job = interview.job
+    if job and job.url and not job.description and not job.page_id:
+        # Shared, URL-normalized cache: popular postings are scraped once, not once per user.
+        try:
+            job.page = get_job_page(job.url)
+        except Exception:
+            job.page = None
+        if job.page is not None:
+            job.save(update_fields=["page"])
+
+    generated = generate_behavioral_questions(
+        job_url=(job.url if job else None) or None,
+        company=(job.company if job else None) or None,
+        title=(job.title if job else None) or None,
+        job_description=(job.description_text if job else None),
+    )
+
+    with transaction.atomic():
+        # Re-check under lock so a retry or duplicate delivery never doubles the questions.
+        locked = Interview.objects.select_for_update().filter(id=interview.id).first()
+        if locked is None or locked.status != Interview.Status.GENERATING:
+            return
+        InterviewQuestion.objects.bulk_create(
+            [
+                InterviewQuestion(
+                    interview=locked,
+                    order=idx,
+                    prompt=q.get("prompt", ""),
+                    competency=q.get("competency", ""),
+                )
+                for idx, q in enumerate(generated.questions)
+            ]
+        )
+        locked.generated_questions = generated.questions
+        locked.status = Interview.Status.QUESTIONS_READY
+        locked.save(update_fields=["generated_questions", "status", "updated_at"])
+        record_questions_added(
+            user_id=locked.user_id, competencies=[q.get("competency", "") for q in generated.questions]
+        )
+        publish_status(locked)
+
+
+@shared_task(bind=True, max_retries=0)
+def import_jobs(self, import_id: str) -> None:
+    """
+    Scrape every URL of a JobImport concurrently (global and per-host caps), then insert the
+    new Job rows in one bulk_create and record a result per URL. Title and company come from
+    the page's JSON-LD posting when it has one.
+    """
+    job_import = JobImport.objects.filter(id=import_id, status=JobImport.Status.QUEUED).first()
+    if job_import is None:
         return
+    job_import.status = JobImport.Status.RUNNING
+    job_import.save(update_fields=["status", "updated_at"])
 
     try:
-        interview.status = Interview.Status.PROCESSING
-        interview.save(update_fields=["status", "updated_at"])
+        existing = {
+            normalize_url(url) for url in Job.objects.filter(user_id=job_import.user_id).values_list("url", flat=True)
+        }
+        results: list[dict] = []
+        to_scrape: list[str] = []
+        for url in job_import.urls:
+            if normalize_url(url) in existing:
+                results.append({"url": url, "status": "duplicate", "job_id": None, "error": ""})
+            else:
+                existing.add(normalize_url(url))
+                to_scrape.append(url)
 
-        first_question = (
-            InterviewQuestion.objects.filter(interview=interview).order_by("order").values_list("prompt", flat=True).first()
+        scraped = scrape_concurrently(
+            to_scrape,
+            get_job_page,
+            max_workers=settings.JOB_IMPORT_CONCURRENCY,
+            per_host=settings.JOB_IMPORT_PER_HOST_CONCURRENCY,
         )
-        analysis_prompt = DEFAULT_ANALYSIS_PROMPT
-        if first_question:
-            analysis_prompt = f"Question: {first_question}\n\n{DEFAULT_ANALYSIS_PROMPT}"
-
-        result = analyze_video_from_storage(
-            object_key=interview.video_object_key,
-            filename=interview.video_object_key.split("/")[-1],
-            prompt=analysis_prompt,
+        jobs = []
+        for url in to_scrape:
+            page, error = scraped[url]
+            if page is None:
+                results.append({"url": url, "status": "failed", "job_id": None, "error": error})
+                continue
+            job = Job(user_id=job_import.user_id, url=url, title=page.title, company=page.company, page=page)
+            jobs.append(job)
+            results.append({"url": url, "status": "created", "job_id": str(job.id), "error": ""})
+        Job.objects.bulk_create(jobs)
+
+        order = {url: i for i, url in enumerate(job_import.urls)}
+        job_import.results = sorted(results, key=lambda r: order.get(r["url"], 0))
+        job_import.status = JobImport.Status.COMPLETE
+    except Exception as exc:  # noqa: BLE001 - surface the failure on the import itself
+        job_import.results = [{"url": None, "status": "failed", "job_id": None, "error": str(exc)}]
+        job_import.status = JobImport.Status.FAILED
+    job_import.save(update_fields=["status", "results", "updated_at"])
+
+
+def _load(interview_id: str) -> Interview | None:
+    return Interview.objects.select_related("job", "user").filter(id=interview_id).first()
+
+
+def _checkpoint(interview: Interview, **fields) -> None:
+    for name, value in fields.items():
+        setattr(interview, name, value)
+    interview.save(update_fields=[*fields, "updated_at"])
+
+
+def _video_filename(interview: Interview) -> str:
+    return interview.video_object_key.split("/")[-1]
+
+
+def _analysis_prompt(interview: Interview, *, question: str | None = None) -> str:
+    if question is None:
+        question = (
+            InterviewQuestion.objects.filter(interview=interview)
+            .order_by("order")
+            .values_list("prompt", flat=True)
+            .first()
         )
-        transcript = result.transcript
-        feedback_details = generate_interview_feedback(transcript=transcript, analysis=result.analysis)
-        feedback = {
-            "summary": result.analysis,
-            "strengths": feedback_details.get("strengths", []),
-            "weaknesses": feedback_details.get("weaknesses", []),
-        }
-        archetype = classify_archetype(transcript=transcript, analysis=result.analysis)
+    if question:
+        return f"Question: {question}\n\n{DEFAULT_ANALYSIS_PROMPT}"
+    return DEFAULT_ANALYSIS_PROMPT
 
-        traits = getattr(getattr(interview.user, "personality_profile", None), "traits", {}) or {}
-        job_payload = {
-            "url": interview.job.url if interview.job else "",
-            "company": interview.job.company if interview.job else "",
-            "title": interview.job.title if interview.job else "",
-        }
-        fit = score_job_fit(traits=traits, job=job_payload)
-
-        with transaction.atomic():
-            interview.transcript_text = transcript
-            interview.ai_feedback = feedback
-            interview.personality_fit = {"job_fit": fit, "archetype": archetype}
-            interview.status = Interview.Status.COMPLETE
-            interview.save(
-                update_fields=["transcript_text", "ai_feedback", "personality_fit", "status", "updated_at"]
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=10)
+def process_interview(self, interview_id: str) -> None:
+    """
+    Entry point: validates the interview, resets stale checkpoints and launches the staged chain
+    upload -> wait -> index -> wait -> resolve -> analyze -> finalize, starting at the first stage
+    whose checkpoint is still empty, so re-queuing an interview resumes where it left off.
+    """
+    interview = _load(interview_id)
+    if interview is None:
+        return
+
+    if not interview.video_object_key:
+        _mark_failed(interview_id, RuntimeError("No video_object_key on interview; cannot process."))
+        return
+
+    # personality_fit is rebuilt by this run (job fit now, archetype at finalize).
+    fields = {"status": Interview.Status.PROCESSING, "personality_fit": {}}
+    if interview.pipeline_object_key != interview.video_object_key:
+        # New recording: previous checkpoints belong to a different video.
+        fields.update(
+            pipeline_object_key=interview.video_object_key,
+            twelvelabs_asset_id="",
+            twelvelabs_asset_ready_at=None,
+            twelvelabs_indexed_asset_id="",
+            twelvelabs_indexed_ready_at=None,
+            twelvelabs_video_id="",
+            analysis_text="",
+        )
+    if not fields.get("analysis_text", interview.analysis_text):
+        # Identical bytes analyzed with the same prompt before: reuse it and go straight to finalize.
+        cached = analysis_cache.lookup(content_sha256=interview.video_sha256, prompt=_analysis_prompt(interview))
+        if cached is not None:
+            fields.update(
+                transcript_text=cached.transcript, twelvelabs_video_id=cached.video_id, analysis_text=cached.analysis
             )
-    except Exception as exc:  # noqa: BLE001 - boilerplate task wrapper
-        interview.status = Interview.Status.FAILED
-        interview.ai_feedback = {"error": str(exc)}
-        interview.save(update_fields=["status", "ai_feedback", "updated_at"])
+    _checkpoint(interview, **fields)
+    publish_status(interview)
+
+    interview_score_job_fit.delay(interview_id)
+    _pipeline(interview_id, start=_first_pending_stage(interview)).apply_async()
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=3)
+def interview_upload_asset(self, interview_id: str) -> None:
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    if not interview.twelvelabs_asset_id:
+        asset_id = upload_asset(
+            get_client(), object_key=interview.video_object_key, filename=_video_filename(interview)
+        )
+        _checkpoint(interview, twelvelabs_asset_id=asset_id)
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=3)
+def interview_index_asset(self, interview_id: str) -> None:
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    if not interview.twelvelabs_indexed_asset_id:
+        indexed_asset_id = index_asset(get_client(), index_id=get_index_id(), asset_id=interview.twelvelabs_asset_id)
+        _checkpoint(interview, twelvelabs_indexed_asset_id=indexed_asset_id)
+
+
+@shared_task(bind=True, base=InterviewStageTask, autoretry_for=(), max_retries=None)
+def interview_wait_asset_ready(self, interview_id: str, started_at: float | None = None, attempt: int = 0) -> None:
+    _await_ready(
+        self,
+        interview_id,
+        ready_field="twelvelabs_asset_ready_at",
+        check=lambda client, interview: check_asset_ready(client, interview.twelvelabs_asset_id),
+        block=lambda client, interview: wait_for_asset_ready(client, interview.twelvelabs_asset_id),
+        started_at=started_at,
+        attempt=attempt,
+    )
+
+
+@shared_task(bind=True, base=InterviewStageTask, autoretry_for=(), max_retries=None)
+def interview_wait_indexed_ready(self, interview_id: str, started_at: float | None = None, attempt: int = 0) -> None:
+    _await_ready(
+        self,
+        interview_id,
+        ready_field="twelvelabs_indexed_ready_at",
+        check=lambda client, interview: check_indexed_asset_ready(
+            client, get_index_id(), interview.twelvelabs_indexed_asset_id
+        ),
+        block=lambda client, interview: wait_for_indexed_asset_ready(
+            client, get_index_id(), interview.twelvelabs_indexed_asset_id
+        ),
+        started_at=started_at,
+        attempt=attempt,
+    )
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=5, retry_backoff=5)
+def interview_resolve_video(self, interview_id: str) -> None:
+    interview = _load(interview_id)
+    if interview is None or interview.twelvelabs_video_id:
+        return
+    transcript, video_id = fetch_indexed_video(
+        get_client(),
+        index_id=get_index_id(),
+        indexed_asset_id=interview.twelvelabs_indexed_asset_id,
+        filename=_video_filename(interview),
+    )
+    _checkpoint(interview, transcript_text=transcript, twelvelabs_video_id=video_id)
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=3, retry_backoff=15)
+def interview_analyze_video(self, interview_id: str) -> None:
+    interview = _load(interview_id)
+    if interview is None or interview.analysis_text:
+        return
+    analysis_prompt = _analysis_prompt(interview)
+    analysis = analyze_video(get_client(), video_id=interview.twelvelabs_video_id, prompt=analysis_prompt)
+    analysis_cache.store(
+        content_sha256=interview.video_sha256,
+        prompt=analysis_prompt,
+        result=TwelveLabsResult(
+            transcript=interview.transcript_text, analysis=analysis, video_id=interview.twelvelabs_video_id
+        ),
+    )
+    _checkpoint(interview, analysis_text=analysis)
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=10)
+def reanalyze_interview(
+    self, interview_id: str, prompt: str | None = None, question_id: str | None = None
+) -> None:
+    """
+    Re-run only the analysis for an already indexed recording: `client.analyze` against the
+    stored TwelveLabs video id, then finalize. No upload or indexing, so it takes seconds.
+    `prompt` replaces the analysis prompt outright; `question_id` focuses it on one question.
+    """
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    if not interview.twelvelabs_video_id:
+        _mark_failed(interview_id, RuntimeError("Interview has no TwelveLabs video yet; process it first."))
+        return
+    if not prompt and question_id:
+        question = InterviewQuestion.objects.filter(interview=interview, id=question_id).values_list("prompt", flat=True)
+        prompt = _analysis_prompt(interview, question=question.first())
+
+    if interview.status != Interview.Status.PROCESSING:
+        # The reanalyze view claims PROCESSING before enqueueing; direct callers may not have.
+        _checkpoint(interview, status=Interview.Status.PROCESSING)
+        publish_status(interview)
+    chain(interview_reanalyze_video.si(interview_id, prompt), interview_finalize.si(interview_id)).apply_async()
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=3, retry_backoff=15)
+def interview_reanalyze_video(self, interview_id: str, prompt: str | None = None) -> None:
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    analysis_prompt = prompt or _analysis_prompt(interview)
+    analysis = analyze_video(get_client(), video_id=interview.twelvelabs_video_id, prompt=analysis_prompt)
+    analysis_cache.store(
+        content_sha256=interview.video_sha256,
+        prompt=analysis_prompt,
+        result=TwelveLabsResult(
+            transcript=interview.transcript_text, analysis=analysis, video_id=interview.twelvelabs_video_id
+        ),
+    )
+    _checkpoint(interview, analysis_text=analysis)
+
+
+def _job_fit_inputs(interview: Interview) -> tuple[dict, dict]:
+    traits = getattr(getattr(interview.user, "personality_profile", None), "traits", {}) or {}
+    job_payload = {
+        "url": interview.job.url if interview.job else "",
+        "company": interview.job.company if interview.job else "",
+        "title": interview.job.title if interview.job else "",
+    }
+    return traits, job_payload
+
+
+def _merge_personality_fit(interview_id: str, **parts) -> dict:
+    """Merge keys into personality_fit under a row lock (job fit and finalize write concurrently)."""
+    with transaction.atomic():
+        locked = Interview.objects.select_for_update().get(id=interview_id)
+        merged = {**(locked.personality_fit or {}), **parts}
+        locked.personality_fit = merged
+        locked.save(update_fields=["personality_fit", "updated_at"])
+    return merged
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=10)
+def interview_score_job_fit(self, interview_id: str) -> None:
+    """
+    Job fit only needs the job and the user's traits, so it runs alongside the video
+    pipeline as soon as processing starts instead of after analysis.
+    """
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    traits, job_payload = _job_fit_inputs(interview)
+    try:
+        job_fit = score_job_fit(traits=traits, job=job_payload)
+    except Exception as exc:  # noqa: BLE001 - interview_finalize scores it again and flags it degraded
+        logger.warning("interview.job_fit_failed interview_id=%s error=%s", interview_id, exc)
+        return
+    _merge_personality_fit(interview_id, job_fit=job_fit)
+
+
+@shared_task(bind=True, base=InterviewStageTask, max_retries=3)
+def interview_finalize(self, interview_id: str) -> None:
+    interview = _load(interview_id)
+    if interview is None:
+        return
+    transcript = interview.transcript_text
+    analysis = interview.analysis_text
+
+    if settings.LLM_COMBINED_REVIEW:
+        # One call returns feedback and archetype together; the transcript is sent once.
+        calls = {"review": lambda: review_interview(transcript=transcript, analysis=analysis)}
+    else:
+        calls = {
+            "feedback": lambda: generate_interview_feedback(transcript=transcript, analysis=analysis),
+            "archetype": lambda: classify_archetype(transcript=transcript, analysis=analysis),
+        }
+    if "job_fit" not in (interview.personality_fit or {}):
+        # The early job-fit task hasn't landed (or failed); compute it alongside the others.
+        traits, job_payload = _job_fit_inputs(interview)
+        calls["job_fit"] = lambda: score_job_fit(traits=traits, job=job_payload)
+    results, degraded = gather_llm_calls(
+        calls,
+        fallbacks={
+            "feedback": dict(FEEDBACK_FALLBACK),
+            "archetype": dict(ARCHETYPE_FALLBACK),
+            "job_fit": None,
+            "review": {"feedback": dict(FEEDBACK_FALLBACK), "archetype": dict(ARCHETYPE_FALLBACK)},
+        },
+    )
+    if "review" in results:
+        # Unpack into the split-mode names so the rest of finalize (and `degraded`) is unchanged.
+        results.update(results.pop("review"))
+        if "review" in degraded:
+            degraded = [name for name in degraded if name != "review"] + ["feedback", "archetype"]
+
+    feedback_details = results["feedback"]
+    feedback = {
+        "summary": analysis,
+        "strengths": feedback_details.get("strengths", []),
+        "weaknesses": feedback_details.get("weaknesses", []),
+    }
+    if degraded:
+        feedback["degraded"] = degraded
+
+    fit_parts = {"archetype": results["archetype"]}
+    if results.get("job_fit") is not None:
+        fit_parts["job_fit"] = results["job_fit"]
+
+    with transaction.atomic():
+        personality_fit = _merge_personality_fit(interview_id, **fit_parts)
+        record_feedback_change(user_id=interview.user_id, old_feedback=interview.ai_feedback, new_feedback=feedback)
+        interview.ai_feedback = feedback
+        interview.personality_fit = personality_fit
+        interview.status = Interview.Status.COMPLETE
+        interview.save(update_fields=["ai_feedback", "status", "updated_at"])
+        publish_status(interview)
+
+
+PIPELINE_STAGES = (
+    interview_upload_asset,
+    interview_wait_asset_ready,
+    interview_index_asset,
+    interview_wait_indexed_ready,
+    interview_resolve_video,
+    interview_analyze_video,
+    interview_finalize,
+)
+
+
+def _pipeline(interview_id: str, *, start: int = 0):
+    return chain(*(stage.si(interview_id) for stage in PIPELINE_STAGES[start:]))
+
+
+def _first_pending_stage(interview: Interview) -> int:
+    if interview.twelvelabs_video_id and interview.analysis_text:
+        return PIPELINE_STAGES.index(interview_finalize)
+    if not interview.twelvelabs_asset_id:
+        return PIPELINE_STAGES.index(interview_upload_asset)
+    if not interview.twelvelabs_asset_ready_at:
+        return PIPELINE_STAGES.index(interview_wait_asset_ready)
+    if not interview.twelvelabs_indexed_asset_id:
+        return PIPELINE_STAGES.index(interview_index_asset)
+    if not interview.twelvelabs_indexed_ready_at:
+        return PIPELINE_STAGES.index(interview_wait_indexed_ready)
+    # resolve/analyze skip themselves when their checkpoints are filled.
+    return PIPELINE_STAGES.index(interview_resolve_video)
+
+
+def _claim_ready(interview_id: str, ready_field: str) -> bool:
+    """Atomically mark a readiness checkpoint; exactly one of poller/webhook wins and continues the chain."""
+    updated = Interview.objects.filter(id=interview_id, **{f"{ready_field}__isnull": True}).update(
+        **{ready_field: timezone.now()}
+    )
+    return updated == 1
+
+
+def _await_ready(task, interview_id: str, *, ready_field: str, check, block, started_at, attempt: int) -> None:
+    """
+    One readiness check per task run. While TwelveLabs is still working the task re-enqueues
+    itself with a backoff countdown (the worker slot is released in between) until the
+    overall deadline. In eager mode there is no broker, so it blocks instead.
+    """
+    interview = _load(interview_id)
+    if interview is None or interview.status != Interview.Status.PROCESSING:
+        task.request.chain = None
+        return
+    if getattr(interview, ready_field):
+        # A webhook already claimed this checkpoint and launched the rest of the pipeline.
+        task.request.chain = None
+        return
+
+    client = get_client()
+    if task.request.is_eager:
+        block(client, interview)
+        _claim_ready(interview_id, ready_field)
+        return
+
+    started_at = started_at or time.time()
+    try:
+        ready = check(client, interview)
+    except ProcessingFailed:
         raise
+    except Exception:  # noqa: BLE001 - transient status-check errors just mean "poll again"
+        ready = False
+
+    if ready:
+        if not _claim_ready(interview_id, ready_field):
+            task.request.chain = None
+        return
+
+    if time.time() - started_at > settings.TWELVELABS_WAIT_DEADLINE_SECONDS:
+        raise TimeoutError(
+            f"TwelveLabs processing did not finish within {settings.TWELVELABS_WAIT_DEADLINE_SECONDS:.0f}s."
+        )
+    raise task.retry(countdown=poll_delay(attempt), kwargs={"started_at": started_at, "attempt": attempt + 1})
+
+
+def resume_from_webhook(*, resource_id: str, status: str) -> bool:
+    """
+    Complete a pending readiness wait early from a TwelveLabs webhook. `resource_id` may be an
+    asset id or an indexed asset id. Returns True when the event matched an interview.
+    """
+    for id_field, ready_field, next_stage in (
+        ("twelvelabs_asset_id", "twelvelabs_asset_ready_at", interview_index_asset),
+        ("twelvelabs_indexed_asset_id", "twelvelabs_indexed_ready_at", interview_resolve_video),
+    ):
+        interview = Interview.objects.filter(**{id_field: resource_id}, status=Interview.Status.PROCESSING).first()
+        if interview is None:
+            continue
+        if status == "failed":
+            _mark_failed(str(interview.id), ProcessingFailed(f"TwelveLabs reported {id_field}={resource_id} failed."))
+        elif status == "ready" and _claim_ready(str(interview.id), ready_field):
+            _pipeline(str(interview.id), start=PIPELINE_STAGES.index(next_stage)).apply_async()
+        return True
+    return False
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api.models import AnalysisCacheEntry
+from api.services import analysis_cache
+from api.services.twelvelabs import TwelveLabsResult
+
+CONTENT = "a" * 64
+RESULT = TwelveLabsResult(transcript="I led the migration.", analysis="Clear ownership.", video_id="video-1")
+
+
+@override_settings(ANALYSIS_CACHE_TTL_DAYS=30, ANALYSIS_CACHE_MAX_ENTRIES=100)
+class AnalysisCacheTests(TestCase):
+    def test_hit_for_same_bytes_and_prompt(self):
+        analysis_cache.store(content_sha256=CONTENT, prompt="prompt", result=RESULT)
+
+        self.assertEqual(analysis_cache.lookup(content_sha256=CONTENT, prompt="prompt"), RESULT)
+        self.assertEqual(AnalysisCacheEntry.objects.get().hits, 1)
+        self.assertIsNone(analysis_cache.lookup(content_sha256=CONTENT, prompt="another prompt"))
+        self.assertIsNone(analysis_cache.lookup(content_sha256="b" * 64, prompt="prompt"))
+        self.assertIsNone(analysis_cache.lookup(content_sha256="", prompt="prompt"))
+
+    def test_entries_unused_past_the_ttl_expire(self):
+        analysis_cache.store(content_sha256=CONTENT, prompt="prompt", result=RESULT)
+        AnalysisCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(days=31))
+
+        self.assertIsNone(analysis_cache.lookup(content_sha256=CONTENT, prompt="prompt"))
+        self.assertEqual(analysis_cache.evict(), 1)
+        self.assertFalse(AnalysisCacheEntry.objects.exists())
+
+    def test_a_hit_renews_the_entry(self):
+        analysis_cache.store(content_sha256=CONTENT, prompt="prompt", result=RESULT)
+        AnalysisCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(days=29))
+
+        self.assertIsNotNone(analysis_cache.lookup(content_sha256=CONTENT, prompt="prompt"))
+        self.assertEqual(analysis_cache.evict(), 0)
+
+    @override_settings(ANALYSIS_CACHE_MAX_ENTRIES=2)
+    def test_storing_trims_the_least_recently_used_beyond_the_cap(self):
+        for n in range(3):
+            analysis_cache.store(content_sha256=str(n) * 64, prompt="prompt", result=RESULT)
+            AnalysisCacheEntry.objects.filter(content_sha256=str(n) * 64).update(
+                last_used_at=timezone.now() - timedelta(hours=3 - n)
+            )
+
+        self.assertEqual(
+            sorted(AnalysisCacheEntry.objects.values_list("content_sha256", flat=True)), ["1" * 64, "2" * 64]
+        )
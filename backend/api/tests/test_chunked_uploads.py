@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api import views
+from api.models import Interview, UploadSession
+from api.services import uploads
+
+RECORDING = b"\x1a\x45\xdf\xa3" + b"\x01" * 96
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+class ChunkedUploadTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = get_user_model().objects.create_user(username="chunker")
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.interview = Interview.objects.create(user=user, status=Interview.Status.QUESTIONS_READY)
+        patcher = mock.patch.object(views, "process_interview")
+        self.process = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _url(self, suffix: str = "") -> str:
+        return f"/api/interviews/{self.interview.id}/uploads/{suffix}"
+
+    def _start(self) -> UploadSession:
+        response = self.client.post(self._url(), {"total_size": len(RECORDING)}, format="json")
+        self.assertEqual(response.status_code, 201)
+        return UploadSession.objects.get(id=response.data["upload_id"])
+
+    def _part_files(self, session: UploadSession) -> list[str]:
+        _, files = default_storage.listdir(session.part_prefix)
+        return sorted(files)
+
+    def test_resent_chunk_replaces_the_stored_part(self):
+        session = self._start()
+        uploads.write_chunk(session, 0, io.BytesIO(b"\x00" * len(RECORDING)), content_length=len(RECORDING))
+        uploads.write_chunk(session, 0, io.BytesIO(RECORDING), content_length=len(RECORDING))
+
+        self.assertEqual(self._part_files(session), [os.path.basename(session.part_key(0))])
+        with default_storage.open(session.part_key(0), "rb") as part:
+            self.assertEqual(part.read(), RECORDING)
+
+    def test_resend_racing_an_existing_part_never_leaves_a_suffixed_copy(self):
+        session = self._start()
+        uploads.write_chunk(session, 0, io.BytesIO(RECORDING), content_length=len(RECORDING))
+        real_delete = default_storage.delete
+
+        def delete_then_race(name):
+            # Another request re-sending the same chunk writes it right after our delete.
+            real_delete(name)
+            with open(default_storage.path(name), "wb") as racer:
+                racer.write(RECORDING)
+
+        with mock.patch.object(default_storage, "delete", side_effect=delete_then_race):
+            uploads.write_chunk(session, 0, io.BytesIO(RECORDING), content_length=len(RECORDING))
+
+        self.assertEqual(self._part_files(session), [os.path.basename(session.part_key(0))])
+
+    def test_storage_error_during_finalize_reopens_the_session(self):
+        session = self._start()
+        uploads.write_chunk(session, 0, io.BytesIO(RECORDING), content_length=len(RECORDING))
+
+        with mock.patch.object(views, "assemble_session", side_effect=OSError("disk unavailable")):
+            with self.assertRaises(OSError):
+                self.client.post(self._url(f"{session.id}/finalize/"))
+        session.refresh_from_db()
+        self.assertEqual(session.status, UploadSession.Status.OPEN)
+
+        response = self.client.post(self._url(f"{session.id}/finalize/"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(UploadSession.objects.filter(id=session.id).exists())
+        self.interview.refresh_from_db()
+        with default_storage.open(self.interview.video_object_key, "rb") as recording:
+            self.assertEqual(recording.read(), RECORDING)
+        self.process.delay.assert_called_once_with(str(self.interview.id))
+
+    def test_second_finalize_is_rejected(self):
+        session = self._start()
+        UploadSession.objects.filter(id=session.id).update(status=UploadSession.Status.COMPLETE)
+        self.assertEqual(self.client.post(self._url(f"{session.id}/finalize/")).status_code, 409)
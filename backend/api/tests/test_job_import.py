@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from api import tasks
+from api.models import Job, JobImport, JobPage
+
+
+class ImportJobsTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="importer")
+        Job.objects.create(user=self.user, url="https://jobs.example.com/roles/1")
+        now = timezone.now()
+        # Created up front: the scrape runs on worker threads, which shouldn't write to the test DB.
+        self.page = JobPage.objects.create(
+            url_sha256="2" * 64,
+            url="https://jobs.example.com/roles/2",
+            title="Engineer 2",
+            company="Acme",
+            fetched_at=now,
+            validated_at=now,
+        )
+
+    def _fetch(self, url: str) -> JobPage:
+        if url.endswith("/3"):
+            raise ConnectionError("connection reset")
+        return self.page
+
+    def test_dedupes_and_records_a_result_per_url(self):
+        urls = [
+            "https://jobs.example.com/roles/2",
+            "https://jobs.example.com/roles/1/?utm_source=newsletter",  # already saved by the user
+            "https://JOBS.example.com/roles/2/",  # same posting twice in one import
+            "https://jobs.example.com/roles/3",
+        ]
+        job_import = JobImport.objects.create(user=self.user, urls=urls)
+
+        with mock.patch.object(tasks, "get_job_page", side_effect=self._fetch) as fetch:
+            tasks.import_jobs(str(job_import.id))
+
+        fetch.assert_has_calls(
+            [mock.call("https://jobs.example.com/roles/2"), mock.call("https://jobs.example.com/roles/3")], any_order=True
+        )
+        self.assertEqual(fetch.call_count, 2)
+        job_import.refresh_from_db()
+        self.assertEqual(job_import.status, JobImport.Status.COMPLETE)
+        self.assertEqual([r["url"] for r in job_import.results], urls)
+        self.assertEqual([r["status"] for r in job_import.results], ["created", "duplicate", "duplicate", "failed"])
+        self.assertEqual(job_import.results[3]["error"], "connection reset")
+
+        created = Job.objects.get(id=job_import.results[0]["job_id"])
+        self.assertEqual((created.title, created.company, created.page.url), ("Engineer 2", "Acme", urls[0]))
+        self.assertEqual(Job.objects.filter(user=self.user).count(), 2)
+
+    def test_only_queued_imports_run(self):
+        job_import = JobImport.objects.create(
+            user=self.user, urls=["https://jobs.example.com/roles/2"], status=JobImport.Status.COMPLETE
+        )
+        with mock.patch.object(tasks, "get_job_page") as fetch:
+            tasks.import_jobs(str(job_import.id))
+        fetch.assert_not_called()
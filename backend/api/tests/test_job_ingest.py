@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api.services import job_ingest
+
+DESCRIPTION = "<p>Build and run the payments platform.</p><ul>" + "<li>Own services end to end.</li>" * 10 + "</ul>"
+
+
+def _page(*json_ld, body: str = "<main><h1>Careers</h1><p>Apply now.</p></main>") -> str:
+    scripts = "".join(f'<script type="application/ld+json">{block}</script>' for block in json_ld)
+    return f"<html><head>{scripts}</head><body>{body}</body></html>"
+
+
+def _posting(description: str = DESCRIPTION) -> dict:
+    return {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": "Backend Engineer",
+        "hiringOrganization": {"@type": "Organization", "name": "Acme &amp; Co"},
+        "description": description,
+    }
+
+
+class ExtractJobTextTests(SimpleTestCase):
+    def test_job_posting_json_ld_skips_the_dom(self):
+        page = _page(json.dumps({"@graph": [{"@type": "WebPage"}, _posting()]}))
+
+        with mock.patch.object(job_ingest, "BeautifulSoup") as soup:
+            text = job_ingest.extract_job_text(page)
+
+        soup.assert_not_called()
+        lines = text.splitlines()
+        self.assertEqual(lines[:3], ["Backend Engineer", "Acme & Co", ""])
+        self.assertIn("Build and run the payments platform.", lines)
+        self.assertEqual(lines.count("Own services end to end."), 10)
+        self.assertNotIn("Apply now.", text)
+
+    def test_falls_back_to_the_page_when_json_ld_is_missing_short_or_broken(self):
+        for page in (
+            _page(),
+            _page(json.dumps(_posting("<p>Short.</p>"))),
+            _page("{not json", json.dumps({"@type": "Organization", "description": DESCRIPTION})),
+        ):
+            with self.subTest(page=page[:80]):
+                self.assertEqual(job_ingest.extract_job_text(page), "Careers\nApply now.")
+
+    def test_max_chars_caps_the_json_ld_text(self):
+        text = job_ingest.extract_job_text(_page(json.dumps(_posting())), max_chars=28)
+        self.assertEqual(text, "Backend Engineer\nAcme & Co")
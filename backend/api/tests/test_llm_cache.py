@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services import llm_cache
+
+
+@override_settings(LLM_CACHE_FUNCTIONS={"questions"}, LLM_STATS_LOG_SECONDS=300)
+class LLMCacheStatsTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(llm_cache, "redis_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("STATS", llm_cache.Counter()), ("_next_report", 0.0)):
+            patcher = mock.patch.object(llm_cache, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_hits_and_misses_are_counted_and_logged_periodically(self):
+        key = llm_cache.cache_key(provider="fake", model="m", prompt="p", config={})
+        with self.assertLogs("api.services.llm_cache", "INFO") as logs:
+            self.assertIsNone(llm_cache.get("questions", key))
+            llm_cache.put("questions", key, "answer")
+            self.assertEqual(llm_cache.get("questions", key), "answer")
+
+        self.assertEqual(llm_cache.stats(), {"questions": {"miss": 1, "memory_hit": 1}})
+        # The first count reports; the next one falls inside the interval.
+        self.assertEqual(logs.output, ['INFO:api.services.llm_cache:llm_cache.stats {"questions": {"miss": 1}}'])
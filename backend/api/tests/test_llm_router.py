@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import Counter
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services import llm_router
+from api.services.clients import http_session
+
+
+def _failing(**kwargs):
+    raise RuntimeError("provider down")
+
+
+def _answer(text: str, *, delay: float = 0.0):
+    def provider(**kwargs):
+        time.sleep(delay)
+        return text
+
+    return provider
+
+
+@override_settings(
+    LLM_DEADLINES={"test": 2.0, "short": 0.2},
+    LLM_BREAKER_FAILURES=2,
+    LLM_BREAKER_COOLDOWN_SECONDS=0.1,
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS=0.05,
+    LLM_HEDGE_MIN_SAMPLES=1000,
+)
+class LLMRouterTests(SimpleTestCase):
+    def setUp(self):
+        with llm_router._lock:
+            llm_router._health.clear()
+        self.events_before = Counter(llm_router.ROUTER_EVENTS)
+
+    def _events(self, site: str) -> dict[str, int]:
+        delta = Counter(llm_router.ROUTER_EVENTS)
+        delta.subtract(self.events_before)
+        return {name: n for (event_site, name), n in delta.items() if event_site == site and n}
+
+    def test_fails_over_to_the_next_provider(self):
+        text = llm_router.generate(site="test", prompt="p", providers={"a": _failing, "b": _answer("from b")})
+
+        self.assertEqual(text, "from b")
+        self.assertEqual(self._events("test"), {"failover": 1, "won:b": 1})
+        self.assertEqual(llm_router.provider_health()["a"]["consecutive_failures"], 1)
+
+    def test_breaker_opens_after_consecutive_failures_and_probes_after_cooldown(self):
+        calls = []
+
+        def flaky(**kwargs):
+            calls.append(1)
+            raise RuntimeError("provider down")
+
+        for _ in range(2):
+            with self.assertRaises(llm_router.LLMUnavailable):
+                llm_router.generate(site="test", prompt="p", providers={"a": flaky})
+        self.assertEqual(llm_router.provider_health()["a"]["state"], "open")
+
+        # Open: skipped without being called.
+        with self.assertRaisesRegex(llm_router.LLMUnavailable, "circuit open"):
+            llm_router.generate(site="test", prompt="p", providers={"a": flaky})
+        self.assertEqual(len(calls), 2)
+
+        # After the cooldown a single probe goes through; its success closes the circuit.
+        time.sleep(0.15)
+        self.assertEqual(llm_router.generate(site="test", prompt="p", providers={"a": _answer("back")}), "back")
+        self.assertEqual(llm_router.provider_health()["a"]["state"], "closed")
+
+    def test_only_one_half_open_probe_at_a_time(self):
+        health = llm_router._health_for("a")
+        with llm_router._lock:
+            health.record(ok=False, latency=0.0)
+            health.record(ok=False, latency=0.0)
+        time.sleep(0.15)
+
+        with llm_router._lock:
+            self.assertTrue(health.allow())
+            self.assertFalse(health.allow())
+
+    def test_slow_provider_is_hedged(self):
+        started = time.monotonic()
+        text = llm_router.generate(
+            site="test", prompt="p", providers={"slow": _answer("slow", delay=1.0), "fast": _answer("fast")}
+        )
+
+        self.assertEqual(text, "fast")
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(self._events("test"), {"hedged": 1, "won:fast": 1})
+
+    def test_deadline_bounds_the_call(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def stuck(**kwargs):
+            release.wait(5)
+            return "too late"
+
+        started = time.monotonic()
+        with self.assertRaisesRegex(llm_router.LLMUnavailable, "deadline"):
+            llm_router.generate(site="short", prompt="p", providers={"a": stuck, "b": stuck})
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(self._events("short"), {"hedged": 1, "deadline": 1})
+
+    @override_settings(LLM_STATS_LOG_SECONDS=300)
+    def test_events_and_health_are_logged_periodically(self):
+        with mock.patch.object(llm_router, "_next_report", 0.0), self.assertLogs(
+            "api.services.llm_router", "INFO"
+        ) as logs:
+            llm_router.generate(site="test", prompt="p", providers={"a": _failing, "b": _answer("from b")})
+            llm_router.generate(site="test", prompt="p", providers={"b": _answer("from b")})
+
+        stats = [line for line in logs.output if "llm_router.stats" in line]
+        self.assertEqual(len(stats), 1)
+        self.assertIn('"state": "closed"', stats[0])
+        self.assertGreaterEqual(llm_router.event_counts()["test"]["won:b"], 2)
+
+
+class ProviderSessionTests(SimpleTestCase):
+    def test_router_sessions_do_not_retry_at_the_transport(self):
+        # A 503 must reach the router at once so it can fail over inside the deadline.
+        retry = http_session("gemini", retries=False).get_adapter("https://example.com").max_retries
+        self.assertEqual((retry.total, retry.connect), (0, 0))
+        self.assertGreater(http_session("job_ingest").get_adapter("https://example.com").max_retries.total, 0)
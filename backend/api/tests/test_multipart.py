@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services import storage
+from api.services.storage import MULTIPART_MIN_PART_BYTES, MultipartMismatch
+
+KEY = "interviews/1/recording.webm"
+
+
+@override_settings(S3_BUCKET_NAME="bucket")
+class CompleteMultipartUploadTests(SimpleTestCase):
+    def setUp(self):
+        self.s3 = mock.Mock()
+        # S3 lists parts a page at a time.
+        self.s3.list_parts.side_effect = [
+            {
+                "Parts": [{"PartNumber": 1, "ETag": '"etag-1"', "Size": MULTIPART_MIN_PART_BYTES}],
+                "IsTruncated": True,
+                "NextPartNumberMarker": 1,
+            },
+            {"Parts": [{"PartNumber": 2, "ETag": '"etag-2"', "Size": 10}], "IsTruncated": False},
+        ]
+        self.s3.complete_multipart_upload.return_value = {"ETag": '"object-2"'}
+        patcher = mock.patch.object(storage, "_s3_client", return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _complete(self, parts, **kwargs):
+        return storage.complete_multipart_upload(object_key=KEY, upload_id="up-1", parts=parts, **kwargs)
+
+    def test_matching_parts_complete(self):
+        etag, size = self._complete(
+            [{"part_number": 2, "etag": "etag-2"}, {"part_number": 1, "etag": '"etag-1"'}],
+            total_size=MULTIPART_MIN_PART_BYTES + 10,
+        )
+
+        self.assertEqual((etag, size), ("object-2", MULTIPART_MIN_PART_BYTES + 10))
+        self.assertEqual(self.s3.list_parts.call_args_list[1].kwargs["PartNumberMarker"], 1)
+        self.assertEqual(
+            self.s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"],
+            {"Parts": [{"PartNumber": 1, "ETag": '"etag-1"'}, {"PartNumber": 2, "ETag": '"etag-2"'}]},
+        )
+
+    def test_etag_mismatch_is_rejected_without_completing(self):
+        with self.assertRaisesRegex(MultipartMismatch, "Part 2 ETag does not match"):
+            self._complete([{"part_number": 1, "etag": "etag-1"}, {"part_number": 2, "etag": "stale"}])
+        self.s3.complete_multipart_upload.assert_not_called()
+
+    def test_other_mismatches_are_rejected_without_completing(self):
+        cases = {
+            "numbered consecutively": [{"part_number": 1, "etag": "etag-1"}, {"part_number": 3, "etag": "x"}],
+            "never uploaded": [
+                {"part_number": 1, "etag": "etag-1"},
+                {"part_number": 2, "etag": "etag-2"},
+                {"part_number": 3, "etag": "x"},
+            ],
+            "part_number and an etag": [{"part_number": 1}],
+        }
+        for message, parts in cases.items():
+            with self.subTest(message):
+                self.s3.list_parts.side_effect = lambda **kwargs: {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": '"etag-1"', "Size": MULTIPART_MIN_PART_BYTES},
+                        {"PartNumber": 2, "ETag": '"etag-2"', "Size": MULTIPART_MIN_PART_BYTES},
+                    ]
+                }
+                with self.assertRaisesRegex(MultipartMismatch, message):
+                    self._complete(parts)
+        with self.assertRaisesRegex(MultipartMismatch, "were declared"):
+            self._complete([{"part_number": 1, "etag": "etag-1"}, {"part_number": 2, "etag": "etag-2"}], total_size=1)
+        self.s3.complete_multipart_upload.assert_not_called()
+
+    def test_undersized_middle_part_is_rejected(self):
+        self.s3.list_parts.side_effect = None
+        self.s3.list_parts.return_value = {
+            "Parts": [{"PartNumber": 1, "ETag": '"etag-1"', "Size": 10}, {"PartNumber": 2, "ETag": '"etag-2"', "Size": 10}]
+        }
+        with self.assertRaisesRegex(MultipartMismatch, "5 MiB"):
+            self._complete([{"part_number": 1, "etag": "etag-1"}, {"part_number": 2, "etag": "etag-2"}])
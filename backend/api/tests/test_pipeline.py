@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api import tasks
+from api.models import Interview
+from api.services.twelvelabs import ProcessingFailed
+
+
+class _Requeued(Exception):
+    pass
+
+
+class PipelineCheckpointTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="pipeline")
+        self.interview = Interview.objects.create(
+            user=user,
+            status=Interview.Status.UPLOADED,
+            video_object_key="local/interviews/1/x/recording.mp4",
+        )
+        for name in ("get_client", "get_index_id", "interview_score_job_fit"):
+            patcher = mock.patch.object(tasks, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _process(self) -> int:
+        with mock.patch.object(tasks, "_pipeline") as pipeline:
+            tasks.process_interview(str(self.interview.id))
+        pipeline.return_value.apply_async.assert_called_once_with()
+        return pipeline.call_args.kwargs["start"]
+
+    def test_new_recording_starts_at_upload(self):
+        self.assertEqual(self._process(), tasks.PIPELINE_STAGES.index(tasks.interview_upload_asset))
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.status, Interview.Status.PROCESSING)
+        self.assertEqual(self.interview.pipeline_object_key, self.interview.video_object_key)
+
+    def test_requeue_resumes_after_the_last_checkpoint(self):
+        Interview.objects.filter(id=self.interview.id).update(
+            pipeline_object_key=self.interview.video_object_key,
+            twelvelabs_asset_id="asset-1",
+            twelvelabs_asset_ready_at=timezone.now(),
+        )
+        self.assertEqual(self._process(), tasks.PIPELINE_STAGES.index(tasks.interview_index_asset))
+
+        Interview.objects.filter(id=self.interview.id).update(
+            twelvelabs_indexed_asset_id="indexed-1",
+            twelvelabs_indexed_ready_at=timezone.now(),
+            twelvelabs_video_id="video-1",
+            analysis_text="analysis",
+        )
+        self.assertEqual(self._process(), tasks.PIPELINE_STAGES.index(tasks.interview_finalize))
+
+    def test_a_different_recording_clears_the_checkpoints(self):
+        Interview.objects.filter(id=self.interview.id).update(
+            pipeline_object_key="local/interviews/1/x/old.mp4",
+            twelvelabs_asset_id="asset-old",
+            twelvelabs_video_id="video-old",
+            analysis_text="old analysis",
+        )
+        self.assertEqual(self._process(), tasks.PIPELINE_STAGES.index(tasks.interview_upload_asset))
+        self.interview.refresh_from_db()
+        self.assertEqual((self.interview.twelvelabs_asset_id, self.interview.analysis_text), ("", ""))
+
+    def test_completed_stages_skip_their_external_calls(self):
+        Interview.objects.filter(id=self.interview.id).update(
+            twelvelabs_asset_id="asset-1", twelvelabs_video_id="video-1", analysis_text="analysis"
+        )
+        with mock.patch.object(tasks, "upload_asset") as upload, mock.patch.object(
+            tasks, "fetch_indexed_video"
+        ) as fetch, mock.patch.object(tasks, "analyze_video") as analyze:
+            tasks.interview_upload_asset(str(self.interview.id))
+            tasks.interview_resolve_video(str(self.interview.id))
+            tasks.interview_analyze_video(str(self.interview.id))
+        upload.assert_not_called()
+        fetch.assert_not_called()
+        analyze.assert_not_called()
+
+    def test_stage_out_of_retries_marks_failed_and_keeps_checkpoints(self):
+        Interview.objects.filter(id=self.interview.id).update(
+            status=Interview.Status.PROCESSING,
+            pipeline_object_key=self.interview.video_object_key,
+            twelvelabs_asset_id="asset-1",
+            twelvelabs_asset_ready_at=timezone.now(),
+            twelvelabs_indexed_asset_id="indexed-1",
+            twelvelabs_indexed_ready_at=timezone.now(),
+            twelvelabs_video_id="video-1",
+        )
+        with mock.patch.object(tasks, "analyze_video", side_effect=RuntimeError("analyze 503")):
+            result = tasks.interview_analyze_video.apply(args=[str(self.interview.id)], throw=False)
+
+        self.assertTrue(result.failed())
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.status, Interview.Status.FAILED)
+        self.assertEqual(self.interview.ai_feedback, {"error": "analyze 503"})
+        self.assertEqual(self.interview.twelvelabs_video_id, "video-1")
+        # Re-queuing picks up at resolve/analyze; nothing is uploaded or indexed again.
+        self.assertEqual(self._process(), tasks.PIPELINE_STAGES.index(tasks.interview_resolve_video))
+
+
+class AwaitReadyTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="waiter")
+        self.interview = Interview.objects.create(
+            user=user, status=Interview.Status.PROCESSING, twelvelabs_asset_id="asset-1"
+        )
+        patcher = mock.patch.object(tasks, "get_client")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.task = mock.Mock(request=SimpleNamespace(is_eager=False, chain=["next-stage"]))
+        self.task.retry.return_value = _Requeued()
+
+    def _await(self, check, *, started_at=None, attempt=0, block=None):
+        tasks._await_ready(
+            self.task,
+            str(self.interview.id),
+            ready_field="twelvelabs_asset_ready_at",
+            check=lambda client, interview: check(),
+            block=block or (lambda client, interview: None),
+            started_at=started_at,
+            attempt=attempt,
+        )
+
+    def test_not_ready_requeues_with_backoff(self):
+        with mock.patch.object(tasks, "poll_delay", return_value=7.5) as delay:
+            with self.assertRaises(_Requeued):
+                self._await(lambda: False, started_at=time.time(), attempt=2)
+
+        delay.assert_called_once_with(2)
+        kwargs = self.task.retry.call_args.kwargs
+        self.assertEqual(kwargs["countdown"], 7.5)
+        self.assertEqual(kwargs["kwargs"]["attempt"], 3)
+        self.interview.refresh_from_db()
+        self.assertIsNone(self.interview.twelvelabs_asset_ready_at)
+
+    def test_transient_check_errors_poll_again(self):
+        def flaky():
+            raise ConnectionError("status endpoint timed out")
+
+        with self.assertRaises(_Requeued):
+            self._await(flaky)
+        self.assertEqual(self.task.retry.call_args.kwargs["kwargs"]["attempt"], 1)
+
+    def test_ready_claims_the_checkpoint_and_continues_the_chain(self):
+        self._await(lambda: True)
+
+        self.interview.refresh_from_db()
+        self.assertIsNotNone(self.interview.twelvelabs_asset_ready_at)
+        self.assertEqual(self.task.request.chain, ["next-stage"])
+        self.task.retry.assert_not_called()
+
+    def test_checkpoint_claimed_elsewhere_stops_this_chain(self):
+        Interview.objects.filter(id=self.interview.id).update(twelvelabs_asset_ready_at=timezone.now())
+        self._await(lambda: True)
+        self.assertIsNone(self.task.request.chain)
+
+    @override_settings(TWELVELABS_WAIT_DEADLINE_SECONDS=60)
+    def test_gives_up_after_the_deadline(self):
+        with self.assertRaises(TimeoutError):
+            self._await(lambda: False, started_at=time.time() - 61)
+        self.task.retry.assert_not_called()
+
+    def test_terminal_failure_is_not_retried(self):
+        def failed():
+            raise ProcessingFailed("asset failed")
+
+        with self.assertRaises(ProcessingFailed):
+            self._await(failed)
+        self.task.retry.assert_not_called()
+
+    def test_eager_runs_block_instead_of_requeueing(self):
+        self.task.request.is_eager = True
+        block = mock.Mock()
+        self._await(lambda: False, block=block)
+
+        block.assert_called_once()
+        self.interview.refresh_from_db()
+        self.assertIsNotNone(self.interview.twelvelabs_asset_ready_at)
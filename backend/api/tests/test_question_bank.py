@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from api.models import BankedQuestion
+from api.services import question_bank
+
+BACKEND = {
+    "title": "Senior Backend Engineer",
+    "company": "Acme",
+    "description": "Design Python and Django services on Postgres, Redis and Celery. Own APIs, migrations and on-call.",
+}
+COMPETENCIES = ["Ownership", "Execution", "Conflict resolution", "Learning agility", "Influence", "Accountability"]
+
+
+def _questions(topic: str) -> list[dict]:
+    return [
+        {
+            "prompt": f"Tell me about {topic} work where you showed {competency.lower()}.",
+            "competency": competency,
+            "why_this_matters": "Signals how you operate.",
+            "good_signals": ["specific example"],
+            "red_flags": ["vague"],
+        }
+        for competency in COMPETENCIES
+    ]
+
+
+@override_settings(QUESTION_BANK_ENABLED=True, QUESTION_BANK_QUESTIONS=6, QUESTION_BANK_MIN_SCORE=0.35)
+class QuestionBankTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(question_bank, "_index", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        question_bank.add_questions(_questions("backend services"), **BACKEND)
+        question_bank.add_questions(
+            _questions("pastry kitchen"),
+            title="Pastry Chef",
+            company="Sweet Bakery",
+            description="Laminate dough, temper chocolate and run the morning bake for the cafe counter.",
+        )
+
+    def test_similar_role_is_served_from_the_bank(self):
+        questions = question_bank.retrieve(
+            title="Backend Engineer",
+            company="Globex",
+            description="Build Django and Python APIs backed by Postgres; Celery workers and Redis caching.",
+        )
+
+        self.assertEqual(len(questions), 6)
+        self.assertEqual({q["competency"] for q in questions}, set(COMPETENCIES))
+        self.assertTrue(all("backend services" in q["prompt"] for q in questions))
+
+    def test_unrelated_role_misses(self):
+        self.assertIsNone(
+            question_bank.retrieve(
+                title="Registered Nurse", company="City Hospital", description="Patient care on a surgical ward."
+            )
+        )
+
+    def test_min_score_decides_between_bank_and_llm(self):
+        query = {"title": "Backend Engineer", "company": "Globex", "description": "Django APIs on Postgres."}
+        self.assertIsNotNone(question_bank.retrieve(**query))
+        with override_settings(QUESTION_BANK_MIN_SCORE=0.99):
+            self.assertIsNone(question_bank.retrieve(**query))
+
+    def test_add_questions_skips_banked_prompts_and_missing_competencies(self):
+        again = [dict(q, prompt=f"  {q['prompt'].upper()} ") for q in _questions("backend services")]
+        again.append({"prompt": "Describe a launch you led.", "competency": ""})
+        again.append({"prompt": "Describe a launch you led.", "competency": "Leadership"})
+
+        self.assertEqual(question_bank.add_questions(again, **BACKEND), 1)
+        self.assertEqual(BankedQuestion.objects.count(), 13)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api.models import Interview, UserInterviewStats
+from api.services.stats import rebuild_user_stats, record_feedback_change, summarize
+
+
+def _snapshot(stats: UserInterviewStats) -> dict:
+    return {
+        "interview_count": stats.interview_count,
+        "duration_ms_sum": stats.duration_ms_sum,
+        "duration_count": stats.duration_count,
+        "competency_counts": dict(stats.competency_counts),
+    }
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+class StatsRollupTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="stats", password="pw")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _create_interview(self) -> Interview:
+        response = self.client.post("/api/interviews/", {}, format="json")
+        self.assertEqual(response.status_code, 201)
+        return Interview.objects.get(id=response.data["id"])
+
+    def _set_feedback(self, interview: Interview, feedback: dict) -> None:
+        record_feedback_change(user_id=self.user.id, old_feedback=interview.ai_feedback, new_feedback=feedback)
+        interview.ai_feedback = feedback
+        interview.save(update_fields=["ai_feedback", "updated_at"])
+
+    def test_incremental_updates_match_a_rebuild(self):
+        first = self._create_interview()
+        second = self._create_interview()
+        third = self._create_interview()
+        self._set_feedback(first, {"duration_ms": 90_000})
+        self._set_feedback(second, {"duration_ms": 30_000})
+        # Re-processing swaps the duration instead of counting the interview twice.
+        self._set_feedback(second, {"duration_ms": 60_000})
+        self._set_feedback(third, {"error": "TwelveLabs failed"})
+        self.assertEqual(self.client.delete(f"/api/interviews/{first.id}/").status_code, 204)
+
+        incremental = _snapshot(UserInterviewStats.objects.get(user=self.user))
+        self.assertEqual(incremental, _snapshot(rebuild_user_stats(user_id=self.user.id)))
+        self.assertEqual(incremental["interview_count"], 2)
+        self.assertEqual((incremental["duration_ms_sum"], incremental["duration_count"]), (60_000, 1))
+        self.assertEqual(sum(incremental["competency_counts"].values()), second.questions.count() + third.questions.count())
+
+    def test_statistics_endpoint_reports_the_rollup(self):
+        interview = self._create_interview()
+        self._set_feedback(interview, {"duration_ms": 45_000})
+
+        response = self.client.get("/api/interviews/statistics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, summarize(UserInterviewStats.objects.get(user=self.user)))
+        self.assertEqual(response.data["total_interviews"], 1)
+        self.assertEqual(response.data["average_duration_seconds"], 45)
+        self.assertEqual(response.data["total_questions_answered"], interview.questions.count())
+
+    def test_rebuild_counts_interviews_that_predate_the_rollup(self):
+        Interview.objects.create(user=self.user, ai_feedback={"duration_ms": 10_000})
+        Interview.objects.create(user=self.user)
+        UserInterviewStats.objects.filter(user=self.user).delete()
+
+        stats = rebuild_user_stats(user_id=self.user.id)
+        self.assertEqual((stats.interview_count, stats.duration_ms_sum, stats.duration_count), (2, 10_000, 1))
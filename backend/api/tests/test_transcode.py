@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services.twelvelabs import MediaProbe, _transcode_args
+
+
+def _probe(video_codec="vp8", audio_codec="opus", height=1080, fps=60.0) -> MediaProbe:
+    return MediaProbe(
+        video_codec=video_codec, audio_codec=audio_codec, width=None, height=height, fps=fps, bit_rate=None
+    )
+
+
+@override_settings(
+    TWELVELABS_TRANSCODE_PROFILE="auto",
+    TWELVELABS_TRANSCODE_MAX_HEIGHT=720,
+    TWELVELABS_TRANSCODE_MAX_FPS=30,
+    TWELVELABS_TRANSCODE_MAX_BITRATE="2500k",
+)
+class TranscodeArgsTests(SimpleTestCase):
+    def test_mp4_compatible_video_is_remuxed(self):
+        self.assertEqual(
+            _transcode_args(_probe(video_codec="h264", audio_codec="aac")), ("remux", ["-c:v", "copy", "-c:a", "copy"])
+        )
+        self.assertEqual(_transcode_args(_probe(video_codec="hevc")), ("remux", ["-c:v", "copy", "-c:a", "aac"]))
+
+    def test_other_codecs_get_a_capped_fast_encode(self):
+        profile, args = _transcode_args(_probe())
+
+        self.assertEqual(profile, "fast")
+        self.assertEqual(args[:6], ["-c:v", "libx264", "-preset", "veryfast", "-crf", "28"])
+        self.assertIn("scale=-2:'min(720,ih)'", args)
+        self.assertEqual(args[args.index("-r") + 1], "30")
+        self.assertEqual(args[args.index("-maxrate") + 1], "2500k")
+
+    def test_fast_encode_keeps_inputs_already_within_the_caps(self):
+        _, args = _transcode_args(_probe(height=480, fps=24.0))
+        self.assertNotIn("-vf", args)
+        self.assertNotIn("-r", args)
+
+    def test_unprobed_input_gets_the_full_encode(self):
+        self.assertEqual(_transcode_args(None), ("full", ["-c:v", "libx264", "-c:a", "aac"]))
+        self.assertEqual(_transcode_args(_probe(video_codec=None))[0], "full")
+
+    def test_profile_forces_a_strategy(self):
+        self.assertEqual(_transcode_args(_probe(video_codec="h264"), profile="fast")[0], "fast")
+        with override_settings(TWELVELABS_TRANSCODE_PROFILE="remux"):
+            self.assertEqual(_transcode_args(_probe())[0], "remux")
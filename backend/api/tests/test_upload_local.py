@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from api import views
+from api.models import Interview
+
+WEBM = b"\x1a\x45\xdf\xa3" + b"\x42" * (600 * 1024)  # spans several 256 KB handler chunks
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+class UploadLocalTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = get_user_model().objects.create_user(username="uploader")
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.interview = Interview.objects.create(user=user, status=Interview.Status.QUESTIONS_READY)
+        patcher = mock.patch.object(views, "process_interview")
+        self.process = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _upload(self, data: bytes, *, content_type: str = "video/webm"):
+        return self.client.post(
+            f"/api/interviews/{self.interview.id}/upload_local/",
+            {"file": SimpleUploadedFile("recording.bin", data, content_type=content_type)},
+            format="multipart",
+        )
+
+    def test_recording_is_hashed_sniffed_and_stored(self):
+        response = self._upload(WEBM, content_type="application/octet-stream")
+
+        self.assertEqual(response.status_code, 200)
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.video_sha256, hashlib.sha256(WEBM).hexdigest())
+        self.assertEqual(self.interview.video_mime_type, "video/webm")
+        self.assertEqual(self.interview.video_size_bytes, len(WEBM))
+        self.assertTrue(self.interview.video_object_key.endswith(".webm"))
+        with default_storage.open(self.interview.video_object_key, "rb") as stored:
+            self.assertEqual(stored.read(), WEBM)
+        self.process.delay.assert_called_once_with(str(self.interview.id))
+
+    def test_unrecognised_container_is_rejected(self):
+        self.assertEqual(self._upload(b"not a video at all" * 100).status_code, 415)
+        self.process.delay.assert_not_called()
+
+    def test_oversized_recording_is_rejected(self):
+        # 64 KB over the limit is allowed for multipart framing, so the first body streams in
+        # and trips the limit chunk by chunk; the second is refused from Content-Length alone.
+        for limit in (len(WEBM) - 1024, 128 * 1024):
+            with self.subTest(limit=limit), override_settings(INTERVIEW_UPLOAD_MAX_BYTES=limit):
+                self.assertEqual(self._upload(WEBM).status_code, 413)
+        self.process.delay.assert_not_called()
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.video_object_key, "")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+
+from api.models import Interview, RecordingStream
+from api.services import uploads
+
+WEBM_HEAD = b"\x1a\x45\xdf\xa3" + b"\x00" * 12
+
+
+class DisconnectingBody(io.BytesIO):
+    """A request body whose client goes away after the first read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        if self.reads > 1:
+            raise OSError("client disconnected")
+        return super().read(min(size, 4) if size and size > 0 else 4)
+
+
+class AppendSegmentTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = get_user_model().objects.create_user(username="uploader", password="pw")
+        self.interview = Interview.objects.create(user=user)
+        self.stream = uploads.start_stream(self.interview)
+
+    def _contents(self) -> bytes:
+        with default_storage.open(self.stream.object_key, "rb") as handle:
+            return handle.read()
+
+    def _append(self, index: int, data: bytes, **kwargs) -> RecordingStream:
+        return uploads.append_segment(self.stream, index, io.BytesIO(data), **kwargs)
+
+    def test_segments_are_appended_in_order_and_hashed(self):
+        self._append(0, WEBM_HEAD)
+        # Drop the cached hasher, as if the next segment landed on another worker.
+        uploads._forget_digest(self.stream)
+        stream = self._append(1, b"tail", final=True)
+
+        expected = WEBM_HEAD + b"tail"
+        self.assertEqual(stream.status, RecordingStream.Status.COMPLETE)
+        self.assertEqual(self._contents(), expected)
+        self.assertEqual(stream.size_bytes, len(expected))
+        self.assertEqual(stream.sha256, hashlib.sha256(expected).hexdigest())
+        self.assertEqual(stream.mime_type, "video/webm")
+
+    def test_retried_segment_is_not_appended_twice(self):
+        self._append(0, WEBM_HEAD)
+        stream = self._append(0, WEBM_HEAD)
+
+        self.assertEqual(stream.next_segment, 1)
+        self.assertEqual(self._contents(), WEBM_HEAD)
+
+    def test_early_segment_is_parked_until_the_gap_fills(self):
+        stream = self._append(1, b"second")
+        self.assertEqual(stream.pending_segments, [1])
+        self.assertEqual(self._contents(), b"")
+
+        stream = self._append(0, WEBM_HEAD)
+        self.assertEqual(stream.pending_segments, [])
+        self.assertEqual(stream.next_segment, 2)
+        self.assertEqual(self._contents(), WEBM_HEAD + b"second")
+        self.assertFalse(default_storage.exists(stream.segment_key(1)))
+
+    def test_disconnect_mid_segment_leaves_the_stream_untouched(self):
+        self._append(0, WEBM_HEAD)
+        with self.assertRaises(OSError):
+            uploads.append_segment(self.stream, 1, DisconnectingBody(b"partial-segment"))
+
+        stream = RecordingStream.objects.get(id=self.stream.id)
+        self.assertEqual(stream.next_segment, 1)
+        self.assertEqual(stream.size_bytes, len(WEBM_HEAD))
+        self.assertEqual(self._contents(), WEBM_HEAD)
+
+        stream = self._append(1, b"partial-segment", final=True)
+        self.assertEqual(self._contents(), WEBM_HEAD + b"partial-segment")
+        self.assertEqual(stream.sha256, hashlib.sha256(WEBM_HEAD + b"partial-segment").hexdigest())
+
+    def test_failure_after_writing_truncates_back_so_the_retry_is_clean(self):
+        self._append(0, WEBM_HEAD)
+        with mock.patch.object(uploads, "_complete_stream", side_effect=RuntimeError("storage hiccup")):
+            with self.assertRaises(RuntimeError):
+                self._append(1, b"last", final=True)
+
+        stream = RecordingStream.objects.get(id=self.stream.id)
+        self.assertEqual(stream.next_segment, 1)
+        self.assertIsNone(stream.final_segment)
+        self.assertEqual(self._contents(), WEBM_HEAD)
+
+        stream = self._append(1, b"last", final=True)
+        self.assertEqual(stream.status, RecordingStream.Status.COMPLETE)
+        self.assertEqual(self._contents(), WEBM_HEAD + b"last")
+        self.assertEqual(stream.sha256, hashlib.sha256(WEBM_HEAD + b"last").hexdigest())
+
+    def test_copy_failing_partway_leaves_no_stray_bytes(self):
+        self._append(0, WEBM_HEAD)
+        # Small read blocks so the limit trips after part of the segment has been written.
+        with mock.patch.object(uploads, "HASH_CHUNK_BYTES", 4), override_settings(
+            INTERVIEW_UPLOAD_MAX_BYTES=len(WEBM_HEAD) + 6
+        ):
+            with self.assertRaises(uploads.ChunkRejected):
+                self._append(1, b"12345678")
+
+        stream = RecordingStream.objects.get(id=self.stream.id)
+        self.assertEqual(stream.size_bytes, len(WEBM_HEAD))
+        self.assertEqual(self._contents(), WEBM_HEAD)
+
+        stream = self._append(1, b"tail", final=True)
+        self.assertEqual(self._contents(), WEBM_HEAD + b"tail")
+        self.assertEqual(stream.sha256, hashlib.sha256(WEBM_HEAD + b"tail").hexdigest())
+
+    def test_segment_after_the_final_one_is_rejected(self):
+        self._append(0, WEBM_HEAD, final=True)
+        with self.assertRaises(uploads.ChunkRejected):
+            self._append(1, b"late")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from api import tasks
+from api.models import Interview
+
+
+class ResumeFromWebhookTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="webhook", password="pw")
+        self.interview = Interview.objects.create(
+            user=user,
+            status=Interview.Status.PROCESSING,
+            twelvelabs_asset_id="asset-1",
+            twelvelabs_indexed_asset_id="indexed-1",
+        )
+        patcher = mock.patch.object(tasks, "_pipeline")
+        self.pipeline = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ready_event_claims_the_checkpoint_once(self):
+        self.assertTrue(tasks.resume_from_webhook(resource_id="asset-1", status="ready"))
+        self.assertTrue(tasks.resume_from_webhook(resource_id="asset-1", status="ready"))
+
+        self.interview.refresh_from_db()
+        self.assertIsNotNone(self.interview.twelvelabs_asset_ready_at)
+        self.pipeline.assert_called_once_with(
+            str(self.interview.id), start=tasks.PIPELINE_STAGES.index(tasks.interview_index_asset)
+        )
+        self.pipeline.return_value.apply_async.assert_called_once_with()
+
+    def test_poller_claim_wins_over_a_late_webhook(self):
+        self.assertTrue(tasks._claim_ready(str(self.interview.id), "twelvelabs_indexed_ready_at"))
+        self.assertTrue(tasks.resume_from_webhook(resource_id="indexed-1", status="ready"))
+        self.pipeline.assert_not_called()
+
+    def test_failed_event_marks_the_interview_failed(self):
+        self.assertTrue(tasks.resume_from_webhook(resource_id="indexed-1", status="failed"))
+
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.status, Interview.Status.FAILED)
+        self.assertIn("indexed-1", self.interview.ai_feedback["error"])
+        self.pipeline.assert_not_called()
+
+    def test_unknown_or_finished_interviews_are_not_matched(self):
+        self.assertFalse(tasks.resume_from_webhook(resource_id="other", status="ready"))
+
+        Interview.objects.filter(id=self.interview.id).update(status=Interview.Status.COMPLETE)
+        self.assertFalse(tasks.resume_from_webhook(resource_id="asset-1", status="ready"))
+        self.pipeline.assert_not_called()
@@ -1,7 +1,16 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from api.views import InterviewViewSet, JobViewSet, PersonalityProfileViewSet, dev_login, health, login, register
+from api.views import (
+    InterviewViewSet,
+    JobViewSet,
+    PersonalityProfileViewSet,
+    dev_login,
+    health,
+    login,
+    register,
+    twelvelabs_webhook,
+)
 
 router = DefaultRouter()
 router.register(r"jobs", JobViewSet, basename="job")
@@ -13,6 +22,7 @@ urlpatterns = [
     path("auth/register/", register),
     path("auth/login/", login),
     path("auth/dev-login/", dev_login),
+    path("webhooks/twelvelabs/", twelvelabs_webhook),
     path("", include(router.urls)),
 ]
 
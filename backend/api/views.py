@@ -1,30 +1,69 @@
 from __future__ import annotations
 
+import json
 import uuid
-from collections import Counter
 import random
 from django.contrib.auth import authenticate, get_user_model
 from django.conf import settings
 from django.db import transaction
-from django.core.files.base import ContentFile
+from django.utils import timezone
 from django.core.files.storage import default_storage
 from rest_framework import permissions, status, viewsets
 from rest_framework.authtoken.models import Token
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import action, api_view, authentication_classes, permission_classes
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
-from api.models import Interview, InterviewQuestion, Job, PersonalityProfile
+from api.models import (
+    Interview,
+    Job,
+    JobImport,
+    PersonalityProfile,
+    RecordingStream,
+    UploadSession,
+    UserInterviewStats,
+)
 from api.serializers import (
+    BulkJobImportSerializer,
     CreateInterviewSerializer,
     InterviewSerializer,
+    JobImportSerializer,
     JobSerializer,
     PersonalityProfileSerializer,
     UserSerializer,
 )
-from api.services.ai import generate_behavioral_questions
-from api.services.job_ingest import fetch_job_description_text
-from api.services.storage import presign_put_object
-from api.tasks import process_interview
+from api.services.stats import rebuild_user_stats, record_interview_created, record_interview_deleted, summarize
+from api.services.status_events import publish_status, wait_for_status_change
+from api.services.storage import (
+    MultipartMismatch,
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_multipart_upload,
+    presign_put_object,
+    s3_configured,
+    sha256_object,
+)
+from api.services.uploads import (
+    ChunkRejected,
+    RecordingUploadHandler,
+    append_segment,
+    assemble_session,
+    describe_session,
+    describe_stream,
+    discard_session,
+    discard_stream,
+    start_session,
+    start_stream,
+    write_chunk,
+)
+from api.services.twelvelabs import verify_webhook_signature
+from api.tasks import (
+    generate_interview_questions,
+    import_jobs,
+    process_interview,
+    reanalyze_interview,
+    resume_from_webhook,
+)
 
 User = get_user_model()
 
@@ -79,15 +118,66 @@ def dev_login(request):
     return Response({"token": token.key, "user": UserSerializer(user).data})
 
 
+@api_view(["POST"])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def twelvelabs_webhook(request):
+    """
+    Optional TwelveLabs webhook receiver: finishes a pending asset/indexing wait as soon as
+    TwelveLabs reports it, instead of at the next scheduled poll. Disabled without a secret.
+    """
+    secret = settings.TWELVELABS_WEBHOOK_SECRET
+    if not secret:
+        return Response({"detail": "Webhook not configured."}, status=status.HTTP_404_NOT_FOUND)
+
+    body = request.body
+    if not verify_webhook_signature(body=body, header=request.headers.get("TL-Signature", ""), secret=secret):
+        return Response({"detail": "Invalid signature."}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        event = json.loads(body or b"{}")
+    except ValueError:
+        return Response({"detail": "Invalid JSON."}, status=status.HTTP_400_BAD_REQUEST)
+
+    data = event.get("data") or {}
+    resource_id = str(data.get("id") or "")
+    event_status = str(data.get("status") or event.get("type", "").rsplit(".", 1)[-1]).lower()
+    matched = bool(resource_id) and resume_from_webhook(resource_id=resource_id, status=event_status)
+    return Response({"received": True, "matched": matched})
+
+
 class JobViewSet(viewsets.ModelViewSet):
     serializer_class = JobSerializer
 
     def get_queryset(self):
-        return Job.objects.filter(user=self.request.user).order_by("-created_at")
+        return Job.objects.filter(user=self.request.user).select_related("page").order_by("-created_at")
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=["POST"])
+    def bulk_import(self, request):
+        """
+        Queue a scrape of many posting URLs ({"urls": [...]}). Returns 202 with an import id;
+        poll imports/<id>/ for per-URL results.
+        """
+        payload = BulkJobImportSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        urls = list(dict.fromkeys(payload.validated_data["urls"]))  # drop exact repeats, keep order
+
+        job_import = JobImport.objects.create(user=request.user, urls=urls)
+        if settings.CELERY_TASK_ALWAYS_EAGER:
+            import_jobs(str(job_import.id))
+            job_import.refresh_from_db()
+        else:
+            import_jobs.delay(str(job_import.id))
+        return Response(JobImportSerializer(job_import).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["GET"], url_path=r"imports/(?P<import_id>[0-9a-f-]+)")
+    def import_status(self, request, import_id=None):
+        job_import = get_object_or_404(JobImport, id=import_id, user=request.user)
+        return Response(JobImportSerializer(job_import).data)
+
 
 class PersonalityProfileViewSet(viewsets.ModelViewSet):
     serializer_class = PersonalityProfileSerializer
@@ -103,7 +193,11 @@ class InterviewViewSet(viewsets.ModelViewSet):
     serializer_class = InterviewSerializer
 
     def get_queryset(self):
-        return Interview.objects.filter(user=self.request.user).select_related("job").prefetch_related("questions")
+        return (
+            Interview.objects.filter(user=self.request.user)
+            .select_related("job", "job__page")
+            .prefetch_related("questions")
+        )
 
     def create(self, request, *args, **kwargs):
         payload = CreateInterviewSerializer(data=request.data)
@@ -116,41 +210,35 @@ class InterviewViewSet(viewsets.ModelViewSet):
         with transaction.atomic():
             job = None
             if job_url:
-                description = ""
-                try:
-                    description = fetch_job_description_text(url=job_url)
-                except Exception:
-                    description = ""
                 job = Job.objects.create(
                     user=request.user,
                     url=job_url,
                     title=title or "",
                     company=company or "",
-                    description=description,
                 )
 
-            interview = Interview.objects.create(user=request.user, job=job, status=Interview.Status.CREATED)
+            interview = Interview.objects.create(user=request.user, job=job, status=Interview.Status.GENERATING)
+            record_interview_created(user_id=request.user.id)
 
-            generated = generate_behavioral_questions(
-                job_url=job_url,
-                company=company,
-                title=title,
-                job_description=(job.description if job else None),
-            )
-            interview.generated_questions = generated.questions
-            interview.save(update_fields=["generated_questions", "updated_at"])
-            for idx, q in enumerate(generated.questions):
-                InterviewQuestion.objects.create(
-                    interview=interview,
-                    order=idx,
-                    prompt=q.get("prompt", ""),
-                    competency=q.get("competency", ""),
-                )
-            interview.status = Interview.Status.QUESTIONS_READY
-            interview.save(update_fields=["status", "updated_at"])
+        # Scraping + question generation can take over a minute; do it in the worker and
+        # let the client follow progress via the interview/status endpoints.
+        if settings.CELERY_TASK_ALWAYS_EAGER:
+            generate_interview_questions(str(interview.id))
+            interview.refresh_from_db()
+        else:
+            generate_interview_questions.delay(str(interview.id))
 
         return Response(InterviewSerializer(interview).data, status=status.HTTP_201_CREATED)
 
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            record_interview_deleted(interview=instance)
+            for session in instance.upload_sessions.all():
+                discard_session(session)
+            for stream in instance.recording_streams.all():
+                discard_stream(stream)
+            instance.delete()
+
     @action(detail=True, methods=["POST"])
     def presign_upload(self, request, pk=None):
         interview: Interview = self.get_object()
@@ -167,6 +255,7 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 {
                     "mode": "local",
                     "upload_url": f"/api/interviews/{interview.id}/upload_local/",
+                    "resumable_url": f"/api/interviews/{interview.id}/uploads/",
                 }
             )
 
@@ -174,6 +263,7 @@ class InterviewViewSet(viewsets.ModelViewSet):
         interview.video_mime_type = content_type
         interview.status = Interview.Status.CREATED
         interview.save(update_fields=["video_object_key", "video_mime_type", "status", "updated_at"])
+        publish_status(interview)
 
         return Response({"mode": "s3", "object_key": presigned.object_key, "url": presigned.url, "headers": presigned.headers})
 
@@ -182,26 +272,199 @@ class InterviewViewSet(viewsets.ModelViewSet):
         """
         Dev fallback: accept multipart upload and store in MEDIA_ROOT via Django's storage.
         Frontend should call this only when presign_upload returns mode=local.
+        The body is streamed to a temp file in fixed-size chunks (size-limited, hashed and
+        sniffed as it arrives) and then moved into storage, so it is never held in memory.
         """
+        handler = RecordingUploadHandler(request._request)
+        request._request.upload_handlers = [handler]
+
         interview: Interview = self.get_object()
         file = request.FILES.get("file")
+        if handler.exceeded:
+            return Response(
+                {"detail": f"Recording exceeds the {settings.INTERVIEW_UPLOAD_MAX_BYTES} byte limit."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
         if not file:
             return Response({"detail": "Missing multipart file field 'file'."}, status=status.HTTP_400_BAD_REQUEST)
         if getattr(file, "size", 0) <= 0:
             return Response({"detail": "Uploaded file is empty."}, status=status.HTTP_400_BAD_REQUEST)
+        content_type = getattr(file, "sniffed_type", None)
+        if not content_type:
+            return Response(
+                {"detail": "Unsupported recording format; expected WebM or MP4."},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
 
-        content_type = getattr(file, "content_type", "") or "application/octet-stream"
         ext = "webm" if "webm" in content_type else "mp4"
         object_key = f"local/interviews/{interview.user_id}/{interview.id}/{uuid.uuid4()}.{ext}"
-        saved_path = default_storage.save(object_key, ContentFile(file.read()))
+        saved_path = default_storage.save(object_key, file)
+        return self._accept_recording(
+            request, interview, saved_path=saved_path, content_type=content_type, size=file.size, sha256=file.sha256
+        )
 
+    @action(detail=True, methods=["POST"], url_path="uploads")
+    def start_upload(self, request, pk=None):
+        """
+        Resumable upload, step 1: declare the recording size and get an upload id.
+        Chunks are then PUT to uploads/<upload_id>/chunks/<index>/ in any order (and
+        re-sent freely), progress is read from uploads/<upload_id>/, and
+        uploads/<upload_id>/finalize/ assembles the recording and queues processing.
+        """
+        interview: Interview = self.get_object()
+        try:
+            session = start_session(
+                interview,
+                total_size=int(request.data.get("total_size") or 0),
+                chunk_size=int(request.data.get("chunk_size") or 0) or None,
+            )
+        except (TypeError, ValueError) as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(describe_session(session), status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["GET"], url_path=r"uploads/(?P<upload_id>[0-9a-f-]+)")
+    def upload_progress(self, request, pk=None, upload_id=None):
+        session = self._upload_session(upload_id)
+        return Response(describe_session(session))
+
+    @action(detail=True, methods=["PUT"], url_path=r"uploads/(?P<upload_id>[0-9a-f-]+)/chunks/(?P<index>\d+)")
+    def upload_chunk(self, request, pk=None, upload_id=None, index=None):
+        """Store one chunk; the raw request body is the chunk bytes (application/octet-stream)."""
+        session = self._upload_session(upload_id)
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0) or None
+            session = write_chunk(session, int(index), request._request, content_length=content_length)
+        except ChunkRejected as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(describe_session(session))
+
+    @action(detail=True, methods=["POST"], url_path=r"uploads/(?P<upload_id>[0-9a-f-]+)/finalize")
+    def finalize_upload(self, request, pk=None, upload_id=None):
+        session = self._upload_session(upload_id)
+        # Claim the session so a double-clicked or retried finalize assembles it only once.
+        claimed = UploadSession.objects.filter(id=session.id, status=UploadSession.Status.OPEN).update(
+            status=UploadSession.Status.COMPLETE
+        )
+        if not claimed:
+            return Response({"detail": "Upload session is already finalized."}, status=status.HTTP_409_CONFLICT)
+        try:
+            recording = assemble_session(session)
+        except ChunkRejected as exc:
+            self._reopen_upload(session)
+            return Response({"detail": str(exc), **describe_session(session)}, status=status.HTTP_400_BAD_REQUEST)
+        except BaseException:
+            # Storage/read errors are retryable: don't leave the session stuck as finalized.
+            self._reopen_upload(session)
+            raise
+
+        interview = session.interview
+        try:
+            if not recording.content_type:
+                discard_session(session)
+                return Response(
+                    {"detail": "Unsupported recording format; expected WebM or MP4."},
+                    status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                )
+            ext = "webm" if "webm" in recording.content_type else "mp4"
+            object_key = f"local/interviews/{interview.user_id}/{interview.id}/{uuid.uuid4()}.{ext}"
+            saved_path = default_storage.save(object_key, recording.file)
+        except BaseException:
+            self._reopen_upload(session)
+            raise
+        finally:
+            recording.file.close()
+
+        discard_session(session)
+        return self._accept_recording(
+            request,
+            interview,
+            saved_path=saved_path,
+            content_type=recording.content_type,
+            size=recording.size,
+            sha256=recording.sha256,
+        )
+
+    @action(detail=True, methods=["POST"], url_path="live")
+    def start_live_upload(self, request, pk=None):
+        """
+        Progressive upload while recording: open a stream, then PUT each MediaRecorder
+        segment to live/<stream_id>/segments/<index>/ as it is produced (add ?final=1 on the
+        last one). The recording is complete when recording stops, so live/<stream_id>/submit/
+        only has to queue processing.
+        """
+        interview: Interview = self.get_object()
+        stream = start_stream(interview, content_type=(request.data.get("content_type") or "video/webm").strip())
+        return Response(describe_stream(stream), status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["GET"], url_path=r"live/(?P<stream_id>[0-9a-f-]+)")
+    def live_upload_progress(self, request, pk=None, stream_id=None):
+        return Response(describe_stream(self._recording_stream(stream_id)))
+
+    @action(detail=True, methods=["PUT"], url_path=r"live/(?P<stream_id>[0-9a-f-]+)/segments/(?P<index>\d+)")
+    def live_segment(self, request, pk=None, stream_id=None, index=None):
+        """Append one segment; the raw request body is the segment bytes."""
+        stream = self._recording_stream(stream_id)
+        final = request.query_params.get("final") in {"1", "true"}
+        try:
+            stream = append_segment(stream, int(index), request._request, final=final)
+        except ChunkRejected as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(describe_stream(stream))
+
+    @action(detail=True, methods=["POST"], url_path=r"live/(?P<stream_id>[0-9a-f-]+)/submit")
+    def submit_live_upload(self, request, pk=None, stream_id=None):
+        stream = self._recording_stream(stream_id)
+        if stream.status != RecordingStream.Status.COMPLETE:
+            return Response(
+                {"detail": "Recording is still uploading.", **describe_stream(stream)},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if not stream.mime_type or stream.size_bytes <= 0:
+            discard_stream(stream)
+            return Response(
+                {"detail": "Unsupported recording format; expected WebM or MP4."},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        interview = stream.interview
+        discard_stream(stream, keep_object=True)
+        return self._accept_recording(
+            request,
+            interview,
+            saved_path=stream.object_key,
+            content_type=stream.mime_type,
+            size=stream.size_bytes,
+            sha256=stream.sha256,
+        )
+
+    def _recording_stream(self, stream_id) -> RecordingStream:
+        interview: Interview = self.get_object()
+        return get_object_or_404(RecordingStream, id=stream_id, interview=interview)
+
+    def _upload_session(self, upload_id) -> UploadSession:
+        interview: Interview = self.get_object()
+        return get_object_or_404(UploadSession, id=upload_id, interview=interview)
+
+    def _reopen_upload(self, session: UploadSession) -> None:
+        """Undo finalize's claim so the client can retry it."""
+        UploadSession.objects.filter(id=session.id).update(status=UploadSession.Status.OPEN)
+
+    def _accept_recording(self, request, interview: Interview, *, saved_path, content_type, size, sha256):
         interview.video_object_key = saved_path
         interview.video_mime_type = content_type
-        interview.video_size_bytes = getattr(file, "size", None)
+        interview.video_size_bytes = size
+        interview.video_sha256 = sha256
         interview.status = Interview.Status.UPLOADED
         interview.save(
-            update_fields=["video_object_key", "video_mime_type", "video_size_bytes", "status", "updated_at"]
+            update_fields=[
+                "video_object_key",
+                "video_mime_type",
+                "video_size_bytes",
+                "video_sha256",
+                "status",
+                "updated_at",
+            ]
         )
+        publish_status(interview)
         if settings.CELERY_TASK_ALWAYS_EAGER:
             try:
                 process_interview(str(interview.id))
@@ -209,6 +472,7 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 interview.status = Interview.Status.FAILED
                 interview.ai_feedback = {"error": str(exc)}
                 interview.save(update_fields=["status", "ai_feedback", "updated_at"])
+                publish_status(interview)
                 return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         else:
             process_interview.delay(str(interview.id))
@@ -233,8 +497,94 @@ class InterviewViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Upload video first."}, status=status.HTTP_400_BAD_REQUEST)
 
         interview.video_size_bytes = request.data.get("video_size_bytes") or interview.video_size_bytes
+        try:
+            interview.video_sha256 = sha256_object(interview.video_object_key)
+        except Exception:  # noqa: BLE001 - dedupe is an optimization; process without it
+            interview.video_sha256 = ""
+        return self._queue_uploaded(interview)
+
+    @action(detail=True, methods=["POST"])
+    def presign_multipart(self, request, pk=None):
+        """
+        Large-recording variant of presign_upload: starts an S3 multipart upload and returns
+        one presigned PUT URL per part. The browser uploads parts in parallel, then calls
+        complete_multipart with each part's ETag (or abort_multipart to give up).
+        """
+        interview: Interview = self.get_object()
+
+        content_type = (request.data.get("content_type") or "video/webm").strip()
+        ext = "webm" if "webm" in content_type else "mp4"
+        object_key = f"interviews/{interview.user_id}/{interview.id}/{uuid.uuid4()}.{ext}"
+        try:
+            total_size = int(request.data.get("video_size_bytes") or 0)
+        except (TypeError, ValueError):
+            total_size = 0
+        if total_size <= 0:
+            return Response({"detail": "video_size_bytes is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if total_size > settings.INTERVIEW_UPLOAD_MAX_BYTES:
+            return Response(
+                {"detail": f"Recording exceeds the {settings.INTERVIEW_UPLOAD_MAX_BYTES} byte limit."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if not s3_configured():
+            return Response({"detail": "S3 is not configured."}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = create_multipart_upload(
+            object_key=object_key, content_type=content_type, total_size=total_size, expires_in_seconds=3600
+        )
+        interview.video_object_key = upload.object_key
+        interview.video_mime_type = content_type
+        interview.video_size_bytes = total_size
+        interview.status = Interview.Status.CREATED
+        interview.save(update_fields=["video_object_key", "video_mime_type", "video_size_bytes", "status", "updated_at"])
+        publish_status(interview)
+
+        return Response(
+            {
+                "mode": "s3_multipart",
+                "object_key": upload.object_key,
+                "upload_id": upload.upload_id,
+                "part_size": upload.part_size,
+                "parts": upload.parts,
+            }
+        )
+
+    @action(detail=True, methods=["POST"])
+    def complete_multipart(self, request, pk=None):
+        interview: Interview = self.get_object()
+        upload_id = request.data.get("upload_id") or ""
+        if not interview.video_object_key or not upload_id:
+            return Response({"detail": "Start a multipart upload first."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            _, size = complete_multipart_upload(
+                object_key=interview.video_object_key,
+                upload_id=upload_id,
+                parts=request.data.get("parts"),
+                total_size=interview.video_size_bytes,
+            )
+        except MultipartMismatch as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        interview.video_size_bytes = size
+        try:
+            interview.video_sha256 = sha256_object(interview.video_object_key)
+        except Exception:  # noqa: BLE001 - dedupe is an optimization; process without it
+            interview.video_sha256 = ""
+        return self._queue_uploaded(interview)
+
+    @action(detail=True, methods=["POST"])
+    def abort_multipart(self, request, pk=None):
+        interview: Interview = self.get_object()
+        upload_id = request.data.get("upload_id") or ""
+        if not interview.video_object_key or not upload_id:
+            return Response({"detail": "Missing upload_id."}, status=status.HTTP_400_BAD_REQUEST)
+        abort_multipart_upload(object_key=interview.video_object_key, upload_id=upload_id)
+        return Response({"aborted": True})
+
+    def _queue_uploaded(self, interview: Interview):
         interview.status = Interview.Status.UPLOADED
-        interview.save(update_fields=["video_size_bytes", "status", "updated_at"])
+        interview.save(update_fields=["video_size_bytes", "video_sha256", "status", "updated_at"])
+        publish_status(interview)
 
         if settings.CELERY_TASK_ALWAYS_EAGER:
             process_interview(str(interview.id))
@@ -242,39 +592,75 @@ class InterviewViewSet(viewsets.ModelViewSet):
             process_interview.delay(str(interview.id))
         return Response({"queued": True, "interview_id": str(interview.id)})
 
+    @action(detail=True, methods=["POST"])
+    def reanalyze(self, request, pk=None):
+        """
+        Re-run the TwelveLabs analysis on the already indexed recording, optionally focused on
+        one question (`question_id`) or with a custom `prompt`, then rebuild the feedback.
+        """
+        interview: Interview = self.get_object()
+        if not interview.twelvelabs_video_id:
+            return Response(
+                {"detail": "This recording hasn't been analyzed yet; submit it first."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        prompt = (request.data.get("prompt") or "").strip() or None
+        question_id = request.data.get("question_id") or None
+        if question_id:
+            question_id = str(get_object_or_404(interview.questions.all(), id=question_id).id)
+
+        # Claim the interview before enqueueing: the client sees PROCESSING on its next read
+        # (so it starts long-polling) and a second click gets 409 instead of a second run.
+        with transaction.atomic():
+            locked = Interview.objects.select_for_update().get(id=interview.id)
+            previous_status = locked.status
+            claimed = (
+                Interview.objects.filter(id=locked.id)
+                .exclude(status=Interview.Status.PROCESSING)
+                .update(status=Interview.Status.PROCESSING, updated_at=timezone.now())
+            )
+            if not claimed:
+                return Response({"detail": "Interview is already processing."}, status=status.HTTP_409_CONFLICT)
+            locked.refresh_from_db(fields=["status", "updated_at"])
+            publish_status(locked)
+
+        try:
+            if settings.CELERY_TASK_ALWAYS_EAGER:
+                reanalyze_interview(str(interview.id), prompt=prompt, question_id=question_id)
+            else:
+                reanalyze_interview.delay(str(interview.id), prompt=prompt, question_id=question_id)
+        except Exception:
+            Interview.objects.filter(id=interview.id, status=Interview.Status.PROCESSING).update(
+                status=previous_status, updated_at=timezone.now()
+            )
+            raise
+        return Response({"queued": True, "interview_id": str(interview.id), "status": Interview.Status.PROCESSING})
+
+    @action(detail=True, methods=["GET"], url_path="status")
+    def status_stream(self, request, pk=None):
+        """
+        Long-poll for status transitions. Returns only {id, status, updated_at}.
+        Pass `since=<updated_at>` from the previous response; the call blocks (up to `wait`
+        seconds) until the interview changes, then the client fetches the full detail once.
+        """
+        interview = get_object_or_404(Interview.objects.filter(user=request.user).only("id"), pk=pk)
+        since = request.query_params.get("since") or None
+        max_wait = settings.INTERVIEW_STATUS_LONGPOLL_SECONDS
+        try:
+            wait = min(max(float(request.query_params.get("wait", max_wait)), 0.0), max_wait)
+        except ValueError:
+            wait = max_wait
+
+        current = wait_for_status_change(interview.id, since=since, timeout_seconds=wait)
+        if current is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(current.as_dict())
+
     @action(detail=False, methods=["GET"])
     def statistics(self, request):
         """Get user interview statistics: total interviews, average duration, most practiced competency."""
-        user = request.user
-        interviews = Interview.objects.filter(user=user)
-        
-        total_interviews = interviews.count()
-        
-        # Calculate average duration (from video duration in milliseconds)
-        durations = []
-        for interview in interviews:
-            if interview.ai_feedback and "duration_ms" in interview.ai_feedback:
-                durations.append(interview.ai_feedback["duration_ms"])
-        
-        average_duration_ms = sum(durations) / len(durations) if durations else 0
-        average_duration_secs = int(average_duration_ms / 1000)
-        
-        # Get most practiced competency
-        competencies = []
-        for interview in interviews:
-            questions = InterviewQuestion.objects.filter(interview=interview)
-            for question in questions:
-                if question.competency:
-                    competencies.append(question.competency)
-        
-        most_practiced = None
-        if competencies:
-            competency_counts = Counter(competencies)
-            most_practiced = competency_counts.most_common(1)[0][0]
-        
-        return Response({
-            "total_interviews": total_interviews,
-            "average_duration_seconds": average_duration_secs,
-            "most_practiced_competency": most_practiced,
-            "total_questions_answered": len(competencies),
-        })
+        stats = UserInterviewStats.objects.filter(user=request.user).first()
+        if stats is None:
+            # First read for a user whose interviews predate the rollup table.
+            stats = rebuild_user_stats(user_id=request.user.id)
+        return Response(summarize(stats))
@@ -93,6 +93,11 @@ STATIC_URL = "static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = str(BASE_DIR / "media")
 
+# Largest interview recording accepted by the upload endpoints (enforced while streaming).
+INTERVIEW_UPLOAD_MAX_BYTES = int(os.getenv("INTERVIEW_UPLOAD_MAX_BYTES", str(1024 * 1024 * 1024)))
+# Default chunk size for resumable uploads; clients may ask for anything up to this size.
+INTERVIEW_UPLOAD_CHUNK_BYTES = int(os.getenv("INTERVIEW_UPLOAD_CHUNK_BYTES", str(8 * 1024 * 1024)))
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # CORS / Frontend
@@ -113,6 +118,13 @@ REST_FRAMEWORK = {
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/0")
 CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "0") == "1"
+# Inline mode: surface pipeline-stage errors to the caller (upload_local reports them).
+CELERY_TASK_EAGER_PROPAGATES = CELERY_TASK_ALWAYS_EAGER
+
+# Interview status pub/sub (long-poll on /interviews/<id>/status/)
+REDIS_URL = os.getenv("REDIS_URL", CELERY_BROKER_URL)
+INTERVIEW_STATUS_LONGPOLL_SECONDS = float(os.getenv("INTERVIEW_STATUS_LONGPOLL_SECONDS", "25"))
+INTERVIEW_STATUS_DB_POLL_SECONDS = float(os.getenv("INTERVIEW_STATUS_DB_POLL_SECONDS", "1"))
 
 # External integrations (wired via env)
 S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL", "")
@@ -120,9 +132,31 @@ S3_REGION_NAME = os.getenv("S3_REGION_NAME", "us-east-1")
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "")
 S3_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY_ID", "")
 S3_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY", "")
+# Part size for multipart recording uploads (grown automatically past S3's 10,000-part limit).
+S3_MULTIPART_PART_BYTES = int(os.getenv("S3_MULTIPART_PART_BYTES", str(8 * 1024 * 1024)))
 
 TWELVELABS_API_KEY = os.getenv("TL_API_KEY", "")
 TWELVELABS_INDEX_ID = os.getenv("TL_INDEX_ID", "")
+# Lifetime of presigned GET URLs handed to TwelveLabs for URL-based asset creation.
+TWELVELABS_ASSET_URL_EXPIRES_SECONDS = int(os.getenv("TL_ASSET_URL_EXPIRES_SECONDS", "3600"))
+# Overall budget for asset/indexing readiness polls before the interview is marked failed.
+TWELVELABS_WAIT_DEADLINE_SECONDS = float(os.getenv("TL_WAIT_DEADLINE_SECONDS", "1800"))
+# webm -> mp4 transcode before upload: "auto" (remux when codecs allow, else capped fast encode),
+# or force "remux" / "fast" / "full".
+TWELVELABS_TRANSCODE_PROFILE = os.getenv("TL_TRANSCODE_PROFILE", "auto").lower().strip()
+TWELVELABS_TRANSCODE_MAX_HEIGHT = int(os.getenv("TL_TRANSCODE_MAX_HEIGHT", "720"))
+TWELVELABS_TRANSCODE_MAX_FPS = int(os.getenv("TL_TRANSCODE_MAX_FPS", "30"))
+TWELVELABS_TRANSCODE_MAX_BITRATE = os.getenv("TL_TRANSCODE_MAX_BITRATE", "2500k")
+# Pipe recordings through ffmpeg (fragmented MP4, no temp-file copies); output spools to disk past this size.
+TWELVELABS_TRANSCODE_STREAMING = os.getenv("TL_TRANSCODE_STREAMING", "1") == "1"
+TWELVELABS_TRANSCODE_SPOOL_BYTES = int(os.getenv("TL_TRANSCODE_SPOOL_BYTES", str(32 * 1024 * 1024)))
+# Hard cap on transcoded output (TwelveLabs' direct upload limit); ffmpeg is stopped past it.
+TWELVELABS_TRANSCODE_MAX_OUTPUT_BYTES = int(os.getenv("TL_TRANSCODE_MAX_OUTPUT_BYTES", str(2 * 1024**3)))
+# Content-addressed analysis cache (identical recording + prompt -> reuse TwelveLabs result).
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+ANALYSIS_CACHE_TTL_DAYS = int(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "30"))
+# Optional: enables POST /api/webhooks/twelvelabs/ to finish readiness waits early.
+TWELVELABS_WEBHOOK_SECRET = os.getenv("TL_WEBHOOK_SECRET", "")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
@@ -130,3 +164,69 @@ GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 # LLM provider toggle: "openai" (default stub) or "gemini"
 # If a Gemini key is present, default to Gemini unless explicitly overridden.
 AI_PROVIDER = os.getenv("AI_PROVIDER", ("gemini" if GEMINI_API_KEY else "openai")).lower().strip()
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+# Provider router: LLM_PROVIDERS in preference order ("gemini", "openai", "fake"), e.g. "gemini,openai".
+# A provider is skipped while its circuit is open (LLM_BREAKER_FAILURES consecutive failures, then
+# one probe per LLM_BREAKER_COOLDOWN_SECONDS). The next provider is started alongside a slow one
+# once it exceeds its LLM_HEDGE_PERCENTILE latency (LLM_HEDGE_DEFAULT_DELAY_SECONDS until
+# LLM_HEDGE_MIN_SAMPLES calls are seen). Each call site gets a deadline from LLM_DEADLINES.
+LLM_PROVIDERS = [name.strip().lower() for name in os.getenv("LLM_PROVIDERS", AI_PROVIDER).split(",") if name.strip()]
+LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "60"))
+LLM_DEADLINES = {
+    site.strip(): float(seconds)
+    for site, _, seconds in (
+        item.partition("=")
+        for item in os.getenv("LLM_DEADLINES", "questions=30,job_fit=15,archetype=30,feedback=30,review=40").split(",")
+    )
+    if seconds.strip()
+}
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.9"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_SECONDS", "8"))
+LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "1"))
+LLM_ROUTER_MAX_WORKERS = int(os.getenv("LLM_ROUTER_MAX_WORKERS", "16"))
+# Offline "fake" provider behaviour (for local runs and exercising the router).
+LLM_FAKE_LATENCY_SECONDS = float(os.getenv("LLM_FAKE_LATENCY_SECONDS", "0"))
+LLM_FAKE_FAILURE_RATE = float(os.getenv("LLM_FAKE_FAILURE_RATE", "0"))
+
+# Scraped job pages are shared across users and revalidated (conditional GET) after this long.
+JOB_PAGE_FRESH_SECONDS = int(os.getenv("JOB_PAGE_FRESH_SECONDS", str(6 * 3600)))
+# Question bank: reuse validated LLM questions for similar jobs. The LLM is only called when the
+# weakest of the QUESTION_BANK_QUESTIONS best matches scores below QUESTION_BANK_MIN_SCORE (cosine, 0-1).
+QUESTION_BANK_ENABLED = os.getenv("QUESTION_BANK_ENABLED", "1") == "1"
+QUESTION_BANK_QUESTIONS = int(os.getenv("QUESTION_BANK_QUESTIONS", "6"))
+QUESTION_BANK_MIN_SCORE = float(os.getenv("QUESTION_BANK_MIN_SCORE", "0.35"))
+QUESTION_BANK_EXCERPT_CHARS = int(os.getenv("QUESTION_BANK_EXCERPT_CHARS", "4000"))
+# Bulk job import: scrape this many URLs at once overall, and at most this many per host.
+JOB_IMPORT_MAX_URLS = int(os.getenv("JOB_IMPORT_MAX_URLS", "500"))
+JOB_IMPORT_CONCURRENCY = int(os.getenv("JOB_IMPORT_CONCURRENCY", "8"))
+JOB_IMPORT_PER_HOST_CONCURRENCY = int(os.getenv("JOB_IMPORT_PER_HOST_CONCURRENCY", "2"))
+# Job page downloads are streamed and cut off at this many bytes.
+JOB_PAGE_MAX_BYTES = int(os.getenv("JOB_PAGE_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# Shared keep-alive HTTP pools (Gemini, job scraping) and S3 client pool; see api/services/clients.py.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+HTTP_RETRY_TOTAL = int(os.getenv("HTTP_RETRY_TOTAL", "2"))
+HTTP_RETRY_BACKOFF_SECONDS = float(os.getenv("HTTP_RETRY_BACKOFF_SECONDS", "0.5"))
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "20"))
+
+# LLM response cache: in-process LRU in front of Redis. Only the listed call sites opt in
+# (questions, job_fit, archetype, feedback, review); set LLM_CACHE_TTL_SECONDS=0 to disable.
+LLM_CACHE_FUNCTIONS = {
+    name.strip() for name in os.getenv("LLM_CACHE_FUNCTIONS", "questions,job_fit").split(",") if name.strip()
+}
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "512"))
+# Per-process LLM counters (cache hits, structured-output outcomes, router events and provider
+# health) are logged at INFO at most this often; 0 turns it off.
+LLM_STATS_LOG_SECONDS = int(os.getenv("LLM_STATS_LOG_SECONDS", "300"))
+
+# Post-analysis LLM calls (feedback / archetype / job fit) run concurrently within one shared deadline.
+LLM_FANOUT_MAX_WORKERS = int(os.getenv("LLM_FANOUT_MAX_WORKERS", "3"))
+LLM_FANOUT_TIMEOUT_SECONDS = float(os.getenv("LLM_FANOUT_TIMEOUT_SECONDS", "75"))
+# Ask for interview feedback and archetype in one structured LLM call instead of two
+# (compare with: manage.py benchmark_llm_review).
+LLM_COMBINED_REVIEW = os.getenv("LLM_COMBINED_REVIEW", "0") == "1"
@@ -16,13 +16,22 @@ import {
 } from "@/components/ui/card";
 import { Spinner } from "@/components/ui/spinner";
 import {
+  abortMultipart,
+  completeMultipart,
   devLogin,
   getInterview,
+  presignMultipart,
   presignUpload,
+  reanalyzeInterview,
   submitInterview,
+  waitInterviewStatus,
   type Interview,
 } from "@/lib/api";
 import {
+  LiveUploader,
+  MULTIPART_THRESHOLD_BYTES,
+  uploadPartsToPresignedUrls,
+  uploadResumable,
   uploadToLocalMultipartEndpoint,
   uploadToPresignedPutUrl,
 } from "@/lib/upload";
@@ -37,6 +46,8 @@ export default function InterviewPage() {
   const [error, setError] = React.useState<string | null>(null);
 
   const [blob, setBlob] = React.useState<Blob | null>(null);
+  // Uploads the current take while it is being recorded (see LiveUploader).
+  const liveRef = React.useRef<LiveUploader | null>(null);
   const [uploading, setUploading] = React.useState(false);
   const [queued, setQueued] = React.useState(false);
 
@@ -72,18 +83,72 @@ export default function InterviewPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [interviewId]);
 
+  const finished =
+    interview?.status === "complete" || interview?.status === "failed";
+  const generating = interview?.status === "generating";
+
   React.useEffect(() => {
-    if (!queued) return;
-    if (!interview) return;
-    if (interview.status === "complete" || interview.status === "failed")
-      return;
+    if (!queued && !generating) return;
+    if (!interview || finished) return;
 
-    const t = window.setInterval(() => {
-      refresh().catch(() => {});
-    }, 1500);
-    return () => window.clearInterval(t);
+    // Long-poll the lightweight status endpoint; only re-fetch the full
+    // interview when questions land or processing reaches a terminal state.
+    let cancelled = false;
+    let since = interview.updated_at ?? null;
+    (async () => {
+      while (!cancelled) {
+        try {
+          const next = await waitInterviewStatus(interviewId, since);
+          if (cancelled) return;
+          if (next.updated_at === since) continue;
+          since = next.updated_at;
+          if (
+            next.status === "complete" ||
+            next.status === "failed" ||
+            (generating && next.status !== "generating")
+          ) {
+            await refresh();
+            return;
+          }
+          setInterview((prev) =>
+            prev
+              ? { ...prev, status: next.status, updated_at: next.updated_at }
+              : prev,
+          );
+        } catch {
+          await new Promise((r) => window.setTimeout(r, 3000));
+        }
+      }
+    })();
+    return () => {
+      cancelled = true;
+    };
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [queued, interview?.status]);
+  }, [queued, interviewId, finished, generating]);
+
+  async function onReanalyze() {
+    setError(null);
+    try {
+      await reanalyzeInterview(interviewId);
+      setQueued(true);
+      await refresh();
+    } catch (e: any) {
+      setError(e?.message ?? "Re-analysis failed");
+    }
+  }
+
+  function onRecordingStart(mimeType: string) {
+    liveRef.current?.cancel();
+    const apiBase =
+      process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
+    liveRef.current = new LiveUploader(apiBase, interviewId, mimeType);
+  }
+
+  function onRecordingReady(recorded: Blob) {
+    setBlob(recorded);
+    // Send the tail now so the recording is complete server-side by the time Submit is pressed.
+    liveRef.current?.finish().catch(() => {});
+  }
 
   async function onUploadAndSubmit() {
     if (!blob) {
@@ -105,16 +170,48 @@ export default function InterviewPage() {
     setUploading(true);
     try {
       await ensureAuth();
+      const live = liveRef.current;
+      if (live) {
+        try {
+          await live.submit();
+          liveRef.current = null;
+          setQueued(true);
+          await refresh();
+          return;
+        } catch {
+          // Fall back to uploading the finished blob below.
+          liveRef.current = null;
+        }
+      }
       const contentType = blob.type || "video/webm";
       const presigned = await presignUpload(interviewId, contentType);
       const apiBase =
         process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
       if (presigned.mode === "local") {
-        await uploadToLocalMultipartEndpoint(
-          apiBase,
-          presigned.upload_url,
-          blob,
-        );
+        if (presigned.resumable_url) {
+          await uploadResumable(apiBase, presigned.resumable_url, blob);
+        } else {
+          await uploadToLocalMultipartEndpoint(
+            apiBase,
+            presigned.upload_url,
+            blob,
+          );
+        }
+        setQueued(true);
+        await refresh();
+      } else if (blob.size > MULTIPART_THRESHOLD_BYTES) {
+        const upload = await presignMultipart(interviewId, contentType, blob.size);
+        try {
+          const parts = await uploadPartsToPresignedUrls(
+            upload.parts,
+            upload.part_size,
+            blob,
+          );
+          await completeMultipart(interviewId, upload.upload_id, parts);
+        } catch (e) {
+          await abortMultipart(interviewId, upload.upload_id).catch(() => {});
+          throw e;
+        }
         setQueued(true);
         await refresh();
       } else {
@@ -241,6 +338,10 @@ export default function InterviewPage() {
                   );
                 })}
             </ol>
+          ) : generating ? (
+            <p className="mt-4 flex items-center gap-2 font-typewriter text-sm text-warm-gray">
+              <Spinner /> Writing questions for this role…
+            </p>
           ) : (
             <p className="mt-4 font-typewriter text-sm text-warm-gray">
               No questions yet.
@@ -249,9 +350,11 @@ export default function InterviewPage() {
         </div>
 
         <MediaRecorderPanel
-          onRecordingReady={setBlob}
+          onRecordingStart={onRecordingStart}
+          onData={(data) => liveRef.current?.push(data)}
+          onRecordingReady={onRecordingReady}
           onSubmit={onUploadAndSubmit}
-          submitDisabled={uploading || !blob}
+          submitDisabled={uploading || !blob || generating}
           submitting={uploading}
           submitLabel="Submit"
         />
@@ -319,6 +422,9 @@ export default function InterviewPage() {
                 {interview.transcript_text || "—"}
               </p>
             </details>
+            <Button variant="secondary" onClick={onReanalyze}>
+              Re-run analysis
+            </Button>
           </CardContent>
         </Card>
       ) : null}
@@ -8,6 +8,9 @@ import { Spinner } from "@/components/ui/spinner";
 
 type Props = {
   onRecordingReady: (blob: Blob) => void;
+  // Progressive upload hooks: called when recording starts and with every timeslice of data.
+  onRecordingStart?: (mimeType: string) => void;
+  onData?: (data: Blob) => void;
   maxDurationMs?: number;
   onSubmit?: () => void;
   submitLabel?: string;
@@ -42,6 +45,8 @@ function pickMimeType() {
 
 export function MediaRecorderPanel({
   onRecordingReady,
+  onRecordingStart,
+  onData,
   maxDurationMs = 60_000,
   onSubmit,
   submitLabel = "Submit recording",
@@ -109,7 +114,10 @@ export function MediaRecorderPanel({
     const recorder = new MediaRecorder(mediaStreamRef.current, options);
     recorderRef.current = recorder;
     recorder.ondataavailable = (evt) => {
-      if (evt.data && evt.data.size > 0) chunksRef.current.push(evt.data);
+      if (evt.data && evt.data.size > 0) {
+        chunksRef.current.push(evt.data);
+        onData?.(evt.data);
+      }
     };
     recorder.onstop = () => {
       const blob = new Blob(chunksRef.current, { type: recorder.mimeType || "video/webm" });
@@ -120,6 +128,7 @@ export function MediaRecorderPanel({
       });
       onRecordingReady(blob);
     };
+    onRecordingStart?.(recorder.mimeType || mimeType || "video/webm");
     recorder.start(250); // chunk every 250ms
     startAtRef.current = Date.now();
     setRemainingMs(maxDurationMs);
@@ -86,6 +86,22 @@ export async function getInterview(id: string) {
   return apiFetch<Interview>(`/api/interviews/${id}/`);
 }
 
+export type InterviewStatus = {
+  id: string;
+  status: string;
+  updated_at: string;
+};
+
+/**
+ * Long-poll for the next status transition. Resolves immediately if the
+ * interview changed since `since`, otherwise when it changes or the server
+ * wait elapses (same payload either way).
+ */
+export async function waitInterviewStatus(id: string, since?: string | null) {
+  const qs = since ? `?since=${encodeURIComponent(since)}` : "";
+  return apiFetch<InterviewStatus>(`/api/interviews/${id}/status/${qs}`);
+}
+
 export async function listInterviews() {
   return apiFetch<Interview[]>("/api/interviews/");
 }
@@ -98,7 +114,7 @@ export async function presignUpload(interviewId: string, contentType: string) {
         url: string;
         headers: Record<string, string>;
       }
-    | { mode: "local"; upload_url: string }
+    | { mode: "local"; upload_url: string; resumable_url?: string }
   >(`/api/interviews/${interviewId}/presign_upload/`, {
     method: "POST",
     body: JSON.stringify({ content_type: contentType }),
@@ -118,6 +134,68 @@ export async function submitInterview(
   );
 }
 
+export async function reanalyzeInterview(
+  interviewId: string,
+  opts: { questionId?: string; prompt?: string } = {},
+) {
+  return apiFetch<{ queued: boolean; interview_id: string }>(
+    `/api/interviews/${interviewId}/reanalyze/`,
+    {
+      method: "POST",
+      body: JSON.stringify({ question_id: opts.questionId, prompt: opts.prompt }),
+    },
+  );
+}
+
+export type MultipartUpload = {
+  mode: "s3_multipart";
+  object_key: string;
+  upload_id: string;
+  part_size: number;
+  parts: Array<{ part_number: number; url: string }>;
+};
+
+export async function presignMultipart(
+  interviewId: string,
+  contentType: string,
+  videoSizeBytes: number,
+) {
+  return apiFetch<MultipartUpload>(
+    `/api/interviews/${interviewId}/presign_multipart/`,
+    {
+      method: "POST",
+      body: JSON.stringify({
+        content_type: contentType,
+        video_size_bytes: videoSizeBytes,
+      }),
+    },
+  );
+}
+
+export async function completeMultipart(
+  interviewId: string,
+  uploadId: string,
+  parts: Array<{ part_number: number; etag: string }>,
+) {
+  return apiFetch<{ queued: boolean; interview_id: string }>(
+    `/api/interviews/${interviewId}/complete_multipart/`,
+    {
+      method: "POST",
+      body: JSON.stringify({ upload_id: uploadId, parts }),
+    },
+  );
+}
+
+export async function abortMultipart(interviewId: string, uploadId: string) {
+  return apiFetch<{ aborted: boolean }>(
+    `/api/interviews/${interviewId}/abort_multipart/`,
+    {
+      method: "POST",
+      body: JSON.stringify({ upload_id: uploadId }),
+    },
+  );
+}
+
 export async function getInterviewStatistics() {
   return apiFetch<{
     total_interviews: number;
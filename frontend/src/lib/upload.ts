@@ -31,3 +31,236 @@ export async function uploadToLocalMultipartEndpoint(apiBaseUrl: string, uploadP
   return data;
 }
 
+
+// Recordings above this size go to S3 as parallel multipart uploads instead of one PUT.
+export const MULTIPART_THRESHOLD_BYTES = 16 * 1024 * 1024;
+
+export async function uploadPartsToPresignedUrls(
+  parts: Array<{ part_number: number; url: string }>,
+  partSize: number,
+  blob: Blob,
+  opts: { concurrency?: number; maxRetries?: number } = {},
+) {
+  const concurrency = opts.concurrency ?? 4;
+  const maxRetries = opts.maxRetries ?? 3;
+  const queue = [...parts];
+  const etags: Array<{ part_number: number; etag: string }> = [];
+
+  async function uploadPart(part: { part_number: number; url: string }) {
+    const start = (part.part_number - 1) * partSize;
+    const body = blob.slice(start, Math.min(start + partSize, blob.size));
+    for (let attempt = 0; ; attempt++) {
+      try {
+        const res = await fetch(part.url, { method: "PUT", body });
+        if (!res.ok) throw new Error(`Upload failed (${res.status})`);
+        // Requires the bucket CORS rule to expose the ETag header.
+        const etag = res.headers.get("ETag");
+        if (!etag) throw new Error("Upload response is missing the part ETag.");
+        return etag;
+      } catch (e) {
+        if (attempt >= maxRetries) throw e;
+        await new Promise((r) => setTimeout(r, Math.min(1000 * 2 ** attempt, 10000)));
+      }
+    }
+  }
+
+  async function worker() {
+    for (let part = queue.shift(); part; part = queue.shift()) {
+      etags.push({ part_number: part.part_number, etag: await uploadPart(part) });
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(concurrency, parts.length) }, worker));
+  return etags.sort((a, b) => a.part_number - b.part_number);
+}
+
+type UploadSessionState = {
+  upload_id: string;
+  status: string;
+  total_size: number;
+  chunk_size: number;
+  total_chunks: number;
+  received_chunks: number[];
+  received_ranges: Array<[number, number]>;
+  missing_chunks: number[];
+};
+
+// Upload sessions already opened for a recording, so pressing submit again resumes
+// from the chunks the server has instead of starting over.
+const resumableSessions = new WeakMap<Blob, string>();
+
+async function resumableRequest<T>(url: string, init: RequestInit): Promise<T> {
+  const token = window.localStorage.getItem("token");
+  const headers = new Headers(init.headers);
+  if (token) headers.set("Authorization", `Token ${token}`);
+  const res = await fetch(url, { ...init, headers, cache: "no-store" });
+  const text = await res.text();
+  const data = text ? JSON.parse(text) : null;
+  if (!res.ok) {
+    const err = new Error(data?.detail || `Upload failed (${res.status})`);
+    (err as any).status = res.status;
+    throw err;
+  }
+  return data as T;
+}
+
+export async function uploadResumable(
+  apiBaseUrl: string,
+  sessionsPath: string,
+  blob: Blob,
+  opts: { onProgress?: (sentBytes: number, totalBytes: number) => void; maxRetries?: number } = {},
+) {
+  const base = `${apiBaseUrl}${sessionsPath}`;
+  const maxRetries = opts.maxRetries ?? 4;
+
+  let session: UploadSessionState | null = null;
+  const existing = resumableSessions.get(blob);
+  if (existing) {
+    try {
+      session = await resumableRequest<UploadSessionState>(`${base}${existing}/`, { method: "GET" });
+    } catch {
+      session = null;
+    }
+  }
+  if (!session || session.status !== "open") {
+    session = await resumableRequest<UploadSessionState>(base, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ total_size: blob.size }),
+    });
+    resumableSessions.set(blob, session.upload_id);
+  }
+
+  const { upload_id: uploadId, chunk_size: chunkSize } = session;
+  let sent = session.received_ranges.reduce((n, [start, end]) => n + (end - start), 0);
+  opts.onProgress?.(sent, blob.size);
+
+  for (const index of session.missing_chunks) {
+    const chunk = blob.slice(index * chunkSize, Math.min((index + 1) * chunkSize, blob.size));
+    for (let attempt = 0; ; attempt++) {
+      try {
+        await resumableRequest(`${base}${uploadId}/chunks/${index}/`, {
+          method: "PUT",
+          headers: { "Content-Type": "application/octet-stream" },
+          body: chunk,
+        });
+        break;
+      } catch (e: any) {
+        // 4xx means the chunk itself was rejected; retrying the same bytes won't help.
+        if (attempt >= maxRetries || (e?.status >= 400 && e?.status < 500)) throw e;
+        await new Promise((r) => setTimeout(r, Math.min(1000 * 2 ** attempt, 10000)));
+      }
+    }
+    sent += chunk.size;
+    opts.onProgress?.(sent, blob.size);
+  }
+
+  const result = await resumableRequest<any>(`${base}${uploadId}/finalize/`, { method: "POST" });
+  resumableSessions.delete(blob);
+  return result;
+}
+
+type LiveStreamState = {
+  stream_id: string;
+  status: string;
+  next_segment: number;
+  pending_segments: number[];
+  final_segment: number | null;
+  size_bytes: number;
+};
+
+/**
+ * Uploads a recording while it is being made. MediaRecorder data is batched into
+ * segments (every `flushMs` or `flushBytes`) and sent strictly one at a time, in order,
+ * so by the time recording stops only the last few hundred milliseconds remain to send.
+ */
+export class LiveUploader {
+  private base: string;
+  private streamId: Promise<string>;
+  private buffer: Blob[] = [];
+  private buffered = 0;
+  private nextIndex = 0;
+  private sending: Promise<void> = Promise.resolve();
+  private timer: ReturnType<typeof setInterval> | null = null;
+  private failed: unknown = null;
+  private finished: Promise<void> | null = null;
+
+  constructor(
+    apiBaseUrl: string,
+    interviewId: string,
+    contentType: string,
+    private opts: { flushMs?: number; flushBytes?: number; maxRetries?: number } = {},
+  ) {
+    this.base = `${apiBaseUrl}/api/interviews/${interviewId}/live/`;
+    this.streamId = resumableRequest<LiveStreamState>(this.base, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ content_type: contentType }),
+    }).then((s) => s.stream_id);
+    this.streamId.catch((e) => (this.failed = e));
+    this.timer = setInterval(() => this.flush(false), opts.flushMs ?? 2000);
+  }
+
+  push(data: Blob) {
+    if (!data.size) return;
+    this.buffer.push(data);
+    this.buffered += data.size;
+    if (this.buffered >= (this.opts.flushBytes ?? 512 * 1024)) this.flush(false);
+  }
+
+  private flush(final: boolean) {
+    if (!final && !this.buffered) return;
+    const segment = new Blob(this.buffer);
+    const index = this.nextIndex++;
+    this.buffer = [];
+    this.buffered = 0;
+    this.sending = this.sending.then(() => this.send(index, segment, final));
+    this.sending.catch((e) => (this.failed = e));
+  }
+
+  private async send(index: number, segment: Blob, final: boolean) {
+    const streamId = await this.streamId;
+    const maxRetries = this.opts.maxRetries ?? 4;
+    for (let attempt = 0; ; attempt++) {
+      try {
+        await resumableRequest(
+          `${this.base}${streamId}/segments/${index}/${final ? "?final=1" : ""}`,
+          {
+            method: "PUT",
+            headers: { "Content-Type": "application/octet-stream" },
+            body: segment,
+          },
+        );
+        return;
+      } catch (e: any) {
+        if (attempt >= maxRetries || (e?.status >= 400 && e?.status < 500)) throw e;
+        await new Promise((r) => setTimeout(r, Math.min(500 * 2 ** attempt, 5000)));
+      }
+    }
+  }
+
+  /** Send whatever is buffered as the final segment; resolves once the server has the whole recording. */
+  finish() {
+    if (!this.finished) {
+      if (this.timer) clearInterval(this.timer);
+      this.timer = null;
+      this.flush(true);
+      this.finished = this.sending.then(() => {
+        if (this.failed) throw this.failed;
+      });
+    }
+    return this.finished;
+  }
+
+  cancel() {
+    if (this.timer) clearInterval(this.timer);
+    this.timer = null;
+    this.buffer = [];
+  }
+
+  async submit() {
+    await this.finish();
+    const streamId = await this.streamId;
+    return resumableRequest<any>(`${this.base}${streamId}/submit/`, { method: "POST" });
+  }
+}